@@ -42,6 +42,8 @@ async def test_last_50_epochs():
     
     print(f"\nResults: {successful} successful, {len(failed)} failed")
     
+    await cache_db.close()
+    
     import os
     if os.path.exists("test_epochs.db"):
         os.remove("test_epochs.db")
@@ -94,6 +96,8 @@ async def test_different_heights(epoch_id, reference_height):
         except Exception as e:
             print(f"  ✗ Height {height}: {str(e)[:80]}")
     
+    await cache_db.close()
+    
     import os
     if os.path.exists("test_heights.db"):
         os.remove("test_heights.db")
@@ -181,6 +185,8 @@ async def test_edge_cases(epoch_id):
     except Exception as e:
         print(f"  ✗ Comparison failed: {str(e)}")
     
+    await cache_db.close()
+    
     import os
     if os.path.exists("test_edge_cases.db"):
         os.remove("test_edge_cases.db")
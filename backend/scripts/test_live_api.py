@@ -61,6 +61,8 @@ async def main():
     print("\n" + "=" * 60)
     print("All tests passed!")
     
+    await cache_db.close()
+    
     import os
     if os.path.exists("test_cache.db"):
         os.remove("test_cache.db")
@@ -4,10 +4,12 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from backend.client import GonkaClient
+from backend.service import VALOPER_PREFIX, build_validator_index, filter_active_validators, parse_validator
 
 
 async def test_address_conversion():
-    print("\n=== Address Conversion Test ===")
+    out = []
+    out.append("\n=== Address Conversion Test ===")
     
     test_addresses = [
         "gonka1qqyc9gsld2666kpunherra8rx2efwg4v8wafg3",
@@ -16,17 +18,18 @@ async def test_address_conversion():
     ]
     
     for address in test_addresses:
-        valoper = GonkaClient.convert_bech32_address(address, "gonkavaloper")
-        print(f"  {address}")
-        print(f"  -> {valoper}")
-        print()
+        valoper = GonkaClient.convert_bech32_address(address, VALOPER_PREFIX)
+        out.append(
+            f"  {address}\n"
+            f"  -> {valoper}\n"
+        )
+    
+    return out
 
 
-async def test_keybase_api():
-    print("\n=== Keybase API Test ===")
-    
-    base_urls = [os.getenv("GONKA_API_URL", "http://node2.gonka.ai:8000")]
-    client = GonkaClient(base_urls)
+async def test_keybase_api(client):
+    out = []
+    out.append("\n=== Keybase API Test ===")
     
     test_identities = [
         "E23265A0E36FC128",
@@ -34,40 +37,38 @@ async def test_keybase_api():
         "673C81B66A67ED67"
     ]
     
+    keybase_info = await client.get_keybase_info_many(test_identities)
+    
     for identity in test_identities:
-        username, picture_url = await client.get_keybase_info(identity)
-        print(f"  Identity: {identity}")
-        print(f"  Username: {username or 'Not found'}")
-        print(f"  Picture:  {picture_url or 'Not found'}")
-        print()
+        username, picture_url = keybase_info[identity]
+        out.append(
+            f"  Identity: {identity}\n"
+            f"  Username: {username or 'Not found'}\n"
+            f"  Picture:  {picture_url or 'Not found'}\n"
+        )
+    
+    return out
 
 
-async def test_validator_matching():
-    print("\n=== Validator Matching Test ===")
-    
-    base_urls = [os.getenv("GONKA_API_URL", "http://node2.gonka.ai:8000")]
-    client = GonkaClient(base_urls)
+async def test_validator_matching(client):
+    out = []
+    out.append("\n=== Validator Matching Test ===")
     
-    print("  Fetching validators...")
-    validators = await client.get_all_validators()
-    validators_with_tokens = [v for v in validators if v.get("tokens") and int(v.get("tokens")) > 0]
-    print(f"  Found {len(validators_with_tokens)} validators with tokens")
+    out.append("  Fetching validators and current epoch participants...")
+    validators, epoch_data = await asyncio.gather(
+        client.get_all_validators(),
+        client.get_current_epoch_participants()
+    )
+    validator_by_operator = build_validator_index(filter_active_validators(validators))
+    out.append(f"  Found {len(validator_by_operator)} validators with tokens")
     
-    print("\n  Fetching current epoch participants...")
-    epoch_data = await client.get_current_epoch_participants()
     participants = epoch_data.get("active_participants", {}).get("participants", [])
-    print(f"  Found {len(participants)} participants")
-    
-    validator_by_operator = {}
-    for v in validators_with_tokens:
-        operator_address = v.get("operator_address", "")
-        if operator_address:
-            validator_by_operator[operator_address] = v
+    out.append(f"  Found {len(participants)} participants")
     
     matched = 0
     mismatched_keys = 0
     
-    print("\n  Matching participants to validators:")
+    out.append("\n  Matching participants to validators:")
     for participant in participants[:5]:
         participant_index = participant.get("index")
         participant_address = participant.get("address")
@@ -76,89 +77,85 @@ async def test_validator_matching():
         if not participant_address:
             continue
         
-        valoper_address = GonkaClient.convert_bech32_address(participant_address, "gonkavaloper")
+        valoper_address = GonkaClient.convert_bech32_address(participant_address, VALOPER_PREFIX)
         validator = validator_by_operator.get(valoper_address)
         
         if validator:
             matched += 1
-            consensus_pub = (
-                (validator.get("consensus_pubkey") or {}).get("key")
-                or (validator.get("consensus_pubkey") or {}).get("value")
-                or ""
-            )
+            consensus_pub = validator.consensus_pub
             
-            description = validator.get("description", {})
-            moniker = description.get("moniker", "")
-            identity = description.get("identity", "")
-            website = description.get("website", "")
+            moniker = validator.moniker
+            identity = validator.identity
+            website = validator.website
             
             key_match = "MATCH" if consensus_pub == participant_key else "MISMATCH"
             if key_match == "MISMATCH":
                 mismatched_keys += 1
             
-            print(f"\n    Participant: {participant_index[:20]}...")
-            print(f"    Valoper:     {valoper_address[:25]}...")
-            print(f"    Moniker:     {moniker or '-'}")
-            print(f"    Identity:    {identity or '-'}")
-            print(f"    Website:     {website or '-'}")
-            print(f"    Key Match:   {key_match}")
-    
-    print(f"\n  Summary: {matched} matched out of {min(5, len(participants))} tested")
+            out.append(
+                f"\n    Participant: {participant_index[:20]}...\n"
+                f"    Valoper:     {valoper_address[:25]}...\n"
+                f"    Moniker:     {moniker or '-'}\n"
+                f"    Identity:    {identity or '-'}\n"
+                f"    Website:     {website or '-'}\n"
+                f"    Key Match:   {key_match}"
+            )
+    
+    out.append(f"\n  Summary: {matched} matched out of {min(5, len(participants))} tested")
     if mismatched_keys > 0:
-        print(f"  WARNING: {mismatched_keys} consensus key mismatches detected!")
+        out.append(f"  WARNING: {mismatched_keys} consensus key mismatches detected!")
+    
+    return out
 
 
-async def test_description_extraction():
-    print("\n=== Description Field Extraction Test ===")
-    
-    base_urls = [os.getenv("GONKA_API_URL", "http://node2.gonka.ai:8000")]
-    client = GonkaClient(base_urls)
+async def test_description_extraction(client):
+    out = []
+    out.append("\n=== Description Field Extraction Test ===")
     
-    validators = await client.get_all_validators()
-    validators_with_tokens = [v for v in validators if v.get("tokens") and int(v.get("tokens")) > 0]
+    validators_with_tokens = []
+    tokens_count = 0
+    async for v in client.iter_validators():
+        rec = parse_validator(v)
+        if rec.tokens > 0:
+            tokens_count += 1
+            if len(validators_with_tokens) < 5:
+                validators_with_tokens.append(rec)
     
-    print(f"  Extracting descriptions from {len(validators_with_tokens)} validators:")
+    out.append(f"  Extracting descriptions from {tokens_count} validators:")
     
-    for validator in validators_with_tokens[:5]:
-        description = validator.get("description", {})
-        moniker = description.get("moniker", "").strip()
-        identity = description.get("identity", "").strip()
-        website = description.get("website", "").strip()
+    for validator in validators_with_tokens:
+        moniker = validator.moniker
+        identity = validator.identity
+        website = validator.website
         
-        if moniker and moniker.startswith("gonkavaloper"):
-            filtered_moniker = ""
-        else:
-            filtered_moniker = moniker
+        filtered_moniker = validator.display_moniker
         
-        print(f"\n    Operator:        {validator.get('operator_address', '')[:30]}...")
-        print(f"    Moniker:         {moniker or '-'}")
-        print(f"    Filtered:        {filtered_moniker or '-'}")
-        print(f"    Identity:        {identity or '-'}")
-        print(f"    Website:         {website or '-'}")
+        out.append(
+            f"\n    Operator:        {validator.operator[:30]}...\n"
+            f"    Moniker:         {moniker or '-'}\n"
+            f"    Filtered:        {filtered_moniker or '-'}\n"
+            f"    Identity:        {identity or '-'}\n"
+            f"    Website:         {website or '-'}"
+        )
+    
+    return out
 
 
-async def test_integration():
-    print("\n=== Integration Test ===")
-    
-    base_urls = [os.getenv("GONKA_API_URL", "http://node2.gonka.ai:8000")]
-    client = GonkaClient(base_urls)
-    
-    print("  Running full pipeline...")
+async def test_integration(client):
+    out = []
+    out.append("\n=== Integration Test ===")
     
-    validators = await client.get_all_validators()
-    validators_with_tokens = [v for v in validators if v.get("tokens") and int(v.get("tokens")) > 0]
+    out.append("  Running full pipeline...")
     
-    epoch_data = await client.get_current_epoch_participants()
+    validators, epoch_data = await asyncio.gather(
+        client.get_all_validators(),
+        client.get_current_epoch_participants()
+    )
     participants = epoch_data.get("active_participants", {}).get("participants", [])
     
-    validator_by_operator = {}
-    for v in validators_with_tokens:
-        operator_address = v.get("operator_address", "")
-        if operator_address:
-            validator_by_operator[operator_address] = v
+    validator_by_operator = build_validator_index(filter_active_validators(validators))
     
-    enriched_count = 0
-    keybase_count = 0
+    enriched = []
     
     for participant in participants[:3]:
         participant_index = participant.get("index")
@@ -168,45 +165,43 @@ async def test_integration():
         if not participant_address:
             continue
         
-        valoper_address = GonkaClient.convert_bech32_address(participant_address, "gonkavaloper")
+        valoper_address = GonkaClient.convert_bech32_address(participant_address, VALOPER_PREFIX)
         validator = validator_by_operator.get(valoper_address)
         
         if not validator:
             continue
         
-        consensus_pub = (
-            (validator.get("consensus_pubkey") or {}).get("key")
-            or (validator.get("consensus_pubkey") or {}).get("value")
-            or ""
-        )
-        
-        description = validator.get("description", {})
-        moniker = description.get("moniker", "").strip()
-        identity = description.get("identity", "").strip()
-        website = description.get("website", "").strip()
-        
-        if moniker and moniker.startswith("gonkavaloper"):
-            moniker = ""
+        consensus_pub = validator.consensus_pub
         
-        keybase_username = None
-        keybase_picture_url = None
-        if identity:
-            keybase_username, keybase_picture_url = await client.get_keybase_info(identity)
-            if keybase_username:
-                keybase_count += 1
+        moniker = validator.display_moniker
+        identity = validator.identity
+        website = validator.website
         
-        enriched_count += 1
+        enriched.append((participant_index, moniker, identity, website, consensus_pub == participant_key))
+    
+    keybase_info = await client.get_keybase_info_many([row[2] for row in enriched])
+    enriched_count = len(enriched)
+    keybase_count = 0
+    
+    for participant_index, moniker, identity, website, key_match in enriched:
+        keybase_username, keybase_picture_url = keybase_info.get(identity, (None, None))
+        if keybase_username:
+            keybase_count += 1
         
-        print(f"\n    Participant: {participant_index[:25]}...")
-        print(f"    Moniker:     {moniker or '-'}")
-        print(f"    Identity:    {identity or '-'}")
-        print(f"    Keybase:     {keybase_username or '-'}")
-        print(f"    Picture:     {keybase_picture_url or '-'}")
-        print(f"    Website:     {website or '-'}")
-        print(f"    Key Match:   {'Yes' if consensus_pub == participant_key else 'No'}")
+        out.append(
+            f"\n    Participant: {participant_index[:25]}...\n"
+            f"    Moniker:     {moniker or '-'}\n"
+            f"    Identity:    {identity or '-'}\n"
+            f"    Keybase:     {keybase_username or '-'}\n"
+            f"    Picture:     {keybase_picture_url or '-'}\n"
+            f"    Website:     {website or '-'}\n"
+            f"    Key Match:   {'Yes' if key_match else 'No'}"
+        )
     
-    print(f"\n  Successfully enriched {enriched_count} participants")
-    print(f"  Found {keybase_count} Keybase profiles")
+    out.append(f"\n  Successfully enriched {enriched_count} participants")
+    out.append(f"  Found {keybase_count} Keybase profiles")
+    
+    return out
 
 
 async def main():
@@ -214,11 +209,18 @@ async def main():
     print("Validator Info Pipeline Test")
     print("="*60)
     
-    await test_address_conversion()
-    await test_keybase_api()
-    await test_validator_matching()
-    await test_description_extraction()
-    await test_integration()
+    base_urls = [os.getenv("GONKA_API_URL", "http://node2.gonka.ai:8000")]
+    async with GonkaClient(base_urls) as client:
+        results = await asyncio.gather(
+            test_address_conversion(),
+            test_keybase_api(client),
+            test_validator_matching(client),
+            test_description_extraction(client),
+            test_integration(client)
+        )
+    
+    for out in results:
+        print("\n".join(out))
     
     print("\n" + "="*60)
     print("Test Complete")
@@ -1,6 +1,10 @@
 import asyncio
+import heapq
 import logging
 import os
+import random
+import time
+from typing import Dict, Optional
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -27,163 +31,169 @@ POLL_EPOCH_TOTAL_REWARDS_INTERVAL = int(os.getenv("POLL_EPOCH_TOTAL_REWARDS_INTE
 POLL_PARTICIPANT_INFERENCES_INTERVAL = int(os.getenv("POLL_PARTICIPANT_INFERENCES_INTERVAL", "1200"))
 POLL_MODELS_API_INTERVAL = int(os.getenv("POLL_MODELS_API_INTERVAL", "300"))
 POLL_TIMELINE_INTERVAL = int(os.getenv("POLL_TIMELINE_INTERVAL", "30"))
+POLL_WAL_CHECKPOINT_INTERVAL = int(os.getenv("POLL_WAL_CHECKPOINT_INTERVAL", "300"))
+POLL_MIN_TIMEOUT = int(os.getenv("POLL_MIN_TIMEOUT", "300"))
+POLL_JITTER = 0.1
 
-background_task = None
-jail_polling_task = None
-health_polling_task = None
-rewards_polling_task = None
-warm_keys_polling_task = None
-hardware_nodes_polling_task = None
-epoch_total_rewards_polling_task = None
-participant_inferences_polling_task = None
-models_api_polling_task = None
-timeline_polling_task = None
+poller_task = None
 inference_service_instance = None
 
 
-async def poll_current_epoch():
-    while True:
-        try:
-            if inference_service_instance:
-                await inference_service_instance.get_current_epoch_stats(reload=True)
-                logger.info("Background polling: fetched current epoch stats")
-        except Exception as e:
-            logger.error(f"Background polling error: {e}")
-        
-        await asyncio.sleep(POLL_CURRENT_EPOCH_INTERVAL)
+async def poll_current_epoch(epoch_data, height):
+    await inference_service_instance.get_current_epoch_stats(reload=True)
+    logger.info("Background polling: fetched current epoch stats")
 
 
-async def poll_jail_status():
-    await asyncio.sleep(10)
-    
-    while True:
-        try:
-            if inference_service_instance:
-                epoch_data = await inference_service_instance.client.get_current_epoch_participants()
-                epoch_id = epoch_data["active_participants"]["epoch_group_id"]
-                height = await inference_service_instance.client.get_latest_height()
-                active_participants = epoch_data["active_participants"]["participants"]
-                
-                await inference_service_instance.fetch_and_cache_jail_statuses(
-                    epoch_id, height, active_participants
-                )
-                logger.info("Background polling: fetched jail statuses")
-        except Exception as e:
-            logger.error(f"Jail polling error: {e}")
-        
-        await asyncio.sleep(POLL_JAIL_STATUS_INTERVAL)
-
-
-async def poll_node_health():
-    await asyncio.sleep(5)
+async def poll_jail_status(epoch_data, height):
+    epoch_id = epoch_data["active_participants"]["epoch_group_id"]
+    active_participants = epoch_data["active_participants"]["participants"]
     
-    while True:
-        try:
-            if inference_service_instance:
-                epoch_data = await inference_service_instance.client.get_current_epoch_participants()
-                active_participants = epoch_data["active_participants"]["participants"]
-                
-                await inference_service_instance.fetch_and_cache_node_health(active_participants)
-                logger.info("Background polling: fetched node health")
-        except Exception as e:
-            logger.error(f"Node health polling error: {e}")
-        
-        await asyncio.sleep(POLL_NODE_HEALTH_INTERVAL)
+    await inference_service_instance.fetch_and_cache_jail_statuses(
+        epoch_id, height, active_participants
+    )
+    logger.info("Background polling: fetched jail statuses")
 
 
-async def poll_rewards():
-    await asyncio.sleep(15)
+async def poll_node_health(epoch_data, height):
+    active_participants = epoch_data["active_participants"]["participants"]
     
-    while True:
-        try:
-            if inference_service_instance:
-                await inference_service_instance.poll_participant_rewards()
-        except Exception as e:
-            logger.error(f"Rewards polling error: {e}")
-        
-        await asyncio.sleep(POLL_REWARDS_INTERVAL)
+    await inference_service_instance.fetch_and_cache_node_health(active_participants)
+    logger.info("Background polling: fetched node health")
 
 
-async def poll_warm_keys():
-    await asyncio.sleep(20)
-    
-    while True:
-        try:
-            if inference_service_instance:
-                await inference_service_instance.poll_warm_keys(batch_size=POLL_WARM_KEYS_BATCH_SIZE)
-        except Exception as e:
-            logger.error(f"Warm keys polling error: {e}")
-        
-        await asyncio.sleep(POLL_WARM_KEYS_INTERVAL)
+async def poll_rewards(epoch_data, height):
+    await inference_service_instance.poll_participant_rewards()
 
 
-async def poll_hardware_nodes():
-    await asyncio.sleep(25)
-    
-    while True:
-        try:
-            if inference_service_instance:
-                await inference_service_instance.poll_hardware_nodes(batch_size=POLL_HARDWARE_NODES_BATCH_SIZE)
-        except Exception as e:
-            logger.error(f"Hardware nodes polling error: {e}")
-        
-        await asyncio.sleep(POLL_HARDWARE_NODES_INTERVAL)
+async def poll_warm_keys(epoch_data, height):
+    await inference_service_instance.poll_warm_keys(batch_size=POLL_WARM_KEYS_BATCH_SIZE)
 
 
-async def poll_epoch_total_rewards():
-    await asyncio.sleep(30)
-    
-    while True:
-        try:
-            if inference_service_instance:
-                await inference_service_instance.poll_epoch_total_rewards()
-        except Exception as e:
-            logger.error(f"Epoch total rewards polling error: {e}")
-        
-        await asyncio.sleep(POLL_EPOCH_TOTAL_REWARDS_INTERVAL)
+async def poll_hardware_nodes(epoch_data, height):
+    await inference_service_instance.poll_hardware_nodes(batch_size=POLL_HARDWARE_NODES_BATCH_SIZE)
 
 
-async def poll_participant_inferences():
-    while True:
-        try:
-            if inference_service_instance:
-                await inference_service_instance.poll_participant_inferences()
-        except Exception as e:
-            logger.error(f"Participant inferences polling error: {e}")
-        
-        await asyncio.sleep(POLL_PARTICIPANT_INFERENCES_INTERVAL)
+async def poll_epoch_total_rewards(epoch_data, height):
+    await inference_service_instance.poll_epoch_total_rewards()
+
 
+async def poll_participant_inferences(epoch_data, height):
+    await inference_service_instance.poll_participant_inferences()
 
-async def poll_models_api():
-    await asyncio.sleep(35)
+
+async def poll_models_api(epoch_data, height):
+    await inference_service_instance.poll_models_api_cache()
+
+
+async def poll_timeline(epoch_data, height):
+    await inference_service_instance.get_timeline()
+    logger.info("Background polling: fetched timeline data")
+
+
+async def poll_wal_checkpoint(epoch_data, height):
+    await inference_service_instance.cache_db.checkpoint()
+
+
+POLL_JOBS = [
+    ("current epoch", poll_current_epoch, 0, POLL_CURRENT_EPOCH_INTERVAL, False),
+    ("jail", poll_jail_status, 10, POLL_JAIL_STATUS_INTERVAL, True),
+    ("node health", poll_node_health, 5, POLL_NODE_HEALTH_INTERVAL, True),
+    ("rewards", poll_rewards, 15, POLL_REWARDS_INTERVAL, False),
+    ("warm keys", poll_warm_keys, 20, POLL_WARM_KEYS_INTERVAL, False),
+    ("hardware nodes", poll_hardware_nodes, 25, POLL_HARDWARE_NODES_INTERVAL, False),
+    ("epoch total rewards", poll_epoch_total_rewards, 30, POLL_EPOCH_TOTAL_REWARDS_INTERVAL, False),
+    ("participant inferences", poll_participant_inferences, 0, POLL_PARTICIPANT_INFERENCES_INTERVAL, False),
+    ("models API", poll_models_api, 35, POLL_MODELS_API_INTERVAL, False),
+    ("timeline", poll_timeline, 40, POLL_TIMELINE_INTERVAL, False),
+    ("WAL checkpoint", poll_wal_checkpoint, 45, POLL_WAL_CHECKPOINT_INTERVAL, False),
+]
+
+POLL_JOB_TIMEOUTS: Dict[str, Optional[float]] = {
+    "participant inferences": None,
+}
+
+
+async def run_poll_job(name, job, interval, epoch_data, height):
+    timeout = POLL_JOB_TIMEOUTS.get(name, max(interval * 2, POLL_MIN_TIMEOUT))
+    try:
+        if inference_service_instance:
+            await asyncio.wait_for(job(epoch_data, height), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"{name.capitalize()} polling timed out after {timeout}s")
+    except Exception as e:
+        logger.error(f"{name.capitalize()} polling error: {e}")
+
+
+async def start_snapshot_jobs(jobs, running: Dict[str, asyncio.Task]):
+    if not inference_service_instance:
+        return
     
-    while True:
-        try:
-            if inference_service_instance:
-                await inference_service_instance.poll_models_api_cache()
-        except Exception as e:
-            logger.error(f"Models API polling error: {e}")
-        
-        await asyncio.sleep(POLL_MODELS_API_INTERVAL)
+    try:
+        client = inference_service_instance.client
+        epoch_data, height = await asyncio.wait_for(
+            asyncio.gather(client.get_current_epoch_participants(), client.get_latest_height()),
+            timeout=POLL_MIN_TIMEOUT
+        )
+    except Exception as e:
+        logger.error(f"Polling snapshot error: {e}")
+        return
+    
+    for name, job, interval in jobs:
+        running[name] = asyncio.create_task(run_poll_job(name, job, interval, epoch_data, height))
 
 
-async def poll_timeline():
-    await asyncio.sleep(40)
+async def poller_loop():
+    start = time.monotonic()
+    schedule = [
+        (start + delay + random.uniform(0, interval * POLL_JITTER), name, job, interval, needs_snapshot)
+        for name, job, delay, interval, needs_snapshot in POLL_JOBS
+    ]
+    heapq.heapify(schedule)
+    running: Dict[str, asyncio.Task] = {}
     
-    while True:
-        try:
-            if inference_service_instance:
-                await inference_service_instance.get_timeline()
-                logger.info("Background polling: fetched timeline data")
-        except Exception as e:
-            logger.error(f"Timeline polling error: {e}")
-        
-        await asyncio.sleep(POLL_TIMELINE_INTERVAL)
+    try:
+        while True:
+            wait = schedule[0][0] - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            
+            now = time.monotonic()
+            due = []
+            while schedule and schedule[0][0] <= now:
+                due.append(heapq.heappop(schedule))
+            
+            snapshot_jobs = []
+            for due_at, name, job, interval, needs_snapshot in due:
+                next_due = now + interval * (1 + random.uniform(-POLL_JITTER, POLL_JITTER))
+                heapq.heappush(schedule, (next_due, name, job, interval, needs_snapshot))
+                
+                previous = running.get(name)
+                if previous and not previous.done():
+                    logger.warning(f"Skipping {name} polling: previous run still in progress")
+                    continue
+                
+                if needs_snapshot:
+                    snapshot_jobs.append((name, job, interval))
+                else:
+                    running[name] = asyncio.create_task(run_poll_job(name, job, interval, None, None))
+            
+            if snapshot_jobs:
+                launcher = asyncio.create_task(start_snapshot_jobs(snapshot_jobs, running))
+                for name, _, _ in snapshot_jobs:
+                    running[name] = launcher
+    finally:
+        tasks = list(set(running.values()))
+        for task in tasks:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        cancelled = sum(1 for r in results if isinstance(r, asyncio.CancelledError))
+        logger.info(f"Polling jobs stopped: {cancelled} in-flight cancelled")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global background_task, jail_polling_task, health_polling_task, rewards_polling_task, warm_keys_polling_task, hardware_nodes_polling_task, epoch_total_rewards_polling_task, participant_inferences_polling_task, models_api_polling_task, timeline_polling_task, inference_service_instance
+    global poller_task, inference_service_instance
     
     inference_urls = os.getenv("INFERENCE_URLS", "http://node2.gonka.ai:8000").split(",")
     inference_urls = [url.strip() for url in inference_urls]
@@ -204,89 +214,20 @@ async def lifespan(app: FastAPI):
     
     set_inference_service(inference_service_instance)
     
-    background_task = asyncio.create_task(poll_current_epoch())
-    jail_polling_task = asyncio.create_task(poll_jail_status())
-    health_polling_task = asyncio.create_task(poll_node_health())
-    rewards_polling_task = asyncio.create_task(poll_rewards())
-    warm_keys_polling_task = asyncio.create_task(poll_warm_keys())
-    hardware_nodes_polling_task = asyncio.create_task(poll_hardware_nodes())
-    epoch_total_rewards_polling_task = asyncio.create_task(poll_epoch_total_rewards())
-    participant_inferences_polling_task = asyncio.create_task(poll_participant_inferences())
-    models_api_polling_task = asyncio.create_task(poll_models_api())
-    timeline_polling_task = asyncio.create_task(poll_timeline())
-    logger.info("Background polling tasks started")
+    poller_task = asyncio.create_task(poller_loop())
+    logger.info("Background polling scheduler started")
     
     yield
     
-    if background_task:
-        background_task.cancel()
-        try:
-            await background_task
-        except asyncio.CancelledError:
-            logger.info("Background polling task cancelled")
-    
-    if jail_polling_task:
-        jail_polling_task.cancel()
-        try:
-            await jail_polling_task
-        except asyncio.CancelledError:
-            logger.info("Jail polling task cancelled")
-    
-    if health_polling_task:
-        health_polling_task.cancel()
-        try:
-            await health_polling_task
-        except asyncio.CancelledError:
-            logger.info("Health polling task cancelled")
-    
-    if rewards_polling_task:
-        rewards_polling_task.cancel()
-        try:
-            await rewards_polling_task
-        except asyncio.CancelledError:
-            logger.info("Rewards polling task cancelled")
-    
-    if warm_keys_polling_task:
-        warm_keys_polling_task.cancel()
+    if poller_task:
+        poller_task.cancel()
         try:
-            await warm_keys_polling_task
+            await poller_task
         except asyncio.CancelledError:
-            logger.info("Warm keys polling task cancelled")
+            logger.info("Background polling scheduler cancelled")
     
-    if hardware_nodes_polling_task:
-        hardware_nodes_polling_task.cancel()
-        try:
-            await hardware_nodes_polling_task
-        except asyncio.CancelledError:
-            logger.info("Hardware nodes polling task cancelled")
-    
-    if epoch_total_rewards_polling_task:
-        epoch_total_rewards_polling_task.cancel()
-        try:
-            await epoch_total_rewards_polling_task
-        except asyncio.CancelledError:
-            logger.info("Epoch total rewards polling task cancelled")
-    
-    if participant_inferences_polling_task:
-        participant_inferences_polling_task.cancel()
-        try:
-            await participant_inferences_polling_task
-        except asyncio.CancelledError:
-            logger.info("Participant inferences polling task cancelled")
-    
-    if models_api_polling_task:
-        models_api_polling_task.cancel()
-        try:
-            await models_api_polling_task
-        except asyncio.CancelledError:
-            logger.info("Models API polling task cancelled")
-    
-    if timeline_polling_task:
-        timeline_polling_task.cancel()
-        try:
-            await timeline_polling_task
-        except asyncio.CancelledError:
-            logger.info("Timeline polling task cancelled")
+    await inference_service_instance.client.close()
+    await inference_service_instance.cache_db.close()
 
 
 app = FastAPI(lifespan=lifespan)
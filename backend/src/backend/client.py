@@ -1,7 +1,8 @@
 import httpx
 import base64
 import hashlib
-from typing import List, Dict, Any, Optional, Tuple
+import functools
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 import logging
 import time
 import bech32
@@ -9,14 +10,105 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
-BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+KEYBASE_CACHE_TTL = 3600.0
+KEYBASE_CACHE_SIZE = 1024
+LATEST_HEIGHT_CACHE_TTL = 2.0
+LATEST_EPOCH_CACHE_TTL = 5.0
+CURRENT_PARTICIPANTS_CACHE_TTL = 5.0
+MODELS_STATS_CACHE_TTL = 5.0
+MODELS_ALL_CACHE_TTL = 30.0
+RESTRICTIONS_PARAMS_CACHE_TTL = 30.0
+BLOCK_CACHE_SIZE = 64
 
 
+def _ttl_cached(ttl: float):
+    def decorator(func):
+        key = func.__name__
+        
+        @functools.wraps(func)
+        async def wrapper(self):
+            now = time.monotonic()
+            cached = self._rpc_cache.get(key)
+            if cached and cached[0] > now:
+                return await asyncio.shield(cached[1])
+            
+            task = asyncio.ensure_future(func(self))
+            self._rpc_cache[key] = (now + ttl, task)
+            try:
+                return await asyncio.shield(task)
+            except Exception:
+                if self._rpc_cache.get(key, (None, None))[1] is task:
+                    del self._rpc_cache[key]
+                raise
+        
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode_bech32(address: str) -> Tuple[Optional[str], Optional[Tuple[int, ...]]]:
+    hrp, data = bech32.bech32_decode(address)
+    return hrp, tuple(data) if data is not None else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _convert_bech32_address(address: str, new_prefix: str) -> Optional[str]:
+    try:
+        hrp, data = _decode_bech32(address)
+        if data is None:
+            logger.warning(f"Invalid Bech32 address: {address}")
+            return None
+        
+        if hrp == new_prefix:
+            return address.lower()
+        
+        new_address = bech32.bech32_encode(new_prefix, list(data))
+        if new_address is None:
+            logger.warning(f"Could not encode new Bech32 address with prefix {new_prefix}")
+            return None
+        
+        return new_address
+    except Exception as e:
+        logger.warning(f"Error converting address {address}: {e}")
+        return None
+
+
+
+@functools.lru_cache(maxsize=4096)
+def _pubkey_to_valcons(pubkey_b64: str, hrp: str) -> str:
+    public_key = base64.b64decode(pubkey_b64)
+    hex20 = hashlib.sha256(public_key).digest()[:20]
+    return bech32.bech32_encode(hrp, bech32.convertbits(hex20, 8, 5))
+
 class GonkaClient:
     def __init__(self, base_urls: List[str], timeout: float = 30.0):
         self.base_urls = base_urls
         self.timeout = timeout
         self.current_url_index = 0
+        self._http: Optional[httpx.AsyncClient] = None
+        self._keybase_cache: Dict[str, Tuple[float, Tuple[Optional[str], Optional[str]]]] = {}
+        self._rpc_cache: Dict[str, Tuple[float, asyncio.Future]] = {}
+        self._block_cache: Dict[int, Dict[str, Any]] = {}
+    
+    async def __aenter__(self) -> "GonkaClient":
+        self._get_http()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+        return self._http
+    
+    async def close(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
         
     def _get_current_url(self) -> str:
         return self.base_urls[self.current_url_index]
@@ -38,11 +130,10 @@ class GonkaClient:
             url = self._get_current_url().rstrip('/') + '/' + path.lstrip('/')
             
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    logger.debug(f"Request to {url} with params {params}, headers {headers}")
-                    response = await client.get(url, params=params, headers=headers)
-                    response.raise_for_status()
-                    return response.json()
+                logger.debug(f"Request to {url} with params {params}, headers {headers}")
+                response = await self._get_http().get(url, params=params, headers=headers)
+                response.raise_for_status()
+                return response.json()
             except Exception as e:
                 last_error = e
                 logger.warning(f"Request failed to {url}: {e}")
@@ -50,6 +141,7 @@ class GonkaClient:
         
         raise Exception(f"All URLs failed. Last error: {last_error}")
     
+    @_ttl_cached(CURRENT_PARTICIPANTS_CACHE_TTL)
     async def get_current_epoch_participants(self) -> Dict[str, Any]:
         return await self._make_request("/v1/epochs/current/participants")
     
@@ -69,6 +161,7 @@ class GonkaClient:
             headers=headers if headers else None
         )
     
+    @_ttl_cached(LATEST_HEIGHT_CACHE_TTL)
     async def get_latest_height(self) -> int:
         data = await self._make_request("/chain-rpc/status")
         return int(data["result"]["sync_info"]["latest_block_height"])
@@ -90,31 +183,35 @@ class GonkaClient:
             logger.error(f"Failed to discover URLs: {e}")
             return []
     
-    async def get_all_validators(self, height: Optional[int] = None) -> List[Dict[str, Any]]:
-        validators = []
-        next_key = ""
+    async def _get_validators_page(self, next_key: str, headers: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        params = {"pagination.limit": "200"}
+        if next_key:
+            params["pagination.key"] = next_key
         
-        while True:
-            params = {"pagination.limit": "200"}
-            if next_key:
-                params["pagination.key"] = next_key
-            
-            headers = {}
-            if height is not None:
-                headers["X-Cosmos-Block-Height"] = str(height)
-            
-            data = await self._make_request(
-                "/chain-api/cosmos/staking/v1beta1/validators",
-                params=params,
-                headers=headers if headers else None
-            )
-            
-            validators.extend(data.get("validators", []))
-            next_key = data.get("pagination", {}).get("next_key") or ""
-            
-            if not next_key:
-                break
+        return await self._make_request(
+            "/chain-api/cosmos/staking/v1beta1/validators",
+            params=params,
+            headers=headers
+        )
+    
+    async def iter_validators(self, height: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        headers = {"X-Cosmos-Block-Height": str(height)} if height is not None else None
+        page = asyncio.create_task(self._get_validators_page("", headers))
         
+        try:
+            while page is not None:
+                data = await page
+                next_key = data.get("pagination", {}).get("next_key") or ""
+                page = asyncio.create_task(self._get_validators_page(next_key, headers)) if next_key else None
+                
+                for validator in data.get("validators", []):
+                    yield validator
+        finally:
+            if page is not None and not page.done():
+                page.cancel()
+    
+    async def get_all_validators(self, height: Optional[int] = None) -> List[Dict[str, Any]]:
+        validators = [v async for v in self.iter_validators(height=height)]
         logger.info(f"Fetched {len(validators)} validators")
         return validators
     
@@ -133,48 +230,18 @@ class GonkaClient:
             logger.warning(f"Failed to get signing info for {valcons_addr}: {e}")
             return None
     
+    async def get_signing_info_many(
+        self,
+        valcons_addrs: List[str],
+        height: Optional[int] = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        unique = list(dict.fromkeys(a for a in valcons_addrs if a))
+        results = await asyncio.gather(*[self.get_signing_info(a, height=height) for a in unique])
+        return dict(zip(unique, results))
+    
     @staticmethod
     def pubkey_to_valcons(pubkey_b64: str, hrp: str = "gonkavalcons") -> str:
-        def _polymod(values: List[int]) -> int:
-            generators = [0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3]
-            checksum = 1
-            for value in values:
-                top = checksum >> 25
-                checksum = ((checksum & 0x1FFFFFF) << 5) ^ value
-                for i in range(5):
-                    if (top >> i) & 1:
-                        checksum ^= generators[i]
-            return checksum
-        
-        def _hrp_expand(hrp: str) -> List[int]:
-            return [ord(x) >> 5 for x in hrp] + [0] + [ord(x) & 31 for x in hrp]
-        
-        def _create_checksum(hrp: str, data: List[int]) -> List[int]:
-            polymod = _polymod(_hrp_expand(hrp) + data + [0, 0, 0, 0, 0, 0]) ^ 1
-            return [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
-        
-        def _bech32_encode(hrp: str, data: List[int]) -> str:
-            return hrp + "1" + "".join(BECH32_CHARSET[d] for d in data + _create_checksum(hrp, data))
-        
-        def _convertbits(data: bytes, frombits: int, tobits: int, pad: bool = True) -> List[int]:
-            accumulator = 0
-            bits = 0
-            result: List[int] = []
-            max_value = (1 << tobits) - 1
-            for byte in data:
-                accumulator = (accumulator << frombits) | byte
-                bits += frombits
-                while bits >= tobits:
-                    bits -= tobits
-                    result.append((accumulator >> bits) & max_value)
-            if pad and bits:
-                result.append((accumulator << (tobits - bits)) & max_value)
-            return result
-        
-        public_key = base64.b64decode(pubkey_b64)
-        hex20 = hashlib.sha256(public_key).digest()[:20]
-        data5 = _convertbits(hex20, 8, 5, pad=True)
-        return _bech32_encode(hrp, data5)
+        return _pubkey_to_valcons(pubkey_b64, hrp)
     
     async def check_node_health(self, inference_url: str) -> Dict[str, Any]:
         if not inference_url:
@@ -188,22 +255,21 @@ class GonkaClient:
         start_time = time.time()
         
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(health_url)
-                response_time_ms = int((time.time() - start_time) * 1000)
-                
-                if response.status_code == 200:
-                    return {
-                        "is_healthy": True,
-                        "error_message": None,
-                        "response_time_ms": response_time_ms
-                    }
-                else:
-                    return {
-                        "is_healthy": False,
-                        "error_message": f"HTTP {response.status_code}",
-                        "response_time_ms": response_time_ms
-                    }
+            response = await self._get_http().get(health_url, timeout=5.0)
+            response_time_ms = int((time.time() - start_time) * 1000)
+            
+            if response.status_code == 200:
+                return {
+                    "is_healthy": True,
+                    "error_message": None,
+                    "response_time_ms": response_time_ms
+                }
+            else:
+                return {
+                    "is_healthy": False,
+                    "error_message": f"HTTP {response.status_code}",
+                    "response_time_ms": response_time_ms
+                }
         except Exception as e:
             return {
                 "is_healthy": False,
@@ -225,6 +291,7 @@ class GonkaClient:
         
         return await self._make_request(path, headers=headers)
     
+    @_ttl_cached(LATEST_EPOCH_CACHE_TTL)
     async def get_latest_epoch(self) -> Dict[str, Any]:
         return await self._make_request("/v1/epochs/latest")
     
@@ -331,50 +398,61 @@ class GonkaClient:
             return []
     
     async def get_block(self, height: int) -> Dict[str, Any]:
-        return await self._make_request(f"/chain-rpc/block?height={height}")
+        cached = self._block_cache.get(height)
+        if cached is not None:
+            return cached
+        
+        block = await self._make_request(f"/chain-rpc/block?height={height}")
+        if len(self._block_cache) >= BLOCK_CACHE_SIZE:
+            self._block_cache.pop(next(iter(self._block_cache)))
+        self._block_cache[height] = block
+        return block
     
+    @_ttl_cached(RESTRICTIONS_PARAMS_CACHE_TTL)
     async def get_restrictions_params(self) -> Dict[str, Any]:
         return await self._make_request("/chain-api/productscience/inference/restrictions/params")
     
     @staticmethod
     def convert_bech32_address(address: str, new_prefix: str) -> Optional[str]:
-        try:
-            hrp, data = bech32.bech32_decode(address)
-            if data is None:
-                logger.warning(f"Invalid Bech32 address: {address}")
-                return None
-            
-            new_address = bech32.bech32_encode(new_prefix, data)
-            if new_address is None:
-                logger.warning(f"Could not encode new Bech32 address with prefix {new_prefix}")
-                return None
-            
-            return new_address
-        except Exception as e:
-            logger.warning(f"Error converting address {address}: {e}")
-            return None
+        return _convert_bech32_address(address, new_prefix)
     
     async def get_keybase_info(self, identity: str) -> Tuple[Optional[str], Optional[str]]:
+        cached = self._keybase_cache.get(identity)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
         try:
             api_url = f"https://keybase.io/_/api/1.0/user/lookup.json?key_suffix={identity}"
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(api_url)
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get("status", {}).get("code") == 0 and data.get("them"):
-                    username = data["them"][0].get("basics", {}).get("username")
-                    if username:
-                        picture_url = f"https://keybase.io/{username}/picture?size=96"
-                        return username, picture_url
+            response = await self._get_http().get(api_url, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
+            
+            result = (None, None)
+            if data.get("status", {}).get("code") == 0 and data.get("them"):
+                username = data["them"][0].get("basics", {}).get("username")
+                if username:
+                    result = (username, f"https://keybase.io/{username}/picture?size=96")
+            
+            self._keybase_cache.pop(identity, None)
+            if len(self._keybase_cache) >= KEYBASE_CACHE_SIZE:
+                self._keybase_cache.pop(next(iter(self._keybase_cache)))
+            self._keybase_cache[identity] = (time.monotonic() + KEYBASE_CACHE_TTL, result)
+            return result
         except Exception as e:
             logger.warning(f"Failed to fetch Keybase info for {identity}: {e}")
         
         return None, None
     
+    async def get_keybase_info_many(self, identities: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        unique = list(dict.fromkeys(i for i in identities if i))
+        results = await asyncio.gather(*[self.get_keybase_info(i) for i in unique])
+        return dict(zip(unique, results))
+    
+    @_ttl_cached(MODELS_ALL_CACHE_TTL)
     async def get_models_all(self) -> Dict[str, Any]:
         return await self._make_request("/chain-api/productscience/inference/inference/models_all")
     
+    @_ttl_cached(MODELS_STATS_CACHE_TTL)
     async def get_models_stats(self) -> Dict[str, Any]:
         return await self._make_request("/chain-api/productscience/inference/inference/models_stats_by_time")
     
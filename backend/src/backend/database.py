@@ -1,207 +1,302 @@
 import aiosqlite
+import asyncio
 import json
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA wal_autocheckpoint=0",
+)
+
+READER_CONNECTIONS = 2
+JAIL_STATUS_CACHE_EPOCHS = 4
+MODELS_API_CACHE_ENTRIES = 8
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS inference_stats (
+    epoch_id INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    participant_index TEXT NOT NULL,
+    stats_json TEXT NOT NULL,
+    seed_signature TEXT,
+    cached_at TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, height, participant_index)
+) STRICT;
+
+DROP INDEX IF EXISTS idx_epoch_height;
+
+CREATE TABLE IF NOT EXISTS epoch_status (
+    epoch_id INTEGER PRIMARY KEY,
+    is_finished INTEGER NOT NULL,
+    finish_height INTEGER,
+    marked_at TEXT NOT NULL
+) STRICT;
+
+CREATE TABLE IF NOT EXISTS jail_status (
+    epoch_id INTEGER NOT NULL,
+    participant_index TEXT NOT NULL,
+    is_jailed INTEGER NOT NULL,
+    jailed_until TEXT,
+    ready_to_unjail INTEGER,
+    valcons_address TEXT,
+    moniker TEXT,
+    identity TEXT,
+    keybase_username TEXT,
+    keybase_picture_url TEXT,
+    website TEXT,
+    validator_consensus_key TEXT,
+    consensus_key_mismatch INTEGER,
+    recorded_at TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_index)
+) STRICT;
+
+CREATE INDEX IF NOT EXISTS idx_participant_jail
+ON jail_status(participant_index);
+
+CREATE TABLE IF NOT EXISTS node_health (
+    participant_index TEXT NOT NULL,
+    is_healthy INTEGER NOT NULL,
+    last_check TEXT NOT NULL,
+    error_message TEXT,
+    response_time_ms INTEGER,
+    PRIMARY KEY (participant_index)
+) STRICT;
+
+CREATE TABLE IF NOT EXISTS participant_rewards (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    rewarded_coins TEXT NOT NULL,
+    claimed INTEGER NOT NULL,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_id)
+) STRICT;
+
+DROP INDEX IF EXISTS idx_participant_rewards;
+
+CREATE INDEX IF NOT EXISTS idx_participant_rewards_cover
+ON participant_rewards(participant_id, epoch_id, rewarded_coins, claimed, last_updated);
+
+CREATE TABLE IF NOT EXISTS participant_warm_keys (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    grantee_address TEXT NOT NULL,
+    granted_at TEXT NOT NULL,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_id, grantee_address)
+) STRICT;
+
+DROP INDEX IF EXISTS idx_warm_keys_participant;
+
+DROP INDEX IF EXISTS idx_warm_keys_cover;
+
+CREATE INDEX IF NOT EXISTS idx_warm_keys_by_granted
+ON participant_warm_keys(epoch_id, participant_id, granted_at DESC, grantee_address);
+
+CREATE TABLE IF NOT EXISTS participant_hardware_nodes (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    local_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    models_json TEXT NOT NULL,
+    hardware_json TEXT NOT NULL,
+    host TEXT NOT NULL,
+    port TEXT NOT NULL,
+    poc_weight INTEGER,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_id, local_id)
+) STRICT;
+
+DROP INDEX IF EXISTS idx_hardware_nodes_participant;
+
+CREATE TABLE IF NOT EXISTS epoch_total_rewards (
+    epoch_id INTEGER PRIMARY KEY,
+    total_rewards_gnk INTEGER NOT NULL,
+    calculated_at TEXT NOT NULL
+) STRICT;
+
+CREATE TABLE IF NOT EXISTS models (
+    epoch_id INTEGER NOT NULL,
+    model_id TEXT NOT NULL,
+    total_weight INTEGER NOT NULL,
+    participant_count INTEGER NOT NULL,
+    cached_at TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, model_id)
+) STRICT;
+
+DROP INDEX IF EXISTS idx_models_epoch;
+
+CREATE TABLE IF NOT EXISTS models_api_cache (
+    epoch_id INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    models_all_json TEXT NOT NULL,
+    models_stats_json TEXT NOT NULL,
+    cached_at TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, height)
+) STRICT;
+
+DROP INDEX IF EXISTS idx_models_api_epoch;
+
+CREATE TABLE IF NOT EXISTS participant_inferences (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    inference_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    start_block_height TEXT NOT NULL,
+    start_block_timestamp TEXT NOT NULL,
+    validated_by_json TEXT,
+    prompt_hash TEXT,
+    response_hash TEXT,
+    prompt_token_count TEXT,
+    completion_token_count TEXT,
+    model TEXT,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_id, inference_id)
+) STRICT;
+
+DROP INDEX IF EXISTS idx_participant_inferences;
+
+CREATE TABLE IF NOT EXISTS participant_inferences_empty (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_id)
+) STRICT;
+
+CREATE TABLE IF NOT EXISTS participant_inference_payloads (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    inference_id TEXT NOT NULL,
+    prompt_payload TEXT,
+    response_payload TEXT,
+    PRIMARY KEY (epoch_id, participant_id, inference_id)
+) STRICT;
+
+CREATE TABLE IF NOT EXISTS timeline_cache (
+    id INTEGER PRIMARY KEY,
+    timeline_json TEXT NOT NULL,
+    cached_at TEXT NOT NULL
+) STRICT;
+
+CREATE TABLE IF NOT EXISTS keybase_cache (
+    identity TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    picture_url TEXT,
+    expires_at TEXT NOT NULL
+) STRICT;
+"""
+
 
 class CacheDB:
     def __init__(self, db_path: str = "cache.db"):
         self.db_path = db_path
+        self._db: Optional[aiosqlite.Connection] = None
+        self._lock = asyncio.Lock()
+        self._readers: asyncio.Queue = asyncio.Queue()
+        self._reader_count = 0
+        self._epoch_status: Dict[int, Tuple[bool, Optional[int]]] = {}
+        self._epoch_total_rewards: Dict[int, int] = {}
+        self._jail_status: Dict[int, List[Dict[str, Any]]] = {}
+        self._models_api: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._write_generations: Dict[Tuple[Any, ...], int] = {}
+    
+    def _generation(self, key: Tuple[Any, ...]) -> int:
+        return self._write_generations.get(key, 0)
+    
+    def _bump_generation(self, key: Tuple[Any, ...]) -> None:
+        self._write_generations[key] = self._write_generations.get(key, 0) + 1
+    
+    async def _get_db(self) -> aiosqlite.Connection:
+        if self._db is None:
+            db = await aiosqlite.connect(self.db_path)
+            db.row_factory = aiosqlite.Row
+            for pragma in CONNECTION_PRAGMAS:
+                await db.execute(pragma)
+            self._db = db
+        return self._db
+    
+    async def _open_reader(self) -> aiosqlite.Connection:
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        db = await aiosqlite.connect(uri, uri=True)
+        db.row_factory = aiosqlite.Row
+        for pragma in CONNECTION_PRAGMAS:
+            await db.execute(pragma)
+        return db
+    
+    @asynccontextmanager
+    async def _reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        if self._readers.empty() and self._reader_count < READER_CONNECTIONS:
+            self._reader_count += 1
+            try:
+                db = await self._open_reader()
+            except BaseException:
+                self._reader_count -= 1
+                raise
+        else:
+            db = await self._readers.get()
+        try:
+            yield db
+        finally:
+            self._readers.put_nowait(db)
+    
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
+        async with self._lock:
+            db = await self._get_db()
+            try:
+                yield db
+            except BaseException:
+                await db.rollback()
+                raise
+    
+    async def checkpoint(self):
+        async with self._connect() as db:
+            await db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
+    async def close(self):
+        while self._reader_count:
+            reader = await self._readers.get()
+            await reader.close()
+            self._reader_count -= 1
+        
+        async with self._lock:
+            if self._db is not None:
+                async with self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)"):
+                    pass
+                await self._db.close()
+                self._db = None
         
     async def initialize(self):
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS inference_stats (
-                    epoch_id INTEGER NOT NULL,
-                    height INTEGER NOT NULL,
-                    participant_index TEXT NOT NULL,
-                    stats_json TEXT NOT NULL,
-                    seed_signature TEXT,
-                    cached_at TEXT NOT NULL,
-                    PRIMARY KEY (epoch_id, height, participant_index)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_epoch_height 
-                ON inference_stats(epoch_id, height)
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS epoch_status (
-                    epoch_id INTEGER PRIMARY KEY,
-                    is_finished BOOLEAN NOT NULL,
-                    finish_height INTEGER,
-                    marked_at TEXT NOT NULL
-                )
-            """)
+        async with self._connect() as db:
+            async with db.execute("PRAGMA journal_mode=WAL"):
+                pass
             
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS jail_status (
-                    epoch_id INTEGER NOT NULL,
-                    participant_index TEXT NOT NULL,
-                    is_jailed BOOLEAN NOT NULL,
-                    jailed_until TEXT,
-                    ready_to_unjail BOOLEAN,
-                    valcons_address TEXT,
-                    moniker TEXT,
-                    identity TEXT,
-                    keybase_username TEXT,
-                    keybase_picture_url TEXT,
-                    website TEXT,
-                    validator_consensus_key TEXT,
-                    consensus_key_mismatch BOOLEAN,
-                    recorded_at TEXT NOT NULL,
-                    PRIMARY KEY (epoch_id, participant_index)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_participant_jail 
-                ON jail_status(participant_index)
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS node_health (
-                    participant_index TEXT NOT NULL,
-                    is_healthy BOOLEAN NOT NULL,
-                    last_check TEXT NOT NULL,
-                    error_message TEXT,
-                    response_time_ms INTEGER,
-                    PRIMARY KEY (participant_index)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS participant_rewards (
-                    epoch_id INTEGER NOT NULL,
-                    participant_id TEXT NOT NULL,
-                    rewarded_coins TEXT NOT NULL,
-                    claimed INTEGER NOT NULL,
-                    last_updated TEXT NOT NULL,
-                    PRIMARY KEY (epoch_id, participant_id)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_participant_rewards
-                ON participant_rewards(participant_id)
-            """)
+            await db.executescript(SCHEMA_SQL)
             
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS participant_warm_keys (
-                    epoch_id INTEGER NOT NULL,
-                    participant_id TEXT NOT NULL,
-                    grantee_address TEXT NOT NULL,
-                    granted_at TEXT NOT NULL,
-                    last_updated TEXT NOT NULL,
-                    PRIMARY KEY (epoch_id, participant_id, grantee_address)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_warm_keys_participant
-                ON participant_warm_keys(epoch_id, participant_id)
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS participant_hardware_nodes (
-                    epoch_id INTEGER NOT NULL,
-                    participant_id TEXT NOT NULL,
-                    local_id TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    models_json TEXT NOT NULL,
-                    hardware_json TEXT NOT NULL,
-                    host TEXT NOT NULL,
-                    port TEXT NOT NULL,
-                    poc_weight INTEGER,
-                    last_updated TEXT NOT NULL,
-                    PRIMARY KEY (epoch_id, participant_id, local_id)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_hardware_nodes_participant
-                ON participant_hardware_nodes(epoch_id, participant_id)
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS epoch_total_rewards (
-                    epoch_id INTEGER PRIMARY KEY,
-                    total_rewards_gnk INTEGER NOT NULL,
-                    calculated_at TEXT NOT NULL
-                )
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS models (
-                    epoch_id INTEGER NOT NULL,
-                    model_id TEXT NOT NULL,
-                    total_weight INTEGER NOT NULL,
-                    participant_count INTEGER NOT NULL,
-                    cached_at TEXT NOT NULL,
-                    PRIMARY KEY (epoch_id, model_id)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_models_epoch
-                ON models(epoch_id)
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS models_api_cache (
-                    epoch_id INTEGER NOT NULL,
-                    height INTEGER NOT NULL,
-                    models_all_json TEXT NOT NULL,
-                    models_stats_json TEXT NOT NULL,
-                    cached_at TEXT NOT NULL,
-                    PRIMARY KEY (epoch_id, height)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_models_api_epoch
-                ON models_api_cache(epoch_id)
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS participant_inferences (
-                    epoch_id INTEGER NOT NULL,
-                    participant_id TEXT NOT NULL,
-                    inference_id TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    start_block_height TEXT NOT NULL,
-                    start_block_timestamp TEXT NOT NULL,
-                    validated_by_json TEXT,
-                    prompt_hash TEXT,
-                    response_hash TEXT,
-                    prompt_payload TEXT,
-                    response_payload TEXT,
-                    prompt_token_count TEXT,
-                    completion_token_count TEXT,
-                    model TEXT,
-                    last_updated TEXT NOT NULL,
-                    PRIMARY KEY (epoch_id, participant_id, inference_id)
-                )
-            """)
-            
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_participant_inferences
-                ON participant_inferences(epoch_id, participant_id, status)
-            """)
-            
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS timeline_cache (
-                    id INTEGER PRIMARY KEY,
-                    timeline_json TEXT NOT NULL,
-                    cached_at TEXT NOT NULL
-                )
-            """)
+            async with db.execute("PRAGMA table_info(participant_inferences)") as cursor:
+                columns = {row["name"] async for row in cursor}
+            if "prompt_payload" in columns:
+                await db.execute("""
+                    INSERT OR IGNORE INTO participant_inference_payloads
+                    (epoch_id, participant_id, inference_id, prompt_payload, response_payload)
+                    SELECT epoch_id, participant_id, inference_id, prompt_payload, response_payload
+                    FROM participant_inferences
+                    WHERE prompt_payload IS NOT NULL OR response_payload IS NOT NULL
+                """)
+                await db.execute("""
+                    UPDATE participant_inferences
+                    SET prompt_payload = NULL, response_payload = NULL
+                    WHERE prompt_payload IS NOT NULL OR response_payload IS NOT NULL
+                """)
             
             await db.commit()
             logger.info(f"Database initialized at {self.db_path}")
@@ -217,11 +312,15 @@ class CacheDB:
         cached_at = datetime.utcnow().isoformat()
         stats_json = json.dumps(stats)
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute("""
-                INSERT OR REPLACE INTO inference_stats 
+                INSERT INTO inference_stats 
                 (epoch_id, height, participant_index, stats_json, seed_signature, cached_at)
                 VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(epoch_id, height, participant_index) DO UPDATE SET
+                    stats_json = excluded.stats_json,
+                    seed_signature = excluded.seed_signature,
+                    cached_at = excluded.cached_at
             """, (epoch_id, height, participant_index, stats_json, seed_signature, cached_at))
             await db.commit()
     
@@ -233,25 +332,24 @@ class CacheDB:
     ):
         cached_at = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            for stats in participants_stats:
-                participant_index = stats.get("index")
-                seed_signature = stats.get("seed_signature")
-                stats_json = json.dumps(stats)
-                
-                await db.execute("""
-                    INSERT OR REPLACE INTO inference_stats 
-                    (epoch_id, height, participant_index, stats_json, seed_signature, cached_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (epoch_id, height, participant_index, stats_json, seed_signature, cached_at))
-            
+        async with self._connect() as db:
+            await db.executemany("""
+                INSERT INTO inference_stats 
+                (epoch_id, height, participant_index, stats_json, seed_signature, cached_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(epoch_id, height, participant_index) DO UPDATE SET
+                    stats_json = excluded.stats_json,
+                    seed_signature = excluded.seed_signature,
+                    cached_at = excluded.cached_at
+            """, [
+                (epoch_id, height, stats.get("index"), json.dumps(stats), stats.get("seed_signature"), cached_at)
+                for stats in participants_stats
+            ])
             await db.commit()
             logger.info(f"Saved {len(participants_stats)} stats for epoch {epoch_id} at height {height}")
     
     async def get_stats(self, epoch_id: int, height: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self._reader() as db:
             if height is not None:
                 query = """
                     SELECT participant_index, stats_json, seed_signature, height, cached_at
@@ -283,54 +381,106 @@ class CacheDB:
                 
                 return results
     
+    async def get_participant_stats_fields(
+        self,
+        epoch_id: int,
+        participant_index: str,
+        height: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        if height is not None:
+            query = """
+                SELECT seed_signature, json_extract(stats_json, '$._ml_nodes_map') AS ml_nodes_map_json
+                FROM inference_stats
+                WHERE epoch_id = ? AND height = ? AND participant_index = ?
+            """
+            params = (epoch_id, height, participant_index)
+        else:
+            query = """
+                SELECT seed_signature, json_extract(stats_json, '$._ml_nodes_map') AS ml_nodes_map_json
+                FROM inference_stats
+                WHERE epoch_id = ? AND participant_index = ?
+                ORDER BY height DESC LIMIT 1
+            """
+            params = (epoch_id, participant_index)
+        
+        async with self._reader() as db:
+            async with db.execute(query, params) as cursor:
+                row = await cursor.fetchone()
+        
+        if not row:
+            return None
+        
+        return {
+            "seed_signature": row["seed_signature"],
+            "ml_nodes_map": json.loads(row["ml_nodes_map_json"]) if row["ml_nodes_map_json"] else {}
+        }
+    
     async def has_stats_for_epoch(self, epoch_id: int, height: Optional[int] = None) -> bool:
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._reader() as db:
             if height is not None:
-                query = "SELECT COUNT(*) as count FROM inference_stats WHERE epoch_id = ? AND height = ?"
+                query = "SELECT EXISTS(SELECT 1 FROM inference_stats WHERE epoch_id = ? AND height = ?)"
                 params = (epoch_id, height)
             else:
-                query = "SELECT COUNT(*) as count FROM inference_stats WHERE epoch_id = ?"
+                query = "SELECT EXISTS(SELECT 1 FROM inference_stats WHERE epoch_id = ?)"
                 params = (epoch_id,)
             
             async with db.execute(query, params) as cursor:
                 row = await cursor.fetchone()
-                return row[0] > 0
+                return bool(row[0])
     
     async def mark_epoch_finished(self, epoch_id: int, finish_height: int):
         marked_at = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute("""
-                INSERT OR REPLACE INTO epoch_status 
+                INSERT INTO epoch_status 
                 (epoch_id, is_finished, finish_height, marked_at)
                 VALUES (?, ?, ?, ?)
+                ON CONFLICT(epoch_id) DO UPDATE SET
+                    is_finished = excluded.is_finished,
+                    finish_height = excluded.finish_height,
+                    marked_at = excluded.marked_at
             """, (epoch_id, True, finish_height, marked_at))
             await db.commit()
+            self._bump_generation(("epoch_status", epoch_id))
+            self._epoch_status[epoch_id] = (True, finish_height)
             logger.info(f"Marked epoch {epoch_id} as finished at height {finish_height}")
     
-    async def is_epoch_finished(self, epoch_id: int) -> bool:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+    async def _get_epoch_status(self, epoch_id: int) -> Optional[Tuple[bool, Optional[int]]]:
+        cached = self._epoch_status.get(epoch_id)
+        if cached is not None:
+            return cached
+        
+        generation = self._generation(("epoch_status", epoch_id))
+        async with self._reader() as db:
             async with db.execute("""
-                SELECT is_finished FROM epoch_status WHERE epoch_id = ?
+                SELECT is_finished, finish_height FROM epoch_status WHERE epoch_id = ?
             """, (epoch_id,)) as cursor:
                 row = await cursor.fetchone()
-                return row["is_finished"] if row else False
+        
+        if not row:
+            return None
+        
+        status = (bool(row["is_finished"]), row["finish_height"])
+        if self._generation(("epoch_status", epoch_id)) == generation:
+            self._epoch_status[epoch_id] = status
+        return status
+    
+    async def is_epoch_finished(self, epoch_id: int) -> bool:
+        status = await self._get_epoch_status(epoch_id)
+        return status[0] if status else False
     
     async def get_epoch_finish_height(self, epoch_id: int) -> Optional[int]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute("""
-                SELECT finish_height FROM epoch_status WHERE epoch_id = ?
-            """, (epoch_id,)) as cursor:
-                row = await cursor.fetchone()
-                return row["finish_height"] if row else None
+        status = await self._get_epoch_status(epoch_id)
+        return status[1] if status else None
     
     async def clear_epoch_stats(self, epoch_id: int):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute("DELETE FROM inference_stats WHERE epoch_id = ?", (epoch_id,))
             await db.execute("DELETE FROM epoch_status WHERE epoch_id = ?", (epoch_id,))
             await db.commit()
+            self._bump_generation(("epoch_status", epoch_id))
+            self._epoch_status.pop(epoch_id, None)
     
     async def save_jail_status_batch(
         self,
@@ -339,15 +489,37 @@ class CacheDB:
     ):
         recorded_at = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            for status in jail_statuses:
-                await db.execute("""
-                    INSERT OR REPLACE INTO jail_status 
-                    (epoch_id, participant_index, is_jailed, jailed_until, ready_to_unjail, valcons_address, 
-                     moniker, identity, keybase_username, keybase_picture_url, website, 
-                     validator_consensus_key, consensus_key_mismatch, recorded_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+        async with self._connect() as db:
+            await db.executemany("""
+                INSERT INTO jail_status 
+                (epoch_id, participant_index, is_jailed, jailed_until, ready_to_unjail, valcons_address, 
+                 moniker, identity, keybase_username, keybase_picture_url, website, 
+                 validator_consensus_key, consensus_key_mismatch, recorded_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(epoch_id, participant_index) DO UPDATE SET
+                    is_jailed = excluded.is_jailed,
+                    jailed_until = excluded.jailed_until,
+                    ready_to_unjail = excluded.ready_to_unjail,
+                    valcons_address = excluded.valcons_address,
+                    moniker = excluded.moniker,
+                    identity = excluded.identity,
+                    keybase_username = excluded.keybase_username,
+                    keybase_picture_url = excluded.keybase_picture_url,
+                    website = excluded.website,
+                    validator_consensus_key = excluded.validator_consensus_key,
+                    consensus_key_mismatch = excluded.consensus_key_mismatch,
+                    recorded_at = excluded.recorded_at
+                WHERE (
+                    jail_status.is_jailed, jail_status.jailed_until, jail_status.ready_to_unjail, jail_status.valcons_address,
+                    jail_status.moniker, jail_status.identity, jail_status.keybase_username, jail_status.keybase_picture_url,
+                    jail_status.website, jail_status.validator_consensus_key, jail_status.consensus_key_mismatch
+                ) IS NOT (
+                    excluded.is_jailed, excluded.jailed_until, excluded.ready_to_unjail, excluded.valcons_address,
+                    excluded.moniker, excluded.identity, excluded.keybase_username, excluded.keybase_picture_url,
+                    excluded.website, excluded.validator_consensus_key, excluded.consensus_key_mismatch
+                )
+            """, [
+                (
                     epoch_id,
                     status.get("participant_index"),
                     status.get("is_jailed", False),
@@ -362,53 +534,46 @@ class CacheDB:
                     status.get("validator_consensus_key"),
                     status.get("consensus_key_mismatch"),
                     recorded_at
-                ))
-            
+                )
+                for status in jail_statuses
+            ])
             await db.commit()
+            self._bump_generation(("jail_status", epoch_id))
+            self._jail_status.pop(epoch_id, None)
             logger.info(f"Saved {len(jail_statuses)} jail statuses for epoch {epoch_id}")
     
     async def get_jail_status(self, epoch_id: int, participant_index: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            if participant_index:
-                query = """
-                    SELECT * FROM jail_status
-                    WHERE epoch_id = ? AND participant_index = ?
-                """
-                params = (epoch_id, participant_index)
-            else:
-                query = """
-                    SELECT * FROM jail_status
-                    WHERE epoch_id = ?
-                """
-                params = (epoch_id,)
-            
-            async with db.execute(query, params) as cursor:
+        statuses = self._jail_status.get(epoch_id)
+        if statuses is None:
+            generation = self._generation(("jail_status", epoch_id))
+            statuses = await self._load_jail_status(epoch_id)
+            if self._generation(("jail_status", epoch_id)) == generation:
+                if len(self._jail_status) >= JAIL_STATUS_CACHE_EPOCHS:
+                    self._jail_status.pop(next(iter(self._jail_status)))
+                self._jail_status[epoch_id] = statuses
+        
+        if participant_index:
+            statuses = [s for s in statuses if s["participant_index"] == participant_index]
+        
+        return list(statuses) if statuses else None
+    
+    async def _load_jail_status(self, epoch_id: int) -> List[Dict[str, Any]]:
+        async with self._reader() as db:
+            async with db.execute("""
+                SELECT * FROM jail_status
+                WHERE epoch_id = ?
+            """, (epoch_id,)) as cursor:
                 rows = await cursor.fetchall()
                 
-                if not rows:
-                    return None
-                
                 results = []
                 for row in rows:
-                    row_dict = dict(row)
-                    results.append({
-                        "epoch_id": row_dict["epoch_id"],
-                        "participant_index": row_dict["participant_index"],
-                        "is_jailed": bool(row_dict["is_jailed"]),
-                        "jailed_until": row_dict["jailed_until"],
-                        "ready_to_unjail": bool(row_dict["ready_to_unjail"]) if row_dict["ready_to_unjail"] is not None else None,
-                        "valcons_address": row_dict["valcons_address"],
-                        "moniker": row_dict.get("moniker"),
-                        "identity": row_dict.get("identity"),
-                        "keybase_username": row_dict.get("keybase_username"),
-                        "keybase_picture_url": row_dict.get("keybase_picture_url"),
-                        "website": row_dict.get("website"),
-                        "validator_consensus_key": row_dict.get("validator_consensus_key"),
-                        "consensus_key_mismatch": bool(row_dict.get("consensus_key_mismatch")) if row_dict.get("consensus_key_mismatch") is not None else None,
-                        "recorded_at": row_dict["recorded_at"]
-                    })
+                    status = dict(row)
+                    status["is_jailed"] = bool(status["is_jailed"])
+                    if status["ready_to_unjail"] is not None:
+                        status["ready_to_unjail"] = bool(status["ready_to_unjail"])
+                    if status["consensus_key_mismatch"] is not None:
+                        status["consensus_key_mismatch"] = bool(status["consensus_key_mismatch"])
+                    results.append(status)
                 
                 return results
     
@@ -418,27 +583,31 @@ class CacheDB:
     ):
         last_check = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            for status in health_statuses:
-                await db.execute("""
-                    INSERT OR REPLACE INTO node_health 
-                    (participant_index, is_healthy, last_check, error_message, response_time_ms)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+        async with self._connect() as db:
+            await db.executemany("""
+                INSERT INTO node_health 
+                (participant_index, is_healthy, last_check, error_message, response_time_ms)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(participant_index) DO UPDATE SET
+                    is_healthy = excluded.is_healthy,
+                    last_check = excluded.last_check,
+                    error_message = excluded.error_message,
+                    response_time_ms = excluded.response_time_ms
+            """, [
+                (
                     status.get("participant_index"),
                     status.get("is_healthy", False),
                     last_check,
                     status.get("error_message"),
                     status.get("response_time_ms")
-                ))
-            
+                )
+                for status in health_statuses
+            ])
             await db.commit()
             logger.info(f"Saved {len(health_statuses)} node health statuses")
     
     async def get_node_health(self, participant_index: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self._reader() as db:
             if participant_index:
                 query = "SELECT * FROM node_health WHERE participant_index = ?"
                 params = (participant_index,)
@@ -470,27 +639,32 @@ class CacheDB:
     ):
         last_updated = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            for reward in rewards:
-                await db.execute("""
-                    INSERT OR REPLACE INTO participant_rewards 
-                    (epoch_id, participant_id, rewarded_coins, claimed, last_updated)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+        async with self._connect() as db:
+            await db.executemany("""
+                INSERT INTO participant_rewards 
+                (epoch_id, participant_id, rewarded_coins, claimed, last_updated)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(epoch_id, participant_id) DO UPDATE SET
+                    rewarded_coins = excluded.rewarded_coins,
+                    claimed = excluded.claimed,
+                    last_updated = excluded.last_updated
+                WHERE (participant_rewards.rewarded_coins, participant_rewards.claimed)
+                    IS NOT (excluded.rewarded_coins, excluded.claimed)
+            """, [
+                (
                     reward.get("epoch_id"),
                     reward.get("participant_id"),
                     reward.get("rewarded_coins", "0"),
                     1 if reward.get("claimed") else 0,
                     last_updated
-                ))
-            
+                )
+                for reward in rewards
+            ])
             await db.commit()
             logger.info(f"Saved {len(rewards)} rewards")
     
     async def get_reward(self, epoch_id: int, participant_id: str) -> Optional[Dict[str, Any]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self._reader() as db:
             async with db.execute("""
                 SELECT * FROM participant_rewards
                 WHERE epoch_id = ? AND participant_id = ?
@@ -508,6 +682,33 @@ class CacheDB:
                     "last_updated": row["last_updated"]
                 }
     
+    async def get_rewards_bulk(
+        self,
+        epoch_ids: List[int],
+        participant_ids: List[str]
+    ) -> Dict[Tuple[int, str], Dict[str, Any]]:
+        if not epoch_ids or not participant_ids:
+            return {}
+        
+        async with self._reader() as db:
+            async with db.execute("""
+                SELECT * FROM participant_rewards
+                WHERE participant_id IN (SELECT value FROM json_each(?))
+                AND epoch_id IN (SELECT value FROM json_each(?))
+            """, (json.dumps(participant_ids), json.dumps(epoch_ids))) as cursor:
+                rows = await cursor.fetchall()
+                
+                return {
+                    (row["epoch_id"], row["participant_id"]): {
+                        "epoch_id": row["epoch_id"],
+                        "participant_id": row["participant_id"],
+                        "rewarded_coins": row["rewarded_coins"],
+                        "claimed": bool(row["claimed"]),
+                        "last_updated": row["last_updated"]
+                    }
+                    for row in rows
+                }
+    
     async def get_rewards_for_participant(
         self,
         participant_id: str,
@@ -516,18 +717,12 @@ class CacheDB:
         if not epoch_ids:
             return []
         
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            placeholders = ",".join("?" * len(epoch_ids))
-            query = f"""
+        async with self._reader() as db:
+            async with db.execute("""
                 SELECT * FROM participant_rewards
-                WHERE participant_id = ? AND epoch_id IN ({placeholders})
+                WHERE participant_id = ? AND epoch_id IN (SELECT value FROM json_each(?))
                 ORDER BY epoch_id DESC
-            """
-            params = [participant_id] + epoch_ids
-            
-            async with db.execute(query, params) as cursor:
+            """, (participant_id, json.dumps(epoch_ids))) as cursor:
                 rows = await cursor.fetchall()
                 
                 results = []
@@ -548,43 +743,61 @@ class CacheDB:
         participant_id: str,
         warm_keys: List[Dict[str, Any]]
     ):
+        await self.save_warm_keys_many(epoch_id, {participant_id: warm_keys})
+    
+    async def save_warm_keys_many(
+        self,
+        epoch_id: int,
+        warm_keys_by_participant: Dict[str, List[Dict[str, Any]]]
+    ):
+        if not warm_keys_by_participant:
+            return
+        
         last_updated = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                DELETE FROM participant_warm_keys
-                WHERE epoch_id = ? AND participant_id = ?
-            """, (epoch_id, participant_id))
-            
-            for warm_key in warm_keys:
-                await db.execute("""
-                    INSERT INTO participant_warm_keys 
-                    (epoch_id, participant_id, grantee_address, granted_at, last_updated)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+        async with self._connect() as db:
+            await db.executemany("""
+                INSERT INTO participant_warm_keys 
+                (epoch_id, participant_id, grantee_address, granted_at, last_updated)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(epoch_id, participant_id, grantee_address) DO UPDATE SET
+                    granted_at = excluded.granted_at,
+                    last_updated = excluded.last_updated
+                WHERE participant_warm_keys.granted_at IS NOT excluded.granted_at
+            """, [
+                (
                     epoch_id,
                     participant_id,
                     warm_key.get("grantee_address"),
                     warm_key.get("granted_at"),
                     last_updated
-                ))
+                )
+                for participant_id, warm_keys in warm_keys_by_participant.items()
+                for warm_key in warm_keys
+            ])
             
+            await db.executemany("""
+                DELETE FROM participant_warm_keys
+                WHERE epoch_id = ? AND participant_id = ?
+                AND grantee_address NOT IN (SELECT value FROM json_each(?))
+            """, [
+                (epoch_id, participant_id, json.dumps([wk.get("grantee_address") for wk in warm_keys]))
+                for participant_id, warm_keys in warm_keys_by_participant.items()
+            ])
             await db.commit()
-            logger.info(f"Saved {len(warm_keys)} warm keys for participant {participant_id} in epoch {epoch_id}")
+            logger.info(f"Saved warm keys for {len(warm_keys_by_participant)} participants in epoch {epoch_id}")
     
     async def get_warm_keys(
         self,
         epoch_id: int,
         participant_id: str
     ) -> Optional[List[Dict[str, Any]]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self._reader() as db:
             async with db.execute("""
                 SELECT grantee_address, granted_at
                 FROM participant_warm_keys
                 WHERE epoch_id = ? AND participant_id = ?
-                ORDER BY granted_at DESC
+                ORDER BY granted_at DESC, grantee_address
             """, (epoch_id, participant_id)) as cursor:
                 rows = await cursor.fetchall()
                 
@@ -600,52 +813,105 @@ class CacheDB:
                 
                 return results
     
+    async def get_warm_keys_bulk(
+        self,
+        epoch_id: int,
+        participant_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        if not participant_ids:
+            return {}
+        
+        async with self._reader() as db:
+            async with db.execute("""
+                SELECT participant_id, grantee_address, granted_at
+                FROM participant_warm_keys
+                WHERE epoch_id = ? AND participant_id IN (SELECT value FROM json_each(?))
+                ORDER BY participant_id, granted_at DESC, grantee_address
+            """, (epoch_id, json.dumps(participant_ids))) as cursor:
+                rows = await cursor.fetchall()
+                
+                results: Dict[str, List[Dict[str, Any]]] = {}
+                for row in rows:
+                    results.setdefault(row["participant_id"], []).append({
+                        "grantee_address": row["grantee_address"],
+                        "granted_at": row["granted_at"]
+                    })
+                
+                return results
+    
     async def save_hardware_nodes_batch(
         self,
         epoch_id: int,
         participant_id: str,
         hardware_nodes: List[Dict[str, Any]]
     ):
+        await self.save_hardware_nodes_many(epoch_id, {participant_id: hardware_nodes})
+    
+    async def save_hardware_nodes_many(
+        self,
+        epoch_id: int,
+        hardware_nodes_by_participant: Dict[str, List[Dict[str, Any]]]
+    ):
+        if not hardware_nodes_by_participant:
+            return
+        
         last_updated = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("""
-                DELETE FROM participant_hardware_nodes
-                WHERE epoch_id = ? AND participant_id = ?
-            """, (epoch_id, participant_id))
-            
-            for node in hardware_nodes:
-                models_json = json.dumps(node.get("models", []))
-                hardware_json = json.dumps(node.get("hardware", []))
-                
-                await db.execute("""
-                    INSERT INTO participant_hardware_nodes 
-                    (epoch_id, participant_id, local_id, status, models_json, hardware_json, host, port, poc_weight, last_updated)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+        async with self._connect() as db:
+            await db.executemany("""
+                INSERT INTO participant_hardware_nodes 
+                (epoch_id, participant_id, local_id, status, models_json, hardware_json, host, port, poc_weight, last_updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(epoch_id, participant_id, local_id) DO UPDATE SET
+                    status = excluded.status,
+                    models_json = excluded.models_json,
+                    hardware_json = excluded.hardware_json,
+                    host = excluded.host,
+                    port = excluded.port,
+                    poc_weight = excluded.poc_weight,
+                    last_updated = excluded.last_updated
+                WHERE (
+                    participant_hardware_nodes.status, participant_hardware_nodes.models_json,
+                    participant_hardware_nodes.hardware_json, participant_hardware_nodes.host,
+                    participant_hardware_nodes.port, participant_hardware_nodes.poc_weight
+                ) IS NOT (
+                    excluded.status, excluded.models_json, excluded.hardware_json,
+                    excluded.host, excluded.port, excluded.poc_weight
+                )
+            """, [
+                (
                     epoch_id,
                     participant_id,
                     node.get("local_id", ""),
                     node.get("status", ""),
-                    models_json,
-                    hardware_json,
+                    json.dumps(node.get("models", [])),
+                    json.dumps(node.get("hardware", [])),
                     node.get("host", ""),
                     node.get("port", ""),
                     node.get("poc_weight"),
                     last_updated
-                ))
+                )
+                for participant_id, hardware_nodes in hardware_nodes_by_participant.items()
+                for node in hardware_nodes
+            ])
             
+            await db.executemany("""
+                DELETE FROM participant_hardware_nodes
+                WHERE epoch_id = ? AND participant_id = ?
+                AND local_id NOT IN (SELECT value FROM json_each(?))
+            """, [
+                (epoch_id, participant_id, json.dumps([node.get("local_id", "") for node in hardware_nodes]))
+                for participant_id, hardware_nodes in hardware_nodes_by_participant.items()
+            ])
             await db.commit()
-            logger.info(f"Saved {len(hardware_nodes)} hardware nodes for participant {participant_id} in epoch {epoch_id}")
+            logger.info(f"Saved hardware nodes for {len(hardware_nodes_by_participant)} participants in epoch {epoch_id}")
     
     async def get_hardware_nodes(
         self,
         epoch_id: int,
         participant_id: str
     ) -> Optional[List[Dict[str, Any]]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self._reader() as db:
             async with db.execute("""
                 SELECT local_id, status, models_json, hardware_json, host, port, poc_weight
                 FROM participant_hardware_nodes
@@ -671,6 +937,61 @@ class CacheDB:
                 
                 return results
     
+    async def get_hardware_nodes_bulk(
+        self,
+        epoch_id: int,
+        participant_ids: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        if not participant_ids:
+            return {}
+        
+        async with self._reader() as db:
+            async with db.execute("""
+                SELECT participant_id, local_id, status, models_json, hardware_json, host, port, poc_weight
+                FROM participant_hardware_nodes
+                WHERE epoch_id = ? AND participant_id IN (SELECT value FROM json_each(?))
+                ORDER BY participant_id, local_id ASC
+            """, (epoch_id, json.dumps(participant_ids))) as cursor:
+                rows = await cursor.fetchall()
+                
+                results: Dict[str, List[Dict[str, Any]]] = {}
+                for row in rows:
+                    results.setdefault(row["participant_id"], []).append({
+                        "local_id": row["local_id"],
+                        "status": row["status"],
+                        "models": json.loads(row["models_json"]),
+                        "hardware": json.loads(row["hardware_json"]),
+                        "host": row["host"],
+                        "port": row["port"],
+                        "poc_weight": row["poc_weight"]
+                    })
+                
+                return results
+    
+    async def _get_uncached_participants(
+        self,
+        table: str,
+        epoch_id: int,
+        participant_ids: List[str]
+    ) -> List[str]:
+        if not participant_ids:
+            return []
+        
+        async with self._reader() as db:
+            async with db.execute(f"""
+                SELECT DISTINCT participant_id FROM {table}
+                WHERE epoch_id = ? AND participant_id IN (SELECT value FROM json_each(?))
+            """, (epoch_id, json.dumps(participant_ids))) as cursor:
+                cached = {row["participant_id"] async for row in cursor}
+        
+        return [pid for pid in participant_ids if pid not in cached]
+    
+    async def get_uncached_warm_keys_participants(self, epoch_id: int, participant_ids: List[str]) -> List[str]:
+        return await self._get_uncached_participants("participant_warm_keys", epoch_id, participant_ids)
+    
+    async def get_uncached_hardware_nodes_participants(self, epoch_id: int, participant_ids: List[str]) -> List[str]:
+        return await self._get_uncached_participants("participant_hardware_nodes", epoch_id, participant_ids)
+    
     async def save_epoch_total_rewards(
         self,
         epoch_id: int,
@@ -678,44 +999,56 @@ class CacheDB:
     ):
         calculated_at = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute("""
-                INSERT OR REPLACE INTO epoch_total_rewards 
+                INSERT INTO epoch_total_rewards 
                 (epoch_id, total_rewards_gnk, calculated_at)
                 VALUES (?, ?, ?)
+                ON CONFLICT(epoch_id) DO UPDATE SET
+                    total_rewards_gnk = excluded.total_rewards_gnk,
+                    calculated_at = excluded.calculated_at
             """, (epoch_id, total_rewards_gnk, calculated_at))
             await db.commit()
+            self._bump_generation(("epoch_total_rewards", epoch_id))
+            self._epoch_total_rewards[epoch_id] = total_rewards_gnk
             logger.info(f"Saved total rewards {total_rewards_gnk} GNK for epoch {epoch_id}")
     
     async def get_epoch_total_rewards(
         self,
         epoch_id: int
     ) -> Optional[int]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        cached = self._epoch_total_rewards.get(epoch_id)
+        if cached is not None:
+            return cached
+        
+        generation = self._generation(("epoch_total_rewards", epoch_id))
+        async with self._reader() as db:
             async with db.execute("""
                 SELECT total_rewards_gnk
                 FROM epoch_total_rewards
                 WHERE epoch_id = ?
             """, (epoch_id,)) as cursor:
                 row = await cursor.fetchone()
-                
-                if not row:
-                    return None
-                
-                return row["total_rewards_gnk"]
+        
+        if not row:
+            return None
+        
+        if self._generation(("epoch_total_rewards", epoch_id)) == generation:
+            self._epoch_total_rewards[epoch_id] = row["total_rewards_gnk"]
+        return row["total_rewards_gnk"]
     
     async def delete_epoch_total_rewards(
         self,
         epoch_id: int
     ):
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute("""
                 DELETE FROM epoch_total_rewards
                 WHERE epoch_id = ?
             """, (epoch_id,))
             await db.commit()
+            self._bump_generation(("epoch_total_rewards", epoch_id))
+            self._epoch_total_rewards.pop(epoch_id, None)
             logger.info(f"Deleted total rewards cache for epoch {epoch_id}")
     
     async def save_models_batch(
@@ -725,18 +1058,19 @@ class CacheDB:
     ):
         cached_at = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
-            for model in models_data:
-                model_id = model.get("model_id")
-                total_weight = model.get("total_weight", 0)
-                participant_count = model.get("participant_count", 0)
-                
-                await db.execute("""
-                    INSERT OR REPLACE INTO models 
-                    (epoch_id, model_id, total_weight, participant_count, cached_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (epoch_id, model_id, total_weight, participant_count, cached_at))
-            
+        async with self._connect() as db:
+            await db.executemany("""
+                INSERT INTO models 
+                (epoch_id, model_id, total_weight, participant_count, cached_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(epoch_id, model_id) DO UPDATE SET
+                    total_weight = excluded.total_weight,
+                    participant_count = excluded.participant_count,
+                    cached_at = excluded.cached_at
+            """, [
+                (epoch_id, model.get("model_id"), model.get("total_weight", 0), model.get("participant_count", 0), cached_at)
+                for model in models_data
+            ])
             await db.commit()
             logger.info(f"Saved {len(models_data)} models for epoch {epoch_id}")
     
@@ -744,9 +1078,7 @@ class CacheDB:
         self,
         epoch_id: int
     ) -> Optional[List[Dict[str, Any]]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self._reader() as db:
             async with db.execute("""
                 SELECT model_id, total_weight, participant_count, cached_at
                 FROM models
@@ -776,49 +1108,86 @@ class CacheDB:
     ):
         last_updated = datetime.utcnow().isoformat()
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
+            inference_ids = json.dumps([inference.get("inference_id") for inference in inferences])
+            payload_rows = [
+                (
+                    epoch_id,
+                    participant_id,
+                    inference.get("inference_id"),
+                    inference.get("prompt_payload"),
+                    inference.get("response_payload")
+                )
+                for inference in inferences
+                if inference.get("prompt_payload") is not None or inference.get("response_payload") is not None
+            ]
+            
             await db.execute("""
                 DELETE FROM participant_inferences
                 WHERE epoch_id = ? AND participant_id = ?
-            """, (epoch_id, participant_id))
+                AND inference_id NOT IN (SELECT value FROM json_each(?))
+            """, (epoch_id, participant_id, inference_ids))
+            await db.execute("""
+                DELETE FROM participant_inference_payloads
+                WHERE epoch_id = ? AND participant_id = ?
+                AND inference_id NOT IN (SELECT value FROM json_each(?))
+            """, (epoch_id, participant_id, json.dumps([row[2] for row in payload_rows])))
             
             if len(inferences) == 0:
                 await db.execute("""
+                    INSERT INTO participant_inferences_empty (epoch_id, participant_id, last_updated)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT(epoch_id, participant_id) DO UPDATE SET
+                        last_updated = excluded.last_updated
+                """, (epoch_id, participant_id, last_updated))
+            else:
+                await db.execute("""
+                    DELETE FROM participant_inferences_empty
+                    WHERE epoch_id = ? AND participant_id = ?
+                """, (epoch_id, participant_id))
+                await db.executemany("""
                     INSERT INTO participant_inferences 
                     (epoch_id, participant_id, inference_id, status, start_block_height, 
                      start_block_timestamp, validated_by_json, prompt_hash, response_hash,
-                     prompt_payload, response_payload, prompt_token_count, 
-                     completion_token_count, model, last_updated)
-                    VALUES (?, ?, NULL, '_EMPTY_MARKER_', '0', '0', '[]', NULL, NULL, NULL, NULL, NULL, NULL, NULL, ?)
-                """, (epoch_id, participant_id, last_updated))
-            else:
-                for inference in inferences:
-                    validated_by_json = json.dumps(inference.get("validated_by", []))
-                    
-                    await db.execute("""
-                        INSERT INTO participant_inferences 
-                        (epoch_id, participant_id, inference_id, status, start_block_height, 
-                         start_block_timestamp, validated_by_json, prompt_hash, response_hash,
-                         prompt_payload, response_payload, prompt_token_count, 
-                         completion_token_count, model, last_updated)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
+                     prompt_token_count, completion_token_count, model, last_updated)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(epoch_id, participant_id, inference_id) DO UPDATE SET
+                        status = excluded.status,
+                        start_block_height = excluded.start_block_height,
+                        start_block_timestamp = excluded.start_block_timestamp,
+                        validated_by_json = excluded.validated_by_json,
+                        prompt_hash = excluded.prompt_hash,
+                        response_hash = excluded.response_hash,
+                        prompt_token_count = excluded.prompt_token_count,
+                        completion_token_count = excluded.completion_token_count,
+                        model = excluded.model,
+                        last_updated = excluded.last_updated
+                """, [
+                    (
                         epoch_id,
                         participant_id,
                         inference.get("inference_id"),
                         inference.get("status"),
                         inference.get("start_block_height"),
                         inference.get("start_block_timestamp"),
-                        validated_by_json,
+                        json.dumps(inference.get("validated_by", [])),
                         inference.get("prompt_hash"),
                         inference.get("response_hash"),
-                        inference.get("prompt_payload"),
-                        inference.get("response_payload"),
                         inference.get("prompt_token_count"),
                         inference.get("completion_token_count"),
                         inference.get("model"),
                         last_updated
-                    ))
+                    )
+                    for inference in inferences
+                ])
+                await db.executemany("""
+                    INSERT INTO participant_inference_payloads 
+                    (epoch_id, participant_id, inference_id, prompt_payload, response_payload)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(epoch_id, participant_id, inference_id) DO UPDATE SET
+                        prompt_payload = excluded.prompt_payload,
+                        response_payload = excluded.response_payload
+                """, payload_rows)
             
             await db.commit()
             logger.info(f"Saved {len(inferences)} inferences for participant {participant_id} in epoch {epoch_id}")
@@ -826,66 +1195,95 @@ class CacheDB:
     async def get_participant_inferences(
         self,
         epoch_id: int,
-        participant_id: str
+        participant_id: str,
+        include_payloads: bool = True
     ) -> Optional[List[Dict[str, Any]]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            logger.debug(f"Querying inferences for participant {participant_id} in epoch {epoch_id}")
-            
-            async with db.execute("""
+        if include_payloads:
+            query = """
+                SELECT i.inference_id, i.status, i.start_block_height, i.start_block_timestamp,
+                       i.validated_by_json, i.prompt_hash, i.response_hash, p.prompt_payload,
+                       p.response_payload, i.prompt_token_count, i.completion_token_count, i.model
+                FROM participant_inferences i
+                LEFT JOIN participant_inference_payloads p
+                    ON p.epoch_id = i.epoch_id
+                    AND p.participant_id = i.participant_id
+                    AND p.inference_id = i.inference_id
+                WHERE i.epoch_id = ? AND i.participant_id = ?
+                ORDER BY i.start_block_timestamp DESC
+            """
+        else:
+            query = """
                 SELECT inference_id, status, start_block_height, start_block_timestamp,
-                       validated_by_json, prompt_hash, response_hash, prompt_payload,
-                       response_payload, prompt_token_count, completion_token_count, model
+                       validated_by_json, prompt_hash, response_hash, NULL AS prompt_payload,
+                       NULL AS response_payload, prompt_token_count, completion_token_count, model
                 FROM participant_inferences
                 WHERE epoch_id = ? AND participant_id = ?
                 ORDER BY start_block_timestamp DESC
+            """
+        
+        async with self._reader() as db:
+            logger.debug(f"Querying inferences for participant {participant_id} in epoch {epoch_id}")
+            
+            async with db.execute(query, (epoch_id, participant_id)) as cursor:
+                row_count = 0
+                results = []
+                async for row in cursor:
+                    row_count += 1
+                    validated_by = []
+                    if row["validated_by_json"]:
+                        try:
+                            validated_by = json.loads(row["validated_by_json"])
+                        except json.JSONDecodeError as e:
+                            logger.warning(f"Invalid JSON in validated_by for inference {row['inference_id']}: {e}")
+                    
+                    results.append({
+                        "inference_id": row["inference_id"],
+                        "status": row["status"],
+                        "start_block_height": row["start_block_height"],
+                        "start_block_timestamp": row["start_block_timestamp"],
+                        "validated_by": validated_by,
+                        "prompt_hash": row["prompt_hash"],
+                        "response_hash": row["response_hash"],
+                        "prompt_payload": row["prompt_payload"],
+                        "response_payload": row["response_payload"],
+                        "prompt_token_count": row["prompt_token_count"],
+                        "completion_token_count": row["completion_token_count"],
+                        "model": row["model"]
+                    })
+                
+                logger.debug(f"Found {row_count} rows for participant {participant_id} in epoch {epoch_id}")
+            
+            if results:
+                return results
+            
+            async with db.execute("""
+                SELECT 1 FROM participant_inferences_empty
+                WHERE epoch_id = ? AND participant_id = ?
             """, (epoch_id, participant_id)) as cursor:
+                return [] if await cursor.fetchone() else None
+    
+    async def get_inference_payloads(
+        self,
+        epoch_id: int,
+        participant_id: str,
+        inference_ids: List[str]
+    ) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        if not inference_ids:
+            return {}
+        
+        async with self._reader() as db:
+            async with db.execute("""
+                SELECT inference_id, prompt_payload, response_payload
+                FROM participant_inference_payloads
+                WHERE epoch_id = ? AND participant_id = ?
+                AND inference_id IN (SELECT value FROM json_each(?))
+            """, (epoch_id, participant_id, json.dumps(inference_ids))) as cursor:
                 rows = await cursor.fetchall()
                 
-                logger.debug(f"Found {len(rows)} rows for participant {participant_id} in epoch {epoch_id}")
-                
-                if not rows:
-                    logger.debug(f"No rows found, returning None")
-                    return None
-                
-                has_marker = any(row["status"] == "_EMPTY_MARKER_" for row in rows)
-                
-                results = []
-                for row in rows:
-                    try:
-                        if row["status"] == "_EMPTY_MARKER_":
-                            continue
-                        
-                        validated_by = []
-                        if row["validated_by_json"]:
-                            try:
-                                validated_by = json.loads(row["validated_by_json"])
-                            except json.JSONDecodeError as e:
-                                logger.warning(f"Invalid JSON in validated_by for inference {row['inference_id']}: {e}")
-                        
-                        results.append({
-                            "inference_id": row["inference_id"],
-                            "status": row["status"],
-                            "start_block_height": row["start_block_height"],
-                            "start_block_timestamp": row["start_block_timestamp"],
-                            "validated_by": validated_by,
-                            "prompt_hash": row["prompt_hash"],
-                            "response_hash": row["response_hash"],
-                            "prompt_payload": row["prompt_payload"],
-                            "response_payload": row["response_payload"],
-                            "prompt_token_count": row["prompt_token_count"],
-                            "completion_token_count": row["completion_token_count"],
-                            "model": row["model"]
-                        })
-                    except Exception as e:
-                        logger.warning(f"Failed to parse inference record {row.get('inference_id', 'unknown')}: {e}")
-                        continue
-                
-                if has_marker and not results:
-                    return []
-                
-                return results if results else None
+                return {
+                    row["inference_id"]: (row["prompt_payload"], row["response_payload"])
+                    for row in rows
+                }
     
     async def save_models_api_cache(
         self,
@@ -898,13 +1296,19 @@ class CacheDB:
         models_all_json = json.dumps(models_all)
         models_stats_json = json.dumps(models_stats)
         
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connect() as db:
             await db.execute("""
-                INSERT OR REPLACE INTO models_api_cache 
+                INSERT INTO models_api_cache 
                 (epoch_id, height, models_all_json, models_stats_json, cached_at)
                 VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(epoch_id, height) DO UPDATE SET
+                    models_all_json = excluded.models_all_json,
+                    models_stats_json = excluded.models_stats_json,
+                    cached_at = excluded.cached_at
             """, (epoch_id, height, models_all_json, models_stats_json, cached_at))
             await db.commit()
+            self._bump_generation(("models_api", epoch_id, height))
+            self._models_api.pop((epoch_id, height), None)
             logger.info(f"Cached models API data for epoch {epoch_id} at height {height}")
     
     async def get_models_api_cache(
@@ -912,56 +1316,63 @@ class CacheDB:
         epoch_id: int,
         height: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            if height is not None:
-                query = """
-                    SELECT models_all_json, models_stats_json, cached_at, height
-                    FROM models_api_cache
-                    WHERE epoch_id = ? AND height = ?
-                """
-                params = (epoch_id, height)
-            else:
-                query = """
-                    SELECT models_all_json, models_stats_json, cached_at, height
-                    FROM models_api_cache
+        if height is None:
+            async with self._reader() as db:
+                async with db.execute("""
+                    SELECT MAX(height) AS height FROM models_api_cache
                     WHERE epoch_id = ?
-                    ORDER BY height DESC
-                    LIMIT 1
-                """
-                params = (epoch_id,)
-            
-            async with db.execute(query, params) as cursor:
+                """, (epoch_id,)) as cursor:
+                    row = await cursor.fetchone()
+                    if row["height"] is None:
+                        return None
+                    height = row["height"]
+        
+        cached = self._models_api.get((epoch_id, height))
+        if cached is not None:
+            return cached
+        
+        generation = self._generation(("models_api", epoch_id, height))
+        async with self._reader() as db:
+            async with db.execute("""
+                SELECT models_all_json, models_stats_json, cached_at, height
+                FROM models_api_cache
+                WHERE epoch_id = ? AND height = ?
+            """, (epoch_id, height)) as cursor:
                 row = await cursor.fetchone()
                 
                 if not row:
                     return None
                 
-                return {
+                result = {
                     "models_all": json.loads(row["models_all_json"]),
                     "models_stats": json.loads(row["models_stats_json"]),
                     "cached_at": row["cached_at"],
                     "cached_height": row["height"]
                 }
+        
+        if self._generation(("models_api", epoch_id, height)) == generation:
+            if len(self._models_api) >= MODELS_API_CACHE_ENTRIES:
+                self._models_api.pop(next(iter(self._models_api)))
+            self._models_api[(epoch_id, height)] = result
+        return result
     
     async def save_timeline_cache(self, timeline_data: Dict[str, Any]):
         cached_at = datetime.utcnow().isoformat()
         timeline_json = json.dumps(timeline_data)
         
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("DELETE FROM timeline_cache")
+        async with self._connect() as db:
             await db.execute("""
                 INSERT INTO timeline_cache (id, timeline_json, cached_at)
                 VALUES (1, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    timeline_json = excluded.timeline_json,
+                    cached_at = excluded.cached_at
             """, (timeline_json, cached_at))
             await db.commit()
             logger.info("Cached timeline data")
     
     async def get_timeline_cache(self) -> Optional[Dict[str, Any]]:
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
+        async with self._reader() as db:
             async with db.execute("""
                 SELECT timeline_json, cached_at
                 FROM timeline_cache
@@ -976,4 +1387,46 @@ class CacheDB:
                     "timeline": json.loads(row["timeline_json"]),
                     "cached_at": row["cached_at"]
                 }
-
+    
+    async def save_keybase_batch(
+        self,
+        profiles: Dict[str, Tuple[Optional[str], Optional[str]]],
+        ttl_seconds: int = 86400
+    ):
+        expires_at = (datetime.utcnow() + timedelta(seconds=ttl_seconds)).isoformat()
+        rows = [
+            (identity, username, picture_url, expires_at)
+            for identity, (username, picture_url) in profiles.items()
+            if username
+        ]
+        
+        async with self._connect() as db:
+            await db.executemany("""
+                INSERT INTO keybase_cache 
+                (identity, username, picture_url, expires_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(identity) DO UPDATE SET
+                    username = excluded.username,
+                    picture_url = excluded.picture_url,
+                    expires_at = excluded.expires_at
+            """, rows)
+            await db.commit()
+            logger.info(f"Saved {len(rows)} Keybase profiles")
+    
+    async def get_keybase_batch(
+        self,
+        identities: List[str]
+    ) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        if not identities:
+            return {}
+        
+        now = datetime.utcnow().isoformat()
+        
+        async with self._reader() as db:
+            async with db.execute("""
+                SELECT identity, username, picture_url
+                FROM keybase_cache
+                WHERE identity IN (SELECT value FROM json_each(?)) AND expires_at > ?
+            """, (json.dumps(list(identities)), now)) as cursor:
+                rows = await cursor.fetchall()
+                return {row["identity"]: (row["username"], row["picture_url"]) for row in rows}
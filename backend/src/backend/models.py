@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, computed_field, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+from functools import cached_property
 
 
 class CurrentEpochStats(BaseModel):
@@ -40,7 +41,7 @@ class ParticipantStats(BaseModel):
     ml_nodes_map: Optional[Dict[str, int]] = None
     
     @computed_field
-    @property
+    @cached_property
     def missed_rate(self) -> float:
         missed = int(self.current_epoch_stats.missed_requests)
         inferences = int(self.current_epoch_stats.inference_count)
@@ -52,7 +53,7 @@ class ParticipantStats(BaseModel):
         return round(missed / total, 4)
     
     @computed_field
-    @property
+    @cached_property
     def invalidation_rate(self) -> float:
         invalidated = int(self.current_epoch_stats.invalidated_inferences)
         inferences = int(self.current_epoch_stats.inference_count)
@@ -75,6 +76,10 @@ class InferenceResponse(BaseModel):
     avg_block_time: Optional[float] = None
     next_poc_start_block: Optional[int] = None
     set_new_validators_block: Optional[int] = None
+    
+    @cached_property
+    def by_index(self) -> Dict[str, ParticipantStats]:
+        return {p.index: p for p in self.participants}
 
 
 class EpochParticipant(BaseModel):
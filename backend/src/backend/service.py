@@ -1,8 +1,11 @@
 import asyncio
 import logging
 import time
-from typing import Optional, List, Dict, Any
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
+from pydantic import TypeAdapter, ValidationError
 from backend.client import GonkaClient
 from backend.database import CacheDB
 from backend.models import (
@@ -25,17 +28,120 @@ from backend.models import (
 
 logger = logging.getLogger(__name__)
 
+VALOPER_PREFIX = "gonkavaloper"
+NODE_HEALTH_CONCURRENCY = 32
+REWARD_POLL_CONCURRENCY = 16
+EPOCH_PARTICIPANTS_CACHE_SIZE = 32
+PARTICIPANTS_ADAPTER = TypeAdapter(List[ParticipantStats])
+
 
 def _extract_ml_nodes_map(ml_nodes_data: List[Dict]) -> Dict[str, int]:
-    result = {}
-    for wrapper in ml_nodes_data:
-        for node in wrapper.get("ml_nodes", []):
-            node_id = node.get("node_id")
-            if node_id:
-                poc_weight = node.get("poc_weight")
-                if poc_weight is not None:
-                    result[node_id] = poc_weight
-    return result
+    return {
+        node_id: poc_weight
+        for wrapper in ml_nodes_data
+        for node in wrapper.get("ml_nodes", ())
+        if (node_id := node.get("node_id")) and (poc_weight := node.get("poc_weight")) is not None
+    }
+
+
+def _aggregate_models(participants: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    model_weights: Dict[str, int] = defaultdict(int)
+    model_participants: Dict[str, set] = defaultdict(set)
+    
+    for participant in participants:
+        participant_index = participant["index"]
+        for model, ml_nodes_entry in zip(participant.get("models", []), participant.get("ml_nodes", [])):
+            model_weights[model] += sum(ml_node.get("poc_weight", 0) for ml_node in ml_nodes_entry.get("ml_nodes", ()))
+            model_participants[model].add(participant_index)
+    
+    return [
+        {
+            "model_id": model_id,
+            "total_weight": model_weights[model_id],
+            "participant_count": len(participant_indexes)
+        }
+        for model_id, participant_indexes in model_participants.items()
+    ]
+
+
+def _ugnk_to_gnk(ugnk: str) -> int:
+    if len(ugnk) <= 9:
+        return 0
+    return int(ugnk) // 1_000_000_000
+
+
+def _build_participant_row(
+    p: Dict[str, Any],
+    epoch_participant: Dict[str, Any]
+) -> Tuple[ParticipantStats, Dict[str, Any]]:
+    weight = epoch_participant.get("weight", 0)
+    models = epoch_participant.get("models", [])
+    validator_key = epoch_participant.get("validator_key")
+    seed_signature = epoch_participant.get("seed_signature")
+    ml_nodes_map = epoch_participant.get("ml_nodes_map", {})
+    
+    participant = ParticipantStats(
+        index=p["index"],
+        address=p["address"],
+        weight=weight,
+        validator_key=validator_key,
+        inference_url=p.get("inference_url"),
+        status=p.get("status"),
+        models=models,
+        current_epoch_stats=CurrentEpochStats(**p["current_epoch_stats"]),
+        seed_signature=seed_signature,
+        ml_nodes_map=ml_nodes_map
+    )
+    stats_dict = {
+        "index": p["index"],
+        "address": p["address"],
+        "inference_url": p.get("inference_url"),
+        "status": p.get("status"),
+        "current_epoch_stats": p["current_epoch_stats"],
+        "weight": weight,
+        "models": models,
+        "validator_key": validator_key,
+        "seed_signature": seed_signature,
+        "_ml_nodes_map": ml_nodes_map
+    }
+    return participant, stats_dict
+
+
+@dataclass(slots=True)
+class ValidatorRec:
+    operator: str
+    consensus_pub: str
+    moniker: str
+    display_moniker: str
+    identity: str
+    website: str
+    tokens: int
+    jailed: bool
+
+
+def parse_validator(v: Dict[str, Any]) -> ValidatorRec:
+    consensus_pubkey = v.get("consensus_pubkey") or {}
+    description = v.get("description") or {}
+    tokens = v.get("tokens")
+    moniker = (description.get("moniker") or "").strip()
+    return ValidatorRec(
+        operator=v.get("operator_address") or "",
+        consensus_pub=consensus_pubkey.get("key") or consensus_pubkey.get("value") or "",
+        moniker=moniker,
+        display_moniker="" if moniker[:len(VALOPER_PREFIX)] == VALOPER_PREFIX else moniker,
+        identity=(description.get("identity") or "").strip(),
+        website=(description.get("website") or "").strip(),
+        tokens=int(tokens) if tokens else 0,
+        jailed=bool(v.get("jailed"))
+    )
+
+
+def filter_active_validators(validators: List[Dict[str, Any]]) -> List[ValidatorRec]:
+    return [rec for rec in map(parse_validator, validators) if rec.tokens > 0]
+
+
+def build_validator_index(validators: List[ValidatorRec]) -> Dict[str, ValidatorRec]:
+    return {rec.operator: rec for rec in validators if rec.operator}
 
 
 class InferenceService:
@@ -50,19 +156,85 @@ class InferenceService:
         self.timeline_cache_ttl: float = 30.0
         self.cache_warming_in_progress: bool = False
         self.last_cache_warm_time: Optional[float] = None
+        self._active_validators: Dict[int, Tuple[List[ValidatorRec], Dict[str, ValidatorRec]]] = {}
+        self._epoch_participants: Dict[int, Dict[str, Any]] = {}
+        self._epoch_participants_inflight: Dict[int, asyncio.Future] = {}
+        self._background_tasks: Dict[Tuple[str, int], asyncio.Task] = {}
+        self._total_rewards_complete_epoch: Optional[int] = None
+        self._epoch_models_inflight: Dict[int, asyncio.Future] = {}
+    
+    def _spawn_background(self, key: Tuple[str, int], coro) -> None:
+        if key in self._background_tasks:
+            coro.close()
+            return
+        task = asyncio.create_task(coro)
+        self._background_tasks[key] = task
+        task.add_done_callback(lambda _: self._background_tasks.pop(key, None))
+    
+    async def get_epoch_participants(self, epoch_id: int) -> Dict[str, Any]:
+        cached = self._epoch_participants.get(epoch_id)
+        if cached is not None:
+            return cached
+        
+        inflight = self._epoch_participants_inflight.get(epoch_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self.client.get_epoch_participants(epoch_id))
+            self._epoch_participants_inflight[epoch_id] = inflight
+            inflight.add_done_callback(lambda _: self._epoch_participants_inflight.pop(epoch_id, None))
+        
+        data = await asyncio.shield(inflight)
+        
+        if self.current_epoch_id is not None and epoch_id < self.current_epoch_id:
+            if len(self._epoch_participants) >= EPOCH_PARTICIPANTS_CACHE_SIZE:
+                self._epoch_participants.pop(next(iter(self._epoch_participants)))
+            self._epoch_participants[epoch_id] = data
+        return data
+    
+    async def _get_epoch_models(self, epoch_id: int, participants: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        inflight = self._epoch_models_inflight.get(epoch_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._load_epoch_models(epoch_id, participants))
+            self._epoch_models_inflight[epoch_id] = inflight
+            inflight.add_done_callback(lambda _: self._epoch_models_inflight.pop(epoch_id, None))
+        
+        return await asyncio.shield(inflight)
+    
+    async def _load_epoch_models(self, epoch_id: int, participants: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        cached_models = await self.cache_db.get_models(epoch_id)
+        if cached_models:
+            logger.info(f"Returning cached models for epoch {epoch_id}")
+            return cached_models
+        
+        logger.info(f"Fetching and aggregating models for epoch {epoch_id}")
+        models_to_cache = _aggregate_models(participants)
+        if models_to_cache:
+            await self.cache_db.save_models_batch(epoch_id, models_to_cache)
+        
+        return models_to_cache
+    
+    async def get_active_validators(self, epoch_id: int, height: Optional[int] = None) -> Tuple[List[ValidatorRec], Dict[str, ValidatorRec]]:
+        cached = self._active_validators.get(epoch_id)
+        if cached is None:
+            validators = filter_active_validators(await self.client.get_all_validators(height=height))
+            cached = (validators, build_validator_index(validators))
+            self._active_validators[epoch_id] = cached
+        return cached
+    
+    async def get_validator_index(self, epoch_id: int, height: Optional[int] = None) -> Dict[str, ValidatorRec]:
+        _, index = await self.get_active_validators(epoch_id, height)
+        return index
     
     async def _calculate_avg_block_time(self, current_height: int) -> float:
         try:
             reference_height = current_height - 10000
             
-            current_block_data = await self.client.get_block(current_height)
-            current_timestamp = current_block_data["result"]["block"]["header"]["time"]
-            
-            reference_block_data = await self.client.get_block(reference_height)
-            reference_timestamp = reference_block_data["result"]["block"]["header"]["time"]
+            current_block_data, reference_block_data = await asyncio.gather(
+                self.client.get_block(current_height),
+                self.client.get_block(reference_height)
+            )
             
-            current_dt = datetime.fromisoformat(current_timestamp.replace('Z', '+00:00'))
-            reference_dt = datetime.fromisoformat(reference_timestamp.replace('Z', '+00:00'))
+            current_dt = datetime.fromisoformat(current_block_data["result"]["block"]["header"]["time"])
+            reference_dt = datetime.fromisoformat(reference_block_data["result"]["block"]["header"]["time"])
             
             time_diff_seconds = (current_dt - reference_dt).total_seconds()
             block_diff = current_height - reference_height
@@ -86,11 +258,18 @@ class InferenceService:
             current_height = await self.client.get_latest_height()
             return requested_height if requested_height else current_height
         
-        epoch_data = await self.client.get_epoch_participants(epoch_id)
+        epoch_data, next_epoch_data = await asyncio.gather(
+            self.get_epoch_participants(epoch_id),
+            self.get_epoch_participants(epoch_id + 1),
+            return_exceptions=True
+        )
+        if isinstance(epoch_data, BaseException):
+            raise epoch_data
         effective_height = epoch_data["active_participants"]["effective_block_height"]
         
         try:
-            next_epoch_data = await self.client.get_epoch_participants(epoch_id + 1)
+            if isinstance(next_epoch_data, BaseException):
+                raise next_epoch_data
             next_effective_height = next_epoch_data["active_participants"]["effective_block_height"]
             canonical_height = next_effective_height - 10
         except Exception:
@@ -158,9 +337,12 @@ class InferenceService:
             return None
     
     async def get_current_epoch_stats(self, reload: bool = False) -> InferenceResponse:
-        current_time = time.time()
+        current_time = time.monotonic()
         cache_age = (current_time - self.last_fetch_time) if self.last_fetch_time else None
         
+        if reload:
+            self._active_validators.clear()
+        
         if not reload and self.current_epoch_data and cache_age and cache_age < 300:
             logger.info(f"Returning cached current epoch data (age: {cache_age:.1f}s)")
             return self.current_epoch_data
@@ -182,8 +364,10 @@ class InferenceService:
         
         try:
             logger.info("Fetching fresh current epoch data")
-            height = await self.client.get_latest_height()
-            epoch_data = await self.client.get_current_epoch_participants()
+            height, epoch_data = await asyncio.gather(
+                self.client.get_latest_height(),
+                self.client.get_current_epoch_participants()
+            )
             
             epoch_id = epoch_data["active_participants"]["epoch_group_id"]
             
@@ -192,10 +376,6 @@ class InferenceService:
             all_participants_data = await self.client.get_all_participants(height=height)
             participants_list = all_participants_data.get("participant", [])
             
-            active_indices = {
-                p["index"] for p in epoch_data["active_participants"]["participants"]
-            }
-            
             epoch_participant_data = {
                 p["index"]: {
                     "weight": p.get("weight", 0),
@@ -207,39 +387,19 @@ class InferenceService:
                 for p in epoch_data["active_participants"]["participants"]
             }
             
-            active_participants = [
-                p for p in participants_list if p["index"] in active_indices
-            ]
-            
             participants_stats = []
             stats_for_saving = []
-            for p in active_participants:
+            for p in participants_list:
+                epoch_participant = epoch_participant_data.get(p["index"])
+                if epoch_participant is None:
+                    continue
                 try:
-                    epoch_data_for_participant = epoch_participant_data.get(p["index"], {})
-                    
-                    participant = ParticipantStats(
-                        index=p["index"],
-                        address=p["address"],
-                        weight=epoch_data_for_participant.get("weight", 0),
-                        validator_key=epoch_data_for_participant.get("validator_key"),
-                        inference_url=p.get("inference_url"),
-                        status=p.get("status"),
-                        models=epoch_data_for_participant.get("models", []),
-                        current_epoch_stats=CurrentEpochStats(**p["current_epoch_stats"]),
-                        seed_signature=epoch_data_for_participant.get("seed_signature"),
-                        ml_nodes_map=epoch_data_for_participant.get("ml_nodes_map", {})
-                    )
-                    participants_stats.append(participant)
-                    
-                    stats_dict = p.copy()
-                    stats_dict["weight"] = epoch_data_for_participant.get("weight", 0)
-                    stats_dict["models"] = epoch_data_for_participant.get("models", [])
-                    stats_dict["validator_key"] = epoch_data_for_participant.get("validator_key")
-                    stats_dict["seed_signature"] = epoch_data_for_participant.get("seed_signature")
-                    stats_dict["_ml_nodes_map"] = epoch_data_for_participant.get("ml_nodes_map", {})
-                    stats_for_saving.append(stats_dict)
+                    participant, stats_dict = _build_participant_row(p, epoch_participant)
                 except Exception as e:
                     logger.warning(f"Failed to parse participant {p.get('index', 'unknown')}: {e}")
+                    continue
+                participants_stats.append(participant)
+                stats_for_saving.append(stats_dict)
             
             active_participants_list = epoch_data["active_participants"]["participants"]
             participants_stats = await self.merge_jail_and_health_data(epoch_id, participants_stats, height, active_participants_list)
@@ -295,7 +455,7 @@ class InferenceService:
             self.current_epoch_data = response
             self.last_fetch_time = current_time
             
-            asyncio.create_task(self.warm_participant_cache(
+            self._spawn_background(("warm cache", epoch_id), self.warm_participant_cache(
                 epoch_data["active_participants"]["participants"],
                 epoch_id,
                 batch_size=10
@@ -325,19 +485,17 @@ class InferenceService:
         if cached_stats:
             logger.info(f"Returning cached stats for epoch {epoch_id} at height {target_height}")
             
-            participants_stats = []
-            for stats_dict in cached_stats:
-                try:
-                    stats_copy = dict(stats_dict)
-                    stats_copy.pop("_cached_at", None)
-                    stats_copy.pop("_height", None)
-                    
-                    participant = ParticipantStats(**stats_copy)
-                    participants_stats.append(participant)
-                except Exception as e:
-                    logger.warning(f"Failed to parse cached participant: {e}")
+            try:
+                participants_stats = PARTICIPANTS_ADAPTER.validate_python(cached_stats)
+            except ValidationError:
+                participants_stats = []
+                for stats_dict in cached_stats:
+                    try:
+                        participants_stats.append(ParticipantStats.model_validate(stats_dict))
+                    except ValidationError as e:
+                        logger.warning(f"Failed to parse cached participant: {e}")
             
-            epoch_data = await self.client.get_epoch_participants(epoch_id)
+            epoch_data = await self.get_epoch_participants(epoch_id)
             active_participants_list = epoch_data["active_participants"]["participants"]
             participants_stats = await self.merge_jail_and_health_data(epoch_id, participants_stats, target_height, active_participants_list)
             
@@ -352,7 +510,7 @@ class InferenceService:
                     await self._calculate_and_cache_total_rewards(epoch_id)
                     total_rewards_gnk = await self.cache_db.get_epoch_total_rewards(epoch_id)
                 else:
-                    asyncio.create_task(self._calculate_and_cache_total_rewards(epoch_id))
+                    self._spawn_background(("total rewards", epoch_id), self._calculate_and_cache_total_rewards(epoch_id))
             
             return InferenceResponse(
                 epoch_id=epoch_id,
@@ -366,14 +524,12 @@ class InferenceService:
         try:
             logger.info(f"Fetching historical epoch {epoch_id} at height {target_height}")
             
-            all_participants_data = await self.client.get_all_participants(height=target_height)
+            all_participants_data, epoch_data = await asyncio.gather(
+                self.client.get_all_participants(height=target_height),
+                self.get_epoch_participants(epoch_id)
+            )
             participants_list = all_participants_data.get("participant", [])
             
-            epoch_data = await self.client.get_epoch_participants(epoch_id)
-            active_indices = {
-                p["index"] for p in epoch_data["active_participants"]["participants"]
-            }
-            
             epoch_participant_data = {
                 p["index"]: {
                     "weight": p.get("weight", 0),
@@ -385,39 +541,19 @@ class InferenceService:
                 for p in epoch_data["active_participants"]["participants"]
             }
             
-            active_participants = [
-                p for p in participants_list if p["index"] in active_indices
-            ]
-            
             participants_stats = []
             stats_for_saving = []
-            for p in active_participants:
+            for p in participants_list:
+                epoch_participant = epoch_participant_data.get(p["index"])
+                if epoch_participant is None:
+                    continue
                 try:
-                    epoch_data_for_participant = epoch_participant_data.get(p["index"], {})
-                    
-                    participant = ParticipantStats(
-                        index=p["index"],
-                        address=p["address"],
-                        weight=epoch_data_for_participant.get("weight", 0),
-                        validator_key=epoch_data_for_participant.get("validator_key"),
-                        inference_url=p.get("inference_url"),
-                        status=p.get("status"),
-                        models=epoch_data_for_participant.get("models", []),
-                        current_epoch_stats=CurrentEpochStats(**p["current_epoch_stats"]),
-                        seed_signature=epoch_data_for_participant.get("seed_signature"),
-                        ml_nodes_map=epoch_data_for_participant.get("ml_nodes_map", {})
-                    )
-                    participants_stats.append(participant)
-                    
-                    stats_dict = p.copy()
-                    stats_dict["weight"] = epoch_data_for_participant.get("weight", 0)
-                    stats_dict["models"] = epoch_data_for_participant.get("models", [])
-                    stats_dict["validator_key"] = epoch_data_for_participant.get("validator_key")
-                    stats_dict["seed_signature"] = epoch_data_for_participant.get("seed_signature")
-                    stats_dict["_ml_nodes_map"] = epoch_data_for_participant.get("ml_nodes_map", {})
-                    stats_for_saving.append(stats_dict)
+                    participant, stats_dict = _build_participant_row(p, epoch_participant)
                 except Exception as e:
                     logger.warning(f"Failed to parse participant {p.get('index', 'unknown')}: {e}")
+                    continue
+                participants_stats.append(participant)
+                stats_for_saving.append(stats_dict)
             
             await self.cache_db.save_stats_batch(
                 epoch_id=epoch_id,
@@ -432,7 +568,7 @@ class InferenceService:
             
             total_rewards_gnk = await self.cache_db.get_epoch_total_rewards(epoch_id)
             if total_rewards_gnk is None:
-                asyncio.create_task(self._calculate_and_cache_total_rewards(epoch_id))
+                self._spawn_background(("total rewards", epoch_id), self._calculate_and_cache_total_rewards(epoch_id))
             
             response = InferenceResponse(
                 epoch_id=epoch_id,
@@ -470,27 +606,15 @@ class InferenceService:
     
     async def fetch_and_cache_jail_statuses(self, epoch_id: int, height: int, active_participants: List[Dict[str, Any]]):
         try:
-            validators = await self.client.get_all_validators(height=height)
-            validators_with_tokens = [v for v in validators if v.get("tokens") and int(v.get("tokens")) > 0]
+            validator_by_operator = await self.get_validator_index(epoch_id, height)
             
-            active_indices = {p["index"] for p in active_participants}
             participant_map = {p["index"]: p for p in active_participants}
             
-            validator_by_operator = {}
-            for v in validators_with_tokens:
-                operator_address = v.get("operator_address", "")
-                if operator_address:
-                    validator_by_operator[operator_address] = v
-            
             jail_statuses = []
             now_utc = datetime.now(timezone.utc)
             
-            for participant_index in active_indices:
-                participant = participant_map.get(participant_index)
-                if not participant:
-                    continue
-                
-                valoper_address = self.client.convert_bech32_address(participant_index, "gonkavaloper")
+            for participant_index, participant in participant_map.items():
+                valoper_address = self.client.convert_bech32_address(participant_index, VALOPER_PREFIX)
                 if not valoper_address:
                     continue
                 
@@ -498,11 +622,7 @@ class InferenceService:
                 if not validator:
                     continue
                 
-                consensus_pub = (
-                    (validator.get("consensus_pubkey") or {}).get("key")
-                    or (validator.get("consensus_pubkey") or {}).get("value")
-                    or ""
-                )
+                consensus_pub = validator.consensus_pub
                 
                 participant_validator_key = participant.get("validator_key", "")
                 
@@ -510,73 +630,84 @@ class InferenceService:
                 if consensus_pub and participant_validator_key:
                     consensus_key_mismatch = consensus_pub != participant_validator_key
                 
-                is_jailed = bool(validator.get("jailed"))
+                is_jailed = validator.jailed
                 valcons_addr = self.client.pubkey_to_valcons(consensus_pub) if consensus_pub else None
                 
-                jailed_until = None
-                ready_to_unjail = False
-                
-                if is_jailed and valcons_addr:
-                    signing_info = await self.client.get_signing_info(valcons_addr, height=height)
-                    if signing_info:
-                        jailed_until_str = signing_info.get("jailed_until")
-                        if jailed_until_str and "1970-01-01" not in jailed_until_str:
-                            jailed_until = jailed_until_str
-                            try:
-                                jailed_until_dt = datetime.fromisoformat(jailed_until_str.replace("Z", "")).replace(tzinfo=timezone.utc)
-                                ready_to_unjail = now_utc > jailed_until_dt
-                            except Exception:
-                                pass
-                
-                description = validator.get("description", {})
-                moniker = description.get("moniker", "").strip()
-                identity = description.get("identity", "").strip()
-                website = description.get("website", "").strip()
-                
-                if moniker and moniker.startswith("gonkavaloper"):
-                    moniker = ""
-                
-                keybase_username = None
-                keybase_picture_url = None
-                if identity:
-                    keybase_username, keybase_picture_url = await self.client.get_keybase_info(identity)
+                moniker = validator.display_moniker
+                identity = validator.identity
+                website = validator.website
                 
                 jail_statuses.append({
                     "participant_index": participant_index,
                     "is_jailed": is_jailed,
-                    "jailed_until": jailed_until,
-                    "ready_to_unjail": ready_to_unjail,
+                    "jailed_until": None,
+                    "ready_to_unjail": False,
                     "valcons_address": valcons_addr,
                     "moniker": moniker if moniker else None,
                     "identity": identity if identity else None,
-                    "keybase_username": keybase_username,
-                    "keybase_picture_url": keybase_picture_url,
+                    "keybase_username": None,
+                    "keybase_picture_url": None,
                     "website": website if website else None,
                     "validator_consensus_key": consensus_pub if consensus_pub else None,
                     "consensus_key_mismatch": consensus_key_mismatch if consensus_pub and participant_validator_key else None
                 })
             
+            signing_info, keybase_info = await asyncio.gather(
+                self.client.get_signing_info_many(
+                    [j["valcons_address"] for j in jail_statuses if j["is_jailed"] and j["valcons_address"]],
+                    height=height
+                ),
+                self.get_keybase_profiles([j["identity"] for j in jail_statuses if j["identity"]])
+            )
+            for status in jail_statuses:
+                if status["identity"]:
+                    status["keybase_username"], status["keybase_picture_url"] = keybase_info[status["identity"]]
+                
+                info = signing_info.get(status["valcons_address"]) if status["is_jailed"] else None
+                if info:
+                    jailed_until_str = info.get("jailed_until")
+                    if jailed_until_str and "1970-01-01" not in jailed_until_str:
+                        status["jailed_until"] = jailed_until_str
+                        try:
+                            jailed_until_dt = datetime.fromisoformat(jailed_until_str.replace("Z", "")).replace(tzinfo=timezone.utc)
+                            status["ready_to_unjail"] = now_utc > jailed_until_dt
+                        except Exception:
+                            pass
+            
             await self.cache_db.save_jail_status_batch(epoch_id, jail_statuses)
             logger.info(f"Cached jail statuses for {len(jail_statuses)} participants in epoch {epoch_id}")
             
         except Exception as e:
             logger.error(f"Failed to fetch and cache jail statuses: {e}")
     
+    async def get_keybase_profiles(self, identities: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        profiles = await self.cache_db.get_keybase_batch(identities)
+        missing = [i for i in identities if i not in profiles]
+        if missing:
+            fetched = await self.client.get_keybase_info_many(missing)
+            await self.cache_db.save_keybase_batch(fetched)
+            profiles.update(fetched)
+        return profiles
+    
     async def fetch_and_cache_node_health(self, active_participants: List[Dict[str, Any]]):
         try:
-            health_statuses = []
+            semaphore = asyncio.Semaphore(NODE_HEALTH_CONCURRENCY)
             
-            for participant in active_participants:
-                participant_index = participant.get("index")
-                inference_url = participant.get("inference_url")
-                
-                if not participant_index:
+            async def probe(participant):
+                async with semaphore:
+                    return await self.client.check_node_health(participant.get("inference_url"))
+            
+            participants = [p for p in active_participants if p.get("index")]
+            results = await asyncio.gather(*[probe(p) for p in participants], return_exceptions=True)
+            
+            health_statuses = []
+            for participant, health_result in zip(participants, results):
+                if isinstance(health_result, Exception):
+                    logger.warning(f"Health check failed for {participant['index']}: {health_result}")
                     continue
                 
-                health_result = await self.client.check_node_health(inference_url)
-                
                 health_statuses.append({
-                    "participant_index": participant_index,
+                    "participant_index": participant["index"],
                     "is_healthy": health_result["is_healthy"],
                     "error_message": health_result["error_message"],
                     "response_time_ms": health_result["response_time_ms"]
@@ -655,10 +786,7 @@ class InferenceService:
             
             participant = None
             if is_current and self.current_epoch_data:
-                for p in self.current_epoch_data.participants:
-                    if p.index == participant_id:
-                        participant = p
-                        break
+                participant = self.current_epoch_data.by_index.get(participant_id)
             
             if not participant:
                 if is_current:
@@ -666,10 +794,7 @@ class InferenceService:
                 else:
                     stats = await self.get_historical_epoch_stats(epoch_id, height)
                 
-                for p in stats.participants:
-                    if p.index == participant_id:
-                        participant = p
-                        break
+                participant = stats.by_index.get(participant_id)
             
             if not participant:
                 return None
@@ -681,13 +806,14 @@ class InferenceService:
             else:
                 epoch_ids = []
             
-            rewards_data = await self.cache_db.get_rewards_for_participant(participant_id, epoch_ids) if epoch_ids else []
+            rewards_data, warm_keys_data, hardware_nodes_data = await asyncio.gather(
+                self.cache_db.get_rewards_for_participant(participant_id, epoch_ids),
+                self.cache_db.get_warm_keys(epoch_id, participant_id),
+                self.cache_db.get_hardware_nodes(epoch_id, participant_id)
+            )
             cached_epoch_ids = {r["epoch_id"] for r in rewards_data}
             missing_epoch_ids = [eid for eid in epoch_ids if eid not in cached_epoch_ids]
             
-            warm_keys_data = await self.cache_db.get_warm_keys(epoch_id, participant_id)
-            hardware_nodes_data = await self.cache_db.get_hardware_nodes(epoch_id, participant_id)
-            
             fetch_tasks = []
             
             if missing_epoch_ids:
@@ -740,20 +866,18 @@ class InferenceService:
             if hardware_nodes_data is None:
                 hardware_nodes_data = []
             
-            rewards = []
-            for reward_data in rewards_data:
-                rewarded_coins = reward_data.get("rewarded_coins", "0")
-                gnk = int(rewarded_coins) // 1_000_000_000 if rewarded_coins != "0" else 0
-                
-                rewards.append(RewardInfo(
+            rewards = [
+                RewardInfo(
                     epoch_id=reward_data["epoch_id"],
-                    assigned_reward_gnk=gnk,
+                    assigned_reward_gnk=_ugnk_to_gnk(reward_data.get("rewarded_coins", "0")),
                     claimed=reward_data["claimed"]
-                ))
-            
+                )
+                for reward_data in rewards_data
+            ]
             rewards.sort(key=lambda r: r.epoch_id, reverse=True)
             
             seed = None
+            stats_fields = None
             if participant.seed_signature:
                 seed = SeedInfo(
                     participant=participant_id,
@@ -761,18 +885,13 @@ class InferenceService:
                     signature=participant.seed_signature
                 )
             else:
-                cached_stats = await self.cache_db.get_stats(epoch_id, height)
-                if cached_stats:
-                    for s in cached_stats:
-                        if s.get("index") == participant_id:
-                            seed_sig = s.get("_seed_signature")
-                            if seed_sig:
-                                seed = SeedInfo(
-                                    participant=participant_id,
-                                    epoch_index=epoch_id,
-                                    signature=seed_sig
-                                )
-                            break
+                stats_fields = await self.cache_db.get_participant_stats_fields(epoch_id, participant_id, height)
+                if stats_fields and stats_fields["seed_signature"]:
+                    seed = SeedInfo(
+                        participant=participant_id,
+                        epoch_index=epoch_id,
+                        signature=stats_fields["seed_signature"]
+                    )
             
             warm_keys = [
                 WarmKeyInfo(
@@ -784,31 +903,23 @@ class InferenceService:
             
             ml_nodes_map = participant.ml_nodes_map if participant.ml_nodes_map else {}
             if not ml_nodes_map:
-                cached_stats = await self.cache_db.get_stats(epoch_id, height)
-                if cached_stats:
-                    for s in cached_stats:
-                        if s.get("index") == participant_id:
-                            ml_nodes_map = s.get("_ml_nodes_map", {})
-                            break
-            
-            ml_nodes = []
-            for node in (hardware_nodes_data or []):
-                local_id = node.get("local_id", "")
-                poc_weight = ml_nodes_map.get(local_id) or node.get("poc_weight")
-                
-                hardware_list = [
-                    HardwareInfo(type=hw["type"], count=hw["count"])
-                    for hw in node.get("hardware", [])
-                ]
-                ml_nodes.append(MLNodeInfo(
-                    local_id=local_id,
+                if stats_fields is None:
+                    stats_fields = await self.cache_db.get_participant_stats_fields(epoch_id, participant_id, height)
+                if stats_fields:
+                    ml_nodes_map = stats_fields["ml_nodes_map"]
+            
+            ml_nodes = [
+                MLNodeInfo(
+                    local_id=node.get("local_id", ""),
                     status=node.get("status", ""),
                     models=node.get("models", []),
-                    hardware=hardware_list,
+                    hardware=[HardwareInfo(type=hw["type"], count=hw["count"]) for hw in node.get("hardware", [])],
                     host=node.get("host", ""),
                     port=node.get("port", ""),
-                    poc_weight=poc_weight
-                ))
+                    poc_weight=ml_nodes_map.get(node.get("local_id", "")) or node.get("poc_weight")
+                )
+                for node in (hardware_nodes_data or [])
+            ]
             
             return ParticipantDetailsResponse(
                 participant=participant,
@@ -831,41 +942,45 @@ class InferenceService:
             current_epoch = epoch_data["active_participants"]["epoch_group_id"]
             participants = epoch_data["active_participants"]["participants"]
             
-            rewards_to_save = []
+            check_epochs = [current_epoch - offset for offset in range(1, 7) if current_epoch - offset > 0]
+            cached_rewards = await self.cache_db.get_rewards_bulk(
+                check_epochs,
+                [p["index"] for p in participants]
+            )
             
+            to_fetch = []
             for participant in participants:
                 participant_id = participant["index"]
+                for check_epoch in check_epochs:
+                    cached_reward = cached_rewards.get((check_epoch, participant_id))
+                    if not (cached_reward and cached_reward["claimed"]):
+                        to_fetch.append((check_epoch, participant_id))
+            
+            semaphore = asyncio.Semaphore(REWARD_POLL_CONCURRENCY)
+            
+            async def fetch_reward(check_epoch, participant_id):
+                async with semaphore:
+                    return await self.client.get_epoch_performance_summary(
+                        check_epoch,
+                        participant_id,
+                        height=height
+                    )
+            
+            results = await asyncio.gather(*[fetch_reward(e, pid) for e, pid in to_fetch], return_exceptions=True)
+            
+            rewards_to_save = []
+            for (check_epoch, participant_id), summary in zip(to_fetch, results):
+                if isinstance(summary, Exception):
+                    logger.debug(f"Failed to fetch reward for {participant_id} epoch {check_epoch}: {summary}")
+                    continue
                 
-                for epoch_offset in range(1, 7):
-                    check_epoch = current_epoch - epoch_offset
-                    if check_epoch <= 0:
-                        continue
-                    
-                    cached_reward = await self.cache_db.get_reward(check_epoch, participant_id)
-                    if cached_reward and cached_reward["claimed"]:
-                        continue
-                    
-                    try:
-                        summary = await self.client.get_epoch_performance_summary(
-                            check_epoch,
-                            participant_id,
-                            height=height
-                        )
-                        
-                        perf = summary.get("epochPerformanceSummary", {})
-                        rewarded_coins = perf.get("rewarded_coins", "0")
-                        claimed = perf.get("claimed", False)
-                        
-                        rewards_to_save.append({
-                            "epoch_id": check_epoch,
-                            "participant_id": participant_id,
-                            "rewarded_coins": rewarded_coins,
-                            "claimed": claimed
-                        })
-                        
-                    except Exception as e:
-                        logger.debug(f"Failed to fetch reward for {participant_id} epoch {check_epoch}: {e}")
-                        continue
+                perf = summary.get("epochPerformanceSummary", {})
+                rewards_to_save.append({
+                    "epoch_id": check_epoch,
+                    "participant_id": participant_id,
+                    "rewarded_coins": perf.get("rewarded_coins", "0"),
+                    "claimed": perf.get("claimed", False)
+                })
             
             if rewards_to_save:
                 await self.cache_db.save_reward_batch(rewards_to_save)
@@ -882,29 +997,25 @@ class InferenceService:
             current_epoch = epoch_data["active_participants"]["epoch_group_id"]
             participants = epoch_data["active_participants"]["participants"]
             
-            async def fetch_warm_key(participant):
-                participant_id = participant["index"]
+            participant_ids = [p["index"] for p in participants]
+            if check_cache:
+                participant_ids = await self.cache_db.get_uncached_warm_keys_participants(current_epoch, participant_ids)
+            
+            async def fetch_warm_keys(participant_id):
                 try:
-                    if check_cache:
-                        cached = await self.cache_db.get_warm_keys(current_epoch, participant_id)
-                        if cached is not None:
-                            return None
-                    
-                    warm_keys = await self.client.get_authz_grants(participant_id)
-                    await self.cache_db.save_warm_keys_batch(current_epoch, participant_id, warm_keys)
-                    logger.debug(f"Updated {len(warm_keys)} warm keys for {participant_id}")
-                    return True
+                    return await self.client.get_authz_grants(participant_id)
                 except Exception as e:
                     logger.debug(f"Failed to fetch warm keys for {participant_id}: {e}")
-                    return False
+                    return None
             
             fetched_count = 0
-            for i in range(0, len(participants), batch_size):
-                batch = participants[i:i+batch_size]
-                results = await asyncio.gather(*[fetch_warm_key(p) for p in batch], return_exceptions=True)
-                success_count = sum(1 for r in results if r is True)
-                fetched_count += success_count
-                logger.debug(f"Warm keys batch {i//batch_size + 1}: {success_count}/{len(batch)} fetched")
+            for i in range(0, len(participant_ids), batch_size):
+                batch = participant_ids[i:i+batch_size]
+                results = await asyncio.gather(*[fetch_warm_keys(pid) for pid in batch])
+                fetched = {pid: warm_keys for pid, warm_keys in zip(batch, results) if warm_keys is not None}
+                await self.cache_db.save_warm_keys_many(current_epoch, fetched)
+                fetched_count += len(fetched)
+                logger.debug(f"Warm keys batch {i//batch_size + 1}: {len(fetched)}/{len(batch)} fetched")
             
             logger.info(f"Completed warm keys polling: {fetched_count} fetched, {len(participants) - fetched_count} cached")
             
@@ -919,29 +1030,25 @@ class InferenceService:
             current_epoch = epoch_data["active_participants"]["epoch_group_id"]
             participants = epoch_data["active_participants"]["participants"]
             
-            async def fetch_hardware_node(participant):
-                participant_id = participant["index"]
+            participant_ids = [p["index"] for p in participants]
+            if check_cache:
+                participant_ids = await self.cache_db.get_uncached_hardware_nodes_participants(current_epoch, participant_ids)
+            
+            async def fetch_hardware_nodes(participant_id):
                 try:
-                    if check_cache:
-                        cached = await self.cache_db.get_hardware_nodes(current_epoch, participant_id)
-                        if cached is not None:
-                            return None
-                    
-                    hardware_nodes = await self.client.get_hardware_nodes(participant_id)
-                    await self.cache_db.save_hardware_nodes_batch(current_epoch, participant_id, hardware_nodes)
-                    logger.debug(f"Updated {len(hardware_nodes)} hardware nodes for {participant_id}")
-                    return True
+                    return await self.client.get_hardware_nodes(participant_id)
                 except Exception as e:
                     logger.debug(f"Failed to fetch hardware nodes for {participant_id}: {e}")
-                    return False
+                    return None
             
             fetched_count = 0
-            for i in range(0, len(participants), batch_size):
-                batch = participants[i:i+batch_size]
-                results = await asyncio.gather(*[fetch_hardware_node(p) for p in batch], return_exceptions=True)
-                success_count = sum(1 for r in results if r is True)
-                fetched_count += success_count
-                logger.debug(f"Hardware nodes batch {i//batch_size + 1}: {success_count}/{len(batch)} fetched")
+            for i in range(0, len(participant_ids), batch_size):
+                batch = participant_ids[i:i+batch_size]
+                results = await asyncio.gather(*[fetch_hardware_nodes(pid) for pid in batch])
+                fetched = {pid: hardware_nodes for pid, hardware_nodes in zip(batch, results) if hardware_nodes is not None}
+                await self.cache_db.save_hardware_nodes_many(current_epoch, fetched)
+                fetched_count += len(fetched)
+                logger.debug(f"Hardware nodes batch {i//batch_size + 1}: {len(fetched)}/{len(batch)} fetched")
             
             logger.info(f"Completed hardware nodes polling: {fetched_count} fetched, {len(participants) - fetched_count} cached")
             
@@ -949,7 +1056,7 @@ class InferenceService:
             logger.error(f"Error polling hardware nodes: {e}")
     
     async def warm_participant_cache(self, participants: List[Dict[str, Any]], current_epoch: int, batch_size: int = 10):
-        current_time = time.time()
+        current_time = time.monotonic()
         
         if self.cache_warming_in_progress:
             logger.debug("Cache warming already in progress, skipping")
@@ -965,44 +1072,41 @@ class InferenceService:
         try:
             logger.info(f"Starting cache warming for {len(participants)} participants")
             
-            total_warm_keys = 0
-            total_hardware = 0
+            participant_ids = [p["index"] for p in participants]
             
-            async def warm_warm_keys(participant):
-                participant_id = participant["index"]
+            uncached_warm_keys, uncached_hardware = await asyncio.gather(
+                self.cache_db.get_uncached_warm_keys_participants(current_epoch, participant_ids),
+                self.cache_db.get_uncached_hardware_nodes_participants(current_epoch, participant_ids)
+            )
+            uncached_warm_keys = set(uncached_warm_keys)
+            uncached_hardware = set(uncached_hardware)
+            
+            pending_warm_keys: Dict[str, List[Dict[str, Any]]] = {}
+            pending_hardware: Dict[str, List[Dict[str, Any]]] = {}
+            
+            async def warm_warm_keys(participant_id):
                 try:
-                    cached = await self.cache_db.get_warm_keys(current_epoch, participant_id)
-                    if cached is None:
-                        warm_keys = await self.client.get_authz_grants(participant_id)
-                        await self.cache_db.save_warm_keys_batch(current_epoch, participant_id, warm_keys)
-                        return True
+                    pending_warm_keys[participant_id] = await self.client.get_authz_grants(participant_id)
                 except Exception as e:
                     logger.debug(f"Failed to warm warm_keys for {participant_id}: {e}")
-                return False
             
-            for i in range(0, len(participants), batch_size):
-                batch = participants[i:i+batch_size]
-                results = await asyncio.gather(*[warm_warm_keys(p) for p in batch], return_exceptions=True)
-                total_warm_keys += sum(1 for r in results if r is True)
-            
-            async def warm_hardware(participant):
-                participant_id = participant["index"]
+            async def warm_hardware(participant_id):
                 try:
-                    cached = await self.cache_db.get_hardware_nodes(current_epoch, participant_id)
-                    if cached is None:
-                        hardware_nodes = await self.client.get_hardware_nodes(participant_id)
-                        await self.cache_db.save_hardware_nodes_batch(current_epoch, participant_id, hardware_nodes)
-                        return True
+                    pending_hardware[participant_id] = await self.client.get_hardware_nodes(participant_id)
                 except Exception as e:
                     logger.debug(f"Failed to warm hardware_nodes for {participant_id}: {e}")
-                return False
             
-            for i in range(0, len(participants), batch_size):
-                batch = participants[i:i+batch_size]
-                results = await asyncio.gather(*[warm_hardware(p) for p in batch], return_exceptions=True)
-                total_hardware += sum(1 for r in results if r is True)
+            for i in range(0, len(participant_ids), batch_size):
+                batch = participant_ids[i:i+batch_size]
+                await asyncio.gather(
+                    *[warm_warm_keys(pid) for pid in batch if pid in uncached_warm_keys],
+                    *[warm_hardware(pid) for pid in batch if pid in uncached_hardware]
+                )
+            
+            await self.cache_db.save_warm_keys_many(current_epoch, pending_warm_keys)
+            await self.cache_db.save_hardware_nodes_many(current_epoch, pending_hardware)
             
-            logger.info(f"Cache warming completed: {total_warm_keys} warm_keys, {total_hardware} hardware_nodes fetched")
+            logger.info(f"Cache warming completed: {len(pending_warm_keys)} warm_keys, {len(pending_hardware)} hardware_nodes fetched")
             
         except Exception as e:
             logger.error(f"Error during cache warming: {e}")
@@ -1013,40 +1117,48 @@ class InferenceService:
         try:
             logger.info(f"Calculating total assigned rewards for epoch {epoch_id}")
             
-            epoch_data = await self.client.get_epoch_participants(epoch_id)
+            epoch_data = await self.get_epoch_participants(epoch_id)
             participants = epoch_data["active_participants"]["participants"]
             
-            total_ugnk = 0
-            fetched_count = 0
-            rewards_batch = []
-            participants_with_rewards = 0
+            semaphore = asyncio.Semaphore(REWARD_POLL_CONCURRENCY)
             
-            for participant in participants:
-                participant_id = participant["index"]
-                
-                try:
-                    summary = await self.client.get_epoch_performance_summary(
-                        epoch_id,
-                        participant_id
-                    )
-                    perf = summary.get("epochPerformanceSummary", {})
-                    rewarded_coins = perf.get("rewarded_coins", "0")
-                    rewarded_amount = int(rewarded_coins)
-                    total_ugnk += rewarded_amount
-                    fetched_count += 1
-                    
-                    if rewarded_amount > 0:
-                        participants_with_rewards += 1
-                    
-                    rewards_batch.append({
-                        "epoch_id": epoch_id,
-                        "participant_id": participant_id,
-                        "rewarded_coins": rewarded_coins,
-                        "claimed": perf.get("claimed", False)
-                    })
-                except Exception as e:
-                    logger.debug(f"Could not fetch reward for {participant_id} in epoch {epoch_id}: {e}")
+            async def fetch_summary(participant_id):
+                async with semaphore:
+                    return await self.client.get_epoch_performance_summary(epoch_id, participant_id)
+            
+            participant_ids = [p["index"] for p in participants]
+            cached_rewards = await self.cache_db.get_rewards_bulk([epoch_id], participant_ids)
+            settled_amounts = [
+                int(reward["rewarded_coins"] or "0")
+                for reward in cached_rewards.values()
+                if reward["claimed"]
+            ]
+            to_fetch = [
+                pid for pid in participant_ids
+                if not cached_rewards.get((epoch_id, pid), {}).get("claimed")
+            ]
+            summaries = await asyncio.gather(*[fetch_summary(pid) for pid in to_fetch], return_exceptions=True)
+            
+            perfs: Dict[str, Dict[str, Any]] = {}
+            for participant_id, summary in zip(to_fetch, summaries):
+                if isinstance(summary, Exception):
+                    logger.debug(f"Could not fetch reward for {participant_id} in epoch {epoch_id}: {summary}")
                     continue
+                perfs[participant_id] = summary.get("epochPerformanceSummary", {})
+            
+            rewards_batch = [
+                {
+                    "epoch_id": epoch_id,
+                    "participant_id": participant_id,
+                    "rewarded_coins": perf.get("rewarded_coins") or "0",
+                    "claimed": perf.get("claimed", False)
+                }
+                for participant_id, perf in perfs.items()
+            ]
+            amounts = [int(reward["rewarded_coins"]) for reward in rewards_batch] + settled_amounts
+            total_ugnk = sum(amounts)
+            fetched_count = len(amounts)
+            participants_with_rewards = sum(1 for amount in amounts if amount > 0)
             
             if total_ugnk == 0 and fetched_count > 0:
                 logger.warning(f"Epoch {epoch_id} rewards calculation returned 0 for all {fetched_count} participants - rewards may not be available yet, skipping cache")
@@ -1059,7 +1171,7 @@ class InferenceService:
             total_gnk = total_ugnk // 1_000_000_000
             
             await self.cache_db.save_epoch_total_rewards(epoch_id, total_gnk)
-            logger.info(f"Calculated and cached total rewards for epoch {epoch_id}: {total_gnk} GNK from {fetched_count}/{len(participants)} participants ({participants_with_rewards} with rewards)")
+            logger.info(f"Calculated and cached total rewards for epoch {epoch_id}: {total_gnk} GNK from {fetched_count}/{len(participants)} participants ({participants_with_rewards} with rewards, {len(settled_amounts)} from cache)")
             
         except Exception as e:
             logger.error(f"Error calculating epoch total rewards for epoch {epoch_id}: {e}")
@@ -1071,6 +1183,11 @@ class InferenceService:
             latest_info = await self.client.get_latest_epoch()
             current_epoch_id = latest_info["latest_epoch"]["index"]
             
+            if current_epoch_id == self._total_rewards_complete_epoch:
+                logger.debug(f"Total rewards for epochs before {current_epoch_id} already cached")
+                return
+            
+            complete = True
             for offset in range(1, 6):
                 epoch_id = current_epoch_id - offset
                 if epoch_id <= 0:
@@ -1087,14 +1204,18 @@ class InferenceService:
                 
                 logger.info(f"Calculating total rewards for epoch {epoch_id}")
                 await self._calculate_and_cache_total_rewards(epoch_id)
+                if not await self.cache_db.get_epoch_total_rewards(epoch_id):
+                    complete = False
             
+            if complete:
+                self._total_rewards_complete_epoch = current_epoch_id
             logger.info("Completed epoch total rewards polling")
             
         except Exception as e:
             logger.error(f"Error polling epoch total rewards: {e}")
     
     async def get_timeline(self):
-        current_time = time.time()
+        current_time = time.monotonic()
         
         if (self.timeline_cache is not None and 
             self.timeline_cache_time is not None and
@@ -1126,25 +1247,28 @@ class InferenceService:
                     logger.warning(f"Failed to parse cached timeline data: {e}")
         
         logger.info("Fetching fresh timeline data")
-        current_height = await self.client.get_latest_height()
-        current_block_data = await self.client.get_block(current_height)
-        current_timestamp = current_block_data["result"]["block"]["header"]["time"]
-        
+        current_height, restrictions_data, latest_epoch_info = await asyncio.gather(
+            self.client.get_latest_height(),
+            self.client.get_restrictions_params(),
+            self.client.get_latest_epoch()
+        )
         reference_height = current_height - 10000
-        reference_block_data = await self.client.get_block(reference_height)
+        current_block_data, reference_block_data = await asyncio.gather(
+            self.client.get_block(current_height),
+            self.client.get_block(reference_height)
+        )
+        current_timestamp = current_block_data["result"]["block"]["header"]["time"]
         reference_timestamp = reference_block_data["result"]["block"]["header"]["time"]
         
-        current_dt = datetime.fromisoformat(current_timestamp.replace('Z', '+00:00'))
-        reference_dt = datetime.fromisoformat(reference_timestamp.replace('Z', '+00:00'))
+        current_dt = datetime.fromisoformat(current_timestamp)
+        reference_dt = datetime.fromisoformat(reference_timestamp)
         
         time_diff_seconds = (current_dt - reference_dt).total_seconds()
         block_diff = current_height - reference_height
         avg_block_time = round(time_diff_seconds / block_diff, 2)
         
-        restrictions_data = await self.client.get_restrictions_params()
         restrictions_end_block = int(restrictions_data["params"]["restriction_end_block"])
         
-        latest_epoch_info = await self.client.get_latest_epoch()
         current_epoch_start = latest_epoch_info["latest_epoch"]["poc_start_block_height"]
         current_epoch_index = latest_epoch_info["latest_epoch"]["index"]
         epoch_length = latest_epoch_info["epoch_params"]["epoch_length"]
@@ -1228,13 +1352,14 @@ class InferenceService:
                     validation_threshold=model.get("validation_threshold", {})
                 ))
             
-            stats_info = []
-            for stat in stats_list:
-                stats_info.append(ModelStats(
+            stats_info = [
+                ModelStats(
                     model=stat.get("model", ""),
                     ai_tokens=stat.get("ai_tokens", "0"),
                     inferences=stat.get("inferences", 0)
-                ))
+                )
+                for stat in stats_list
+            ]
             
             current_block_timestamp = None
             avg_block_time = None
@@ -1253,48 +1378,13 @@ class InferenceService:
                 avg_block_time=avg_block_time
             )
         
-        epoch_data = await self.client.get_current_epoch_participants()
+        epoch_data, height = await asyncio.gather(
+            self.client.get_current_epoch_participants(),
+            self.client.get_latest_height()
+        )
         participants = epoch_data["active_participants"]["participants"]
-        height = await self.client.get_latest_height()
-        
-        cached_models = await self.cache_db.get_models(epoch_id)
         
-        if cached_models:
-            logger.info(f"Returning cached models for epoch {epoch_id}")
-        else:
-            logger.info(f"Fetching and aggregating models for epoch {epoch_id}")
-            
-            model_weights: Dict[str, int] = {}
-            model_participant_count: Dict[str, set] = {}
-            
-            for participant in participants:
-                participant_index = participant["index"]
-                models = participant.get("models", [])
-                ml_nodes_high_level = participant.get("ml_nodes", [])
-                
-                for model, ml_nodes_entry in zip(models, ml_nodes_high_level):
-                    if model not in model_weights:
-                        model_weights[model] = 0
-                        model_participant_count[model] = set()
-                    
-                    for ml_node in ml_nodes_entry.get("ml_nodes", []):
-                        poc_weight = ml_node.get("poc_weight", 0)
-                        model_weights[model] += poc_weight
-                    
-                    model_participant_count[model].add(participant_index)
-            
-            models_to_cache = []
-            for model_id in model_weights:
-                models_to_cache.append({
-                    "model_id": model_id,
-                    "total_weight": model_weights[model_id],
-                    "participant_count": len(model_participant_count[model_id])
-                })
-            
-            if models_to_cache:
-                await self.cache_db.save_models_batch(epoch_id, models_to_cache)
-            
-            cached_models = models_to_cache
+        cached_models = await self._get_epoch_models(epoch_id, participants)
         
         cached_api_data = await self.cache_db.get_models_api_cache(epoch_id)
         
@@ -1305,8 +1395,10 @@ class InferenceService:
             models_stats_data = cached_api_data["models_stats"]
         else:
             logger.info(f"Fetching fresh models API data for epoch {epoch_id} at height {height}")
-            models_all_data = await self.client.get_models_all()
-            models_stats_data = await self.client.get_models_stats()
+            models_all_data, models_stats_data = await asyncio.gather(
+                self.client.get_models_all(),
+                self.client.get_models_stats()
+            )
             
             await self.cache_db.save_models_api_cache(
                 epoch_id, height, models_all_data, models_stats_data
@@ -1315,7 +1407,6 @@ class InferenceService:
         stats_list = models_stats_data.get("stats_models", [])
         models_list = models_all_data.get("model", [])
         
-        models_dict = {m["id"]: m for m in models_list}
         cached_dict = {m["model_id"]: m for m in cached_models} if cached_models else {}
         
         models_info = []
@@ -1337,13 +1428,14 @@ class InferenceService:
                 validation_threshold=model.get("validation_threshold", {})
             ))
         
-        stats_info = []
-        for stat in stats_list:
-            stats_info.append(ModelStats(
+        stats_info = [
+            ModelStats(
                 model=stat.get("model", ""),
                 ai_tokens=stat.get("ai_tokens", "0"),
                 inferences=stat.get("inferences", 0)
-            ))
+            )
+            for stat in stats_list
+        ]
         
         current_block_timestamp = None
         avg_block_time = None
@@ -1363,48 +1455,11 @@ class InferenceService:
         )
     
     async def get_historical_models(self, epoch_id: int, height: Optional[int] = None) -> ModelsResponse:
-        epoch_data = await self.client.get_epoch_participants(epoch_id)
+        epoch_data = await self.get_epoch_participants(epoch_id)
         participants = epoch_data["active_participants"]["participants"]
         target_height = await self.get_canonical_height(epoch_id, height)
         
-        cached_models = await self.cache_db.get_models(epoch_id)
-        
-        if cached_models:
-            logger.info(f"Returning cached models for epoch {epoch_id}")
-        else:
-            logger.info(f"Fetching and aggregating models for epoch {epoch_id}")
-            
-            model_weights: Dict[str, int] = {}
-            model_participant_count: Dict[str, set] = {}
-            
-            for participant in participants:
-                participant_index = participant["index"]
-                models = participant.get("models", [])
-                ml_nodes_high_level = participant.get("ml_nodes", [])
-                
-                for model, ml_nodes_entry in zip(models, ml_nodes_high_level):
-                    if model not in model_weights:
-                        model_weights[model] = 0
-                        model_participant_count[model] = set()
-                    
-                    for ml_node in ml_nodes_entry.get("ml_nodes", []):
-                        poc_weight = ml_node.get("poc_weight", 0)
-                        model_weights[model] += poc_weight
-                    
-                    model_participant_count[model].add(participant_index)
-            
-            models_to_cache = []
-            for model_id in model_weights:
-                models_to_cache.append({
-                    "model_id": model_id,
-                    "total_weight": model_weights[model_id],
-                    "participant_count": len(model_participant_count[model_id])
-                })
-            
-            if models_to_cache:
-                await self.cache_db.save_models_batch(epoch_id, models_to_cache)
-            
-            cached_models = models_to_cache
+        cached_models = await self._get_epoch_models(epoch_id, participants)
         
         cached_api_data = await self.cache_db.get_models_api_cache(epoch_id, target_height)
         
@@ -1414,8 +1469,10 @@ class InferenceService:
             models_stats_data = cached_api_data["models_stats"]
         else:
             logger.info(f"Fetching fresh models API data for historical epoch {epoch_id} at height {target_height}")
-            models_all_data = await self.client.get_models_all()
-            models_stats_data = await self.client.get_models_stats()
+            models_all_data, models_stats_data = await asyncio.gather(
+                self.client.get_models_all(),
+                self.client.get_models_stats()
+            )
             
             await self.cache_db.save_models_api_cache(
                 epoch_id, target_height, models_all_data, models_stats_data
@@ -1424,7 +1481,6 @@ class InferenceService:
         stats_list = models_stats_data.get("stats_models", [])
         models_list = models_all_data.get("model", [])
         
-        models_dict = {m["id"]: m for m in models_list}
         cached_dict = {m["model_id"]: m for m in cached_models} if cached_models else {}
         
         models_info = []
@@ -1446,13 +1502,14 @@ class InferenceService:
                 validation_threshold=model.get("validation_threshold", {})
             ))
         
-        stats_info = []
-        for stat in stats_list:
-            stats_info.append(ModelStats(
+        stats_info = [
+            ModelStats(
                 model=stat.get("model", ""),
                 ai_tokens=stat.get("ai_tokens", "0"),
                 inferences=stat.get("inferences", 0)
-            ))
+            )
+            for stat in stats_list
+        ]
         
         current_block_timestamp = None
         avg_block_time = None
@@ -1611,7 +1668,8 @@ class InferenceService:
             
             cached_inferences = await self.cache_db.get_participant_inferences(
                 epoch_id=epoch_id,
-                participant_id=participant_id
+                participant_id=participant_id,
+                include_payloads=False
             )
             
             logger.info(f"Cache result for {participant_id} epoch {epoch_id}: {type(cached_inferences)} with {len(cached_inferences) if cached_inferences is not None else 'None'} items")
@@ -1653,12 +1711,24 @@ class InferenceService:
             if skipped_count > 0:
                 logger.warning(f"Skipped {skipped_count} invalid inference records for {participant_id} in epoch {epoch_id}")
             
+            successful = successful[:10]
+            expired = expired[:10]
+            invalidated = invalidated[:10]
+            shown = successful + expired + invalidated
+            payloads = await self.cache_db.get_inference_payloads(
+                epoch_id,
+                participant_id,
+                [inf["inference_id"] for inf in shown]
+            )
+            for inf in shown:
+                inf["prompt_payload"], inf["response_payload"] = payloads.get(inf["inference_id"], (None, None))
+            
             return {
                 "epoch_id": epoch_id,
                 "participant_id": participant_id,
-                "successful": successful[:10],
-                "expired": expired[:10],
-                "invalidated": invalidated[:10],
+                "successful": successful,
+                "expired": expired,
+                "invalidated": invalidated,
                 "cached_at": datetime.utcnow().isoformat() if cached_inferences is not None else None
             }
             
@@ -1677,12 +1747,13 @@ class InferenceService:
         try:
             logger.info("Polling models API cache")
             
-            epoch_data = await self.client.get_current_epoch_participants()
+            epoch_data, height, models_all_data, models_stats_data = await asyncio.gather(
+                self.client.get_current_epoch_participants(),
+                self.client.get_latest_height(),
+                self.client.get_models_all(),
+                self.client.get_models_stats()
+            )
             epoch_id = epoch_data["active_participants"]["epoch_group_id"]
-            height = await self.client.get_latest_height()
-            
-            models_all_data = await self.client.get_models_all()
-            models_stats_data = await self.client.get_models_stats()
             
             await self.cache_db.save_models_api_cache(
                 epoch_id, height, models_all_data, models_stats_data
@@ -0,0 +1,137 @@
+import asyncio
+import pytest
+from backend import app as app_module
+
+
+class FakeClient:
+    def __init__(self):
+        self.snapshot_calls = 0
+    
+    async def get_current_epoch_participants(self):
+        self.snapshot_calls += 1
+        return {"active_participants": {"epoch_group_id": 7, "participants": []}}
+    
+    async def get_latest_height(self):
+        return 1000
+
+
+class FakeService:
+    def __init__(self):
+        self.client = FakeClient()
+
+
+@pytest.mark.asyncio
+async def test_poller_loop_shares_snapshot_between_due_jobs(monkeypatch):
+    calls = []
+    
+    async def job_a(epoch_data, height):
+        calls.append(("a", epoch_data["active_participants"]["epoch_group_id"], height))
+    
+    async def job_b(epoch_data, height):
+        calls.append(("b", epoch_data["active_participants"]["epoch_group_id"], height))
+    
+    async def job_c(epoch_data, height):
+        calls.append(("c", height))
+    
+    service = FakeService()
+    monkeypatch.setattr(app_module, "inference_service_instance", service)
+    monkeypatch.setattr(app_module, "POLL_JITTER", 0)
+    monkeypatch.setattr(app_module, "POLL_JOBS", [
+        ("a", job_a, 0, 60, True),
+        ("b", job_b, 0, 60, True),
+        ("c", job_c, 0, 60, False),
+    ])
+    
+    task = asyncio.create_task(app_module.poller_loop())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    assert service.client.snapshot_calls == 1
+    assert sorted(calls, key=lambda c: c[0]) == [("a", 7, 1000), ("b", 7, 1000), ("c", None)]
+
+
+@pytest.mark.asyncio
+async def test_poller_loop_does_not_wait_for_slow_snapshot(monkeypatch):
+    calls = []
+    
+    class SlowClient(FakeClient):
+        async def get_latest_height(self):
+            await asyncio.sleep(10)
+            return 1000
+    
+    async def snapshot_job(epoch_data, height):
+        calls.append("snapshot")
+    
+    async def plain_job(epoch_data, height):
+        calls.append("plain")
+    
+    service = FakeService()
+    service.client = SlowClient()
+    monkeypatch.setattr(app_module, "inference_service_instance", service)
+    monkeypatch.setattr(app_module, "POLL_JITTER", 0)
+    monkeypatch.setattr(app_module, "POLL_MIN_TIMEOUT", 0.05)
+    monkeypatch.setattr(app_module, "POLL_JOBS", [
+        ("snapshot", snapshot_job, 0, 60, True),
+        ("plain", plain_job, 0, 60, False),
+        ("later", plain_job, 0.02, 60, False),
+    ])
+    
+    task = asyncio.create_task(app_module.poller_loop())
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    assert calls == ["plain", "plain"]
+
+
+@pytest.mark.asyncio
+async def test_poller_loop_skips_overlapping_runs(monkeypatch):
+    started = []
+    
+    async def slow_job(epoch_data, height):
+        started.append(height)
+        await asyncio.sleep(10)
+    
+    monkeypatch.setattr(app_module, "inference_service_instance", FakeService())
+    monkeypatch.setattr(app_module, "POLL_JITTER", 0)
+    monkeypatch.setattr(app_module, "POLL_JOBS", [("slow", slow_job, 0, 0.01, False)])
+    
+    task = asyncio.create_task(app_module.poller_loop())
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    
+    assert len(started) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_poll_job_times_out(monkeypatch, caplog):
+    async def stuck_job(epoch_data, height):
+        await asyncio.sleep(10)
+    
+    monkeypatch.setattr(app_module, "inference_service_instance", FakeService())
+    monkeypatch.setattr(app_module, "POLL_MIN_TIMEOUT", 0)
+    
+    await app_module.run_poll_job("stuck", stuck_job, 0.01, None, None)
+    
+    assert "Stuck polling timed out" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_run_poll_job_lets_inference_paging_finish(monkeypatch):
+    finished = []
+    
+    async def long_paging_job(epoch_data, height):
+        await asyncio.sleep(0.05)
+        finished.append(True)
+    
+    monkeypatch.setattr(app_module, "inference_service_instance", FakeService())
+    monkeypatch.setattr(app_module, "POLL_MIN_TIMEOUT", 0)
+    
+    await app_module.run_poll_job("participant inferences", long_paging_job, 0.01, None, None)
+    
+    assert finished == [True]
@@ -1,7 +1,10 @@
 import pytest
+import asyncio
 import json
+import time
 from pathlib import Path
-from backend.client import GonkaClient
+from backend import client as client_module
+from backend.client import GonkaClient, _convert_bech32_address, _decode_bech32, _pubkey_to_valcons
 
 
 @pytest.fixture
@@ -76,6 +79,128 @@ def test_url_rotation():
     assert client._get_current_url() == "http://node1.example.com"
 
 
+@pytest.mark.asyncio
+async def test_client_reuses_http_session():
+    async with GonkaClient(base_urls=["http://node1.example.com"]) as client:
+        http = client._get_http()
+        assert client._get_http() is http
+    
+    assert http.is_closed
+    assert client._http is None
+
+
+@pytest.mark.asyncio
+async def test_keybase_info_served_from_cache():
+    client = GonkaClient(base_urls=["http://node1.example.com"])
+    client._keybase_cache["ABC"] = (time.monotonic() + 60, ("alice", "https://keybase.io/alice/picture?size=96"))
+    
+    result = await client.get_keybase_info_many(["ABC", "ABC", ""])
+    
+    assert result == {"ABC": ("alice", "https://keybase.io/alice/picture?size=96")}
+
+
+@pytest.mark.asyncio
+async def test_keybase_cache_evicts_oldest(monkeypatch):
+    client = GonkaClient(base_urls=["http://node1.example.com"])
+    monkeypatch.setattr(client_module, "KEYBASE_CACHE_SIZE", 2)
+    
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+        
+        def json(self):
+            return {"status": {"code": 0}, "them": []}
+    
+    class FakeHttp:
+        async def get(self, url, timeout=None):
+            return FakeResponse()
+    
+    monkeypatch.setattr(client, "_get_http", lambda: FakeHttp())
+    
+    for identity in ["A", "B", "C"]:
+        await client.get_keybase_info(identity)
+    
+    assert list(client._keybase_cache) == ["B", "C"]
+
+
+@pytest.mark.asyncio
+async def test_latest_height_coalesced_within_ttl(monkeypatch):
+    client = GonkaClient(base_urls=["http://node1.example.com"])
+    calls = []
+    
+    async def fake_make_request(path, params=None, headers=None):
+        calls.append(path)
+        await asyncio.sleep(0)
+        return {"result": {"sync_info": {"latest_block_height": str(100 + len(calls))}}}
+    
+    monkeypatch.setattr(client, "_make_request", fake_make_request)
+    
+    heights = await asyncio.gather(*[client.get_latest_height() for _ in range(5)])
+    assert heights == [101] * 5
+    assert await client.get_latest_height() == 101
+    assert len(calls) == 1
+    
+    client._rpc_cache["get_latest_height"] = (0.0, client._rpc_cache["get_latest_height"][1])
+    assert await client.get_latest_height() == 102
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_block_memoized_by_height(monkeypatch):
+    client = GonkaClient(base_urls=["http://node1.example.com"])
+    calls = []
+    
+    async def fake_make_request(path, params=None, headers=None):
+        calls.append(path)
+        return {"result": {"block": {"header": {"time": "2025-01-01T00:00:00.123456789Z"}}}}
+    
+    monkeypatch.setattr(client, "_make_request", fake_make_request)
+    
+    first = await client.get_block(100)
+    assert await client.get_block(100) is first
+    await client.get_block(101)
+    assert calls == ["/chain-rpc/block?height=100", "/chain-rpc/block?height=101"]
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_drops_failed_requests(monkeypatch):
+    client = GonkaClient(base_urls=["http://node1.example.com"])
+    responses = [Exception("boom"), {"epoch": 7}]
+    
+    async def fake_make_request(path, params=None, headers=None):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
+    monkeypatch.setattr(client, "_make_request", fake_make_request)
+    
+    with pytest.raises(Exception, match="boom"):
+        await client.get_latest_epoch()
+    assert "get_latest_epoch" not in client._rpc_cache
+    assert await client.get_latest_epoch() == {"epoch": 7}
+
+
+@pytest.mark.asyncio
+async def test_signing_info_many_fetches_unique_addresses(monkeypatch):
+    client = GonkaClient(base_urls=["http://node1.example.com"])
+    calls = []
+    
+    async def fake_get_signing_info(valcons_addr, height=None):
+        calls.append((valcons_addr, height))
+        return {"jailed_until": f"until-{valcons_addr}"}
+    
+    monkeypatch.setattr(client, "get_signing_info", fake_get_signing_info)
+    
+    result = await client.get_signing_info_many(["valcons1a", "valcons1b", "valcons1a", ""], height=42)
+    
+    assert result == {
+        "valcons1a": {"jailed_until": "until-valcons1a"},
+        "valcons1b": {"jailed_until": "until-valcons1b"}
+    }
+    assert calls == [("valcons1a", 42), ("valcons1b", 42)]
+
+
 @pytest.mark.asyncio
 async def test_client_live_connection():
     client = GonkaClient(base_urls=["http://node2.gonka.ai:8000"])
@@ -163,3 +288,66 @@ def test_performance_summary_structure(performance_summary_data):
     assert "rewarded_coins" in summary
     assert "claimed" in summary
 
+
+
+def test_convert_bech32_address_to_valoper():
+    address = "gonka14cu38xpsd8pz5zdkkzwf0jwtpc0vv309ake364"
+    
+    valoper = GonkaClient.convert_bech32_address(address, "gonkavaloper")
+    
+    assert valoper.startswith("gonkavaloper1")
+    assert GonkaClient.convert_bech32_address(valoper, "gonka") == address
+
+
+def test_convert_bech32_address_same_prefix():
+    address = "gonka14cu38xpsd8pz5zdkkzwf0jwtpc0vv309ake364"
+    
+    assert GonkaClient.convert_bech32_address(address, "gonka") == address
+
+
+def test_convert_bech32_address_reuses_decoded_data():
+    address = "gonka1qqyc9gsld2666kpunherra8rx2efwg4v8wafg3"
+    _convert_bech32_address.cache_clear()
+    _decode_bech32.cache_clear()
+    
+    GonkaClient.convert_bech32_address(address, "gonkavaloper")
+    GonkaClient.convert_bech32_address(address, "gonkavalcons")
+    
+    info = _decode_bech32.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_convert_bech32_address_invalid():
+    assert GonkaClient.convert_bech32_address("not-an-address", "gonkavaloper") is None
+
+
+@pytest.mark.asyncio
+async def test_iter_validators_follows_pagination(monkeypatch):
+    client = GonkaClient(base_urls=["http://node1.example.com"])
+    pages = {
+        "": {"validators": [{"operator_address": "a"}, {"operator_address": "b"}], "pagination": {"next_key": "k1"}},
+        "k1": {"validators": [{"operator_address": "c"}], "pagination": {"next_key": None}},
+    }
+    requested = []
+    
+    async def fake_page(next_key, headers):
+        requested.append((next_key, headers))
+        return pages[next_key]
+    
+    monkeypatch.setattr(client, "_get_validators_page", fake_page)
+    
+    validators = await client.get_all_validators(height=100)
+    
+    assert [v["operator_address"] for v in validators] == ["a", "b", "c"]
+    assert requested == [("", {"X-Cosmos-Block-Height": "100"}), ("k1", {"X-Cosmos-Block-Height": "100"})]
+
+
+def test_pubkey_to_valcons_memoized():
+    test_pubkey = "rmvB2e5PUzAl0rbGnb1sN3UExYSzQBAgC1CaBGfOMQk="
+    
+    first = GonkaClient.pubkey_to_valcons(test_pubkey)
+    hits = _pubkey_to_valcons.cache_info().hits
+    
+    assert GonkaClient.pubkey_to_valcons(test_pubkey) == first
+    assert _pubkey_to_valcons.cache_info().hits == hits + 1
@@ -2,6 +2,10 @@ import pytest
 import pytest_asyncio
 import tempfile
 import os
+import asyncio
+import sqlite3
+import aiosqlite
+from contextlib import asynccontextmanager
 from backend.database import CacheDB
 
 
@@ -15,6 +19,7 @@ async def db():
     
     yield cache_db
     
+    await cache_db.close()
     if os.path.exists(db_path):
         os.unlink(db_path)
 
@@ -24,6 +29,155 @@ async def test_database_initialization(db):
     assert os.path.exists(db.db_path)
 
 
+BASELINE_SCHEMA_SQL = """
+CREATE TABLE inference_stats (
+    epoch_id INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    participant_index TEXT NOT NULL,
+    stats_json TEXT NOT NULL,
+    seed_signature TEXT,
+    cached_at TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, height, participant_index)
+);
+CREATE INDEX idx_epoch_height ON inference_stats(epoch_id, height);
+CREATE TABLE participant_rewards (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    rewarded_coins TEXT NOT NULL,
+    claimed INTEGER NOT NULL,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_id)
+);
+CREATE INDEX idx_participant_rewards ON participant_rewards(participant_id);
+CREATE TABLE participant_warm_keys (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    grantee_address TEXT NOT NULL,
+    granted_at TEXT NOT NULL,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_id, grantee_address)
+);
+CREATE INDEX idx_warm_keys_participant ON participant_warm_keys(epoch_id, participant_id);
+CREATE TABLE participant_hardware_nodes (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    local_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    models_json TEXT NOT NULL,
+    hardware_json TEXT NOT NULL,
+    host TEXT NOT NULL,
+    port TEXT NOT NULL,
+    poc_weight INTEGER,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_id, local_id)
+);
+CREATE INDEX idx_hardware_nodes_participant ON participant_hardware_nodes(epoch_id, participant_id);
+CREATE TABLE models (
+    epoch_id INTEGER NOT NULL,
+    model_id TEXT NOT NULL,
+    total_weight INTEGER NOT NULL,
+    participant_count INTEGER NOT NULL,
+    cached_at TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, model_id)
+);
+CREATE INDEX idx_models_epoch ON models(epoch_id);
+CREATE TABLE models_api_cache (
+    epoch_id INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    models_all_json TEXT NOT NULL,
+    models_stats_json TEXT NOT NULL,
+    cached_at TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, height)
+);
+CREATE INDEX idx_models_api_epoch ON models_api_cache(epoch_id);
+CREATE TABLE participant_inferences (
+    epoch_id INTEGER NOT NULL,
+    participant_id TEXT NOT NULL,
+    inference_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    start_block_height TEXT NOT NULL,
+    start_block_timestamp TEXT NOT NULL,
+    validated_by_json TEXT,
+    prompt_hash TEXT,
+    response_hash TEXT,
+    prompt_payload TEXT,
+    response_payload TEXT,
+    prompt_token_count TEXT,
+    completion_token_count TEXT,
+    model TEXT,
+    last_updated TEXT NOT NULL,
+    PRIMARY KEY (epoch_id, participant_id, inference_id)
+);
+CREATE INDEX idx_participant_inferences ON participant_inferences(epoch_id, participant_id, status);
+"""
+
+
+@pytest.mark.asyncio
+async def test_initialize_upgrades_baseline_database():
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
+        db_path = f.name
+    
+    conn = sqlite3.connect(db_path)
+    conn.executescript(BASELINE_SCHEMA_SQL)
+    conn.commit()
+    conn.close()
+    
+    cache_db = CacheDB(db_path)
+    try:
+        await asyncio.wait_for(cache_db.initialize(), timeout=10)
+        
+        async with cache_db._connect() as conn:
+            async with conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'") as cursor:
+                indexes = {row["name"] async for row in cursor}
+        
+        assert not indexes & {
+            "idx_epoch_height", "idx_hardware_nodes_participant", "idx_models_epoch",
+            "idx_models_api_epoch", "idx_participant_inferences"
+        }
+    finally:
+        await cache_db.close()
+        os.unlink(db_path)
+
+
+@pytest.mark.asyncio
+async def test_database_uses_wal_journal(db):
+    async with aiosqlite.connect(db.db_path) as conn:
+        async with conn.execute("PRAGMA journal_mode") as cursor:
+            row = await cursor.fetchone()
+    
+    assert row[0] == "wal"
+
+
+
+@pytest.mark.asyncio
+async def test_connection_pragmas_applied(db):
+    async with db._connect() as conn:
+        async with conn.execute("PRAGMA synchronous") as cursor:
+            synchronous = (await cursor.fetchone())[0]
+        async with conn.execute("PRAGMA busy_timeout") as cursor:
+            busy_timeout = (await cursor.fetchone())[0]
+    
+    assert synchronous == 1
+    assert busy_timeout == 5000
+
+
+@pytest.mark.asyncio
+async def test_shared_connection_rolls_back_on_error(db):
+    with pytest.raises(RuntimeError):
+        async with db._connect() as conn:
+            await conn.execute(
+                "INSERT INTO epoch_status (epoch_id, is_finished, finish_height, marked_at) VALUES (1, 1, 100, 'now')"
+            )
+            raise RuntimeError("boom")
+    
+    assert not await db.is_epoch_finished(1)
+    
+    async with db._connect() as first:
+        pass
+    async with db._connect() as second:
+        assert first is second
+
+
 @pytest.mark.asyncio
 async def test_save_and_get_stats(db):
     stats = {
@@ -221,6 +375,28 @@ async def test_save_and_get_jail_status(db):
     assert result[0]["is_jailed"] in [True, False]
 
 
+@pytest.mark.asyncio
+async def test_jail_status_upsert_skips_unchanged_rows(db):
+    status = {
+        "participant_index": "gonka1abc",
+        "is_jailed": False,
+        "valcons_address": "gonkavalcons1abc"
+    }
+    
+    await db.save_jail_status_batch(epoch_id=56, jail_statuses=[status])
+    first = await db.get_jail_status(epoch_id=56, participant_index="gonka1abc")
+    
+    await db.save_jail_status_batch(epoch_id=56, jail_statuses=[status])
+    unchanged = await db.get_jail_status(epoch_id=56, participant_index="gonka1abc")
+    assert unchanged[0]["recorded_at"] == first[0]["recorded_at"]
+    
+    await db.save_jail_status_batch(epoch_id=56, jail_statuses=[{**status, "is_jailed": True}])
+    changed = await db.get_jail_status(epoch_id=56, participant_index="gonka1abc")
+    assert len(changed) == 1
+    assert changed[0]["is_jailed"] is True
+    assert changed[0]["recorded_at"] >= first[0]["recorded_at"]
+
+
 @pytest.mark.asyncio
 async def test_get_jail_status_for_participant(db):
     jail_statuses = [
@@ -318,6 +494,32 @@ async def test_save_stats_with_seed_signature(db):
     assert result[0]["_seed_signature"] == seed_sig
 
 
+@pytest.mark.asyncio
+async def test_get_participant_stats_fields(db):
+    await db.save_stats(
+        epoch_id=1,
+        height=1000,
+        participant_index="participant_1",
+        stats={"index": "participant_1", "_ml_nodes_map": {"node1": 150}},
+        seed_signature="sig1000"
+    )
+    await db.save_stats(
+        epoch_id=1,
+        height=1100,
+        participant_index="participant_1",
+        stats={"index": "participant_1"},
+        seed_signature="sig1100"
+    )
+    
+    at_height = await db.get_participant_stats_fields(1, "participant_1", height=1000)
+    assert at_height == {"seed_signature": "sig1000", "ml_nodes_map": {"node1": 150}}
+    
+    latest = await db.get_participant_stats_fields(1, "participant_1")
+    assert latest == {"seed_signature": "sig1100", "ml_nodes_map": {}}
+    
+    assert await db.get_participant_stats_fields(1, "participant_2") is None
+
+
 @pytest.mark.asyncio
 async def test_save_stats_batch_with_seed(db):
     stats_list = [
@@ -412,3 +614,377 @@ async def test_get_rewards_empty(db):
     )
     assert result == []
 
+
+
+@pytest.mark.asyncio
+async def test_keybase_cache(db):
+    await db.save_keybase_batch({
+        "ABC": ("alice", "https://keybase.io/alice/picture?size=96"),
+        "DEF": (None, None)
+    })
+    await db.save_keybase_batch({"OLD": ("bob", None)}, ttl_seconds=-1)
+    
+    result = await db.get_keybase_batch(["ABC", "DEF", "OLD"])
+    assert result == {"ABC": ("alice", "https://keybase.io/alice/picture?size=96")}
+    
+    assert await db.get_keybase_batch([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_reward_and_warm_key_lookups_use_covering_indexes(db):
+    queries = [
+        (
+            "SELECT * FROM participant_rewards WHERE participant_id = ? AND epoch_id IN (SELECT value FROM json_each(?))",
+            ("gonka1abc", "[1, 2]")
+        ),
+        (
+            "SELECT grantee_address, granted_at FROM participant_warm_keys WHERE epoch_id = ? AND participant_id = ? ORDER BY granted_at DESC, grantee_address",
+            (1, "gonka1abc")
+        )
+    ]
+    
+    async with db._connect() as conn:
+        for query, params in queries:
+            async with conn.execute(f"EXPLAIN QUERY PLAN {query}", params) as cursor:
+                plan = " ".join(row["detail"] for row in await cursor.fetchall())
+            assert "COVERING INDEX" in plan
+            assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_bulk_getters(db):
+    await db.save_reward_batch([
+        {"epoch_id": 1, "participant_id": "gonka1a", "rewarded_coins": "10", "claimed": True},
+        {"epoch_id": 2, "participant_id": "gonka1b", "rewarded_coins": "20", "claimed": False},
+        {"epoch_id": 3, "participant_id": "gonka1a", "rewarded_coins": "30", "claimed": False}
+    ])
+    await db.save_warm_keys_batch(5, "gonka1a", [
+        {"grantee_address": "gonka1warm1", "granted_at": "2025-01-01T00:00:00Z"},
+        {"grantee_address": "gonka1warm2", "granted_at": "2025-02-01T00:00:00Z"}
+    ])
+    await db.save_hardware_nodes_batch(5, "gonka1b", [
+        {"local_id": "node-1", "status": "INFERENCE", "models": ["m"], "hardware": [], "host": "h", "port": "1"}
+    ])
+    
+    rewards = await db.get_rewards_bulk([1, 2], ["gonka1a", "gonka1b"])
+    assert set(rewards) == {(1, "gonka1a"), (2, "gonka1b")}
+    assert rewards[(1, "gonka1a")]["claimed"] is True
+    
+    warm_keys = await db.get_warm_keys_bulk(5, ["gonka1a", "gonka1b"])
+    assert list(warm_keys) == ["gonka1a"]
+    assert [wk["grantee_address"] for wk in warm_keys["gonka1a"]] == ["gonka1warm2", "gonka1warm1"]
+    
+    hardware = await db.get_hardware_nodes_bulk(5, ["gonka1a", "gonka1b"])
+    assert list(hardware) == ["gonka1b"]
+    assert hardware["gonka1b"][0]["models"] == ["m"]
+    
+    assert await db.get_rewards_bulk([], ["gonka1a"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_save_many_replaces_per_participant_sets(db):
+    await db.save_warm_keys_many(5, {
+        "gonka1a": [{"grantee_address": "gonka1warm1", "granted_at": "2025-01-01T00:00:00Z"}],
+        "gonka1b": [{"grantee_address": "gonka1warm2", "granted_at": "2025-01-01T00:00:00Z"}]
+    })
+    await db.save_warm_keys_many(5, {
+        "gonka1a": [{"grantee_address": "gonka1warm3", "granted_at": "2025-02-01T00:00:00Z"}]
+    })
+    await db.save_hardware_nodes_many(5, {
+        "gonka1a": [{"local_id": "node-1"}, {"local_id": "node-2"}],
+        "gonka1b": [{"local_id": "node-3"}]
+    })
+    await db.save_warm_keys_many(5, {})
+    
+    warm_keys = await db.get_warm_keys_bulk(5, ["gonka1a", "gonka1b"])
+    assert [wk["grantee_address"] for wk in warm_keys["gonka1a"]] == ["gonka1warm3"]
+    assert [wk["grantee_address"] for wk in warm_keys["gonka1b"]] == ["gonka1warm2"]
+    
+    hardware = await db.get_hardware_nodes_bulk(5, ["gonka1a", "gonka1b"])
+    assert [n["local_id"] for n in hardware["gonka1a"]] == ["node-1", "node-2"]
+    assert [n["local_id"] for n in hardware["gonka1b"]] == ["node-3"]
+
+
+@pytest.mark.asyncio
+async def test_uncached_participants(db):
+    await db.save_warm_keys_many(5, {
+        "gonka1a": [{"grantee_address": "gonka1warm1", "granted_at": "2025-01-01T00:00:00Z"}, {"grantee_address": "gonka1warm2", "granted_at": "2025-01-01T00:00:00Z"}]
+    })
+    await db.save_hardware_nodes_many(5, {"gonka1b": [{"local_id": "node-1"}]})
+    await db.save_hardware_nodes_many(6, {"gonka1c": [{"local_id": "node-1"}]})
+    
+    assert await db.get_uncached_warm_keys_participants(5, ["gonka1c", "gonka1a", "gonka1b"]) == ["gonka1c", "gonka1b"]
+    assert await db.get_uncached_hardware_nodes_participants(5, ["gonka1a", "gonka1b", "gonka1c"]) == ["gonka1a", "gonka1c"]
+    assert await db.get_uncached_hardware_nodes_participants(5, []) == []
+
+
+@pytest.mark.asyncio
+async def test_hot_getters_cached_and_invalidated(db):
+    await db.mark_epoch_finished(7, 700)
+    await db.save_epoch_total_rewards(7, 1000)
+    await db.save_jail_status_batch(7, [{"participant_index": "gonka1a", "is_jailed": False}])
+    
+    assert await db.get_jail_status(7, "gonka1b") is None
+    assert len(await db.get_jail_status(7)) == 1
+    
+    async with db._connect() as conn:
+        await conn.execute("DELETE FROM epoch_status")
+        await conn.execute("DELETE FROM epoch_total_rewards")
+        await conn.execute("DELETE FROM jail_status")
+        await conn.commit()
+    
+    assert await db.is_epoch_finished(7)
+    assert await db.get_epoch_finish_height(7) == 700
+    assert await db.get_epoch_total_rewards(7) == 1000
+    assert len(await db.get_jail_status(7)) == 1
+    
+    await db.clear_epoch_stats(7)
+    await db.delete_epoch_total_rewards(7)
+    await db.save_jail_status_batch(7, [{"participant_index": "gonka1b", "is_jailed": True}])
+    
+    assert not await db.is_epoch_finished(7)
+    assert await db.get_epoch_total_rewards(7) is None
+    statuses = await db.get_jail_status(7, "gonka1b")
+    assert len(statuses) == 1
+    assert statuses[0]["is_jailed"] is True
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_wait_for_writer(db):
+    await db.mark_epoch_finished(3, 300)
+    
+    async with db._connect():
+        rewards = await asyncio.wait_for(db.get_rewards_for_participant("gonka1a", [3]), timeout=1)
+        assert rewards == []
+    
+    async with db._reader() as reader:
+        with pytest.raises(sqlite3.OperationalError):
+            await reader.execute("DELETE FROM epoch_status")
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_truncates_wal(db):
+    await db.save_epoch_total_rewards(1, 100)
+    assert os.path.getsize(db.db_path + "-wal") > 0
+    
+    await db.checkpoint()
+    
+    assert os.path.getsize(db.db_path + "-wal") == 0
+    assert await db.get_epoch_total_rewards(1) == 100
+
+
+@pytest.mark.asyncio
+async def test_close_truncates_wal(db):
+    other = sqlite3.connect(db.db_path)
+    other.execute("SELECT 1 FROM epoch_status").fetchall()
+    try:
+        await db.save_epoch_total_rewards(1, 100)
+        assert os.path.getsize(db.db_path + "-wal") > 0
+        
+        await db.close()
+        
+        assert os.path.getsize(db.db_path + "-wal") == 0
+    finally:
+        other.close()
+
+
+@pytest.mark.asyncio
+async def test_inference_payloads_stored_separately(db):
+    inferences = [
+        {
+            "inference_id": "inf-1",
+            "status": "FINISHED",
+            "start_block_height": "100",
+            "start_block_timestamp": "2024-01-01T00:00:01",
+            "validated_by": ["val1"],
+            "prompt_payload": "prompt-1",
+            "response_payload": "response-1"
+        },
+        {
+            "inference_id": "inf-2",
+            "status": "EXPIRED",
+            "start_block_height": "101",
+            "start_block_timestamp": "2024-01-01T00:00:02"
+        }
+    ]
+    await db.save_participant_inferences_batch(5, "participant1", inferences)
+    
+    full = await db.get_participant_inferences(5, "participant1")
+    assert [inf["inference_id"] for inf in full] == ["inf-2", "inf-1"]
+    assert full[1]["prompt_payload"] == "prompt-1"
+    assert full[1]["response_payload"] == "response-1"
+    assert full[0]["prompt_payload"] is None
+    
+    narrow = await db.get_participant_inferences(5, "participant1", include_payloads=False)
+    assert all(inf["prompt_payload"] is None for inf in narrow)
+    assert narrow[1]["validated_by"] == ["val1"]
+    
+    payloads = await db.get_inference_payloads(5, "participant1", ["inf-1", "inf-2"])
+    assert payloads == {"inf-1": ("prompt-1", "response-1")}
+    
+    await db.save_participant_inferences_batch(5, "participant1", inferences[1:])
+    assert await db.get_inference_payloads(5, "participant1", ["inf-1"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_models_api_cache_reuses_parsed_payload(db):
+    assert await db.get_models_api_cache(3) is None
+    
+    await db.save_models_api_cache(3, 100, {"model": [{"id": "a"}]}, {"stats_models": []})
+    await db.save_models_api_cache(3, 200, {"model": [{"id": "b"}]}, {"stats_models": []})
+    
+    latest = await db.get_models_api_cache(3)
+    assert latest["cached_height"] == 200
+    assert await db.get_models_api_cache(3) is latest
+    assert (await db.get_models_api_cache(3, 100))["models_all"] == {"model": [{"id": "a"}]}
+    
+    await db.save_models_api_cache(3, 200, {"model": [{"id": "c"}]}, {"stats_models": []})
+    
+    assert (await db.get_models_api_cache(3))["models_all"] == {"model": [{"id": "c"}]}
+
+
+@pytest.mark.asyncio
+async def test_epoch_lookups_use_primary_keys(db):
+    queries = [
+        ("SELECT * FROM participant_inferences WHERE epoch_id = ? AND participant_id = ?", (1, "gonka1abc")),
+        ("SELECT * FROM models WHERE epoch_id = ?", (1,)),
+        ("SELECT * FROM models_api_cache WHERE epoch_id = ? ORDER BY height DESC LIMIT 1", (1,)),
+        ("SELECT * FROM participant_hardware_nodes WHERE epoch_id = ? AND participant_id = ? ORDER BY local_id", (1, "gonka1abc")),
+        ("SELECT * FROM inference_stats WHERE epoch_id = ? AND height = ?", (1, 10))
+    ]
+    
+    async with db._connect() as conn:
+        for query, params in queries:
+            async with conn.execute(f"EXPLAIN QUERY PLAN {query}", params) as cursor:
+                plan = " ".join(row["detail"] for row in await cursor.fetchall())
+            assert "USING INDEX sqlite_autoindex" in plan or "USING PRIMARY KEY" in plan, plan
+            assert "TEMP B-TREE" not in plan, plan
+
+
+@pytest.mark.asyncio
+async def test_empty_participant_inferences(db):
+    assert await db.get_participant_inferences(5, "participant1") is None
+    
+    await db.save_participant_inferences_batch(5, "participant1", [])
+    assert await db.get_participant_inferences(5, "participant1") == []
+    
+    await db.save_participant_inferences_batch(5, "participant1", [{
+        "inference_id": "inf-1",
+        "status": "FINISHED",
+        "start_block_height": "100",
+        "start_block_timestamp": "2024-01-01T00:00:01"
+    }])
+    result = await db.get_participant_inferences(5, "participant1")
+    assert [inf["inference_id"] for inf in result] == ["inf-1"]
+    
+    await db.save_participant_inferences_batch(5, "participant1", [])
+    assert await db.get_participant_inferences(5, "participant1") == []
+
+
+@pytest.mark.asyncio
+async def test_participant_inferences_resave_replaces_set(db):
+    def inference(inference_id, status, payload=None):
+        return {
+            "inference_id": inference_id,
+            "status": status,
+            "start_block_height": "100",
+            "start_block_timestamp": f"2024-01-01T00:00:0{inference_id[-1]}",
+            "prompt_payload": payload
+        }
+    
+    await db.save_participant_inferences_batch(5, "participant1", [
+        inference("inf-1", "FINISHED", "p1"),
+        inference("inf-2", "STARTED", "p2")
+    ])
+    await db.save_participant_inferences_batch(5, "participant1", [
+        inference("inf-2", "VALIDATED"),
+        inference("inf-3", "FINISHED", "p3")
+    ])
+    
+    result = await db.get_participant_inferences(5, "participant1")
+    assert [(inf["inference_id"], inf["status"], inf["prompt_payload"]) for inf in result] == [
+        ("inf-3", "FINISHED", "p3"),
+        ("inf-2", "VALIDATED", None)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_initialize_moves_baseline_inference_payloads():
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as f:
+        db_path = f.name
+    
+    conn = sqlite3.connect(db_path)
+    conn.executescript(BASELINE_SCHEMA_SQL)
+    conn.executemany("""
+        INSERT INTO participant_inferences
+        (epoch_id, participant_id, inference_id, status, start_block_height, start_block_timestamp,
+         prompt_payload, response_payload, last_updated)
+        VALUES (?, ?, ?, 'FINISHED', '1', '0', ?, ?, '2025-01-01T00:00:00')
+    """, [
+        (3, "gonka1a", "inf-1", "prompt-1", "response-1"),
+        (3, "gonka1a", "inf-2", None, None)
+    ])
+    conn.commit()
+    conn.close()
+    
+    cache_db = CacheDB(db_path)
+    try:
+        await cache_db.initialize()
+        await cache_db.initialize()
+        
+        payloads = await cache_db.get_inference_payloads(3, "gonka1a", ["inf-1", "inf-2"])
+        assert payloads == {"inf-1": ("prompt-1", "response-1")}
+        
+        inferences = await cache_db.get_participant_inferences(3, "gonka1a")
+        by_id = {inf["inference_id"]: inf for inf in inferences}
+        assert by_id["inf-1"]["prompt_payload"] == "prompt-1"
+        assert by_id["inf-1"]["response_payload"] == "response-1"
+        assert by_id["inf-2"]["prompt_payload"] is None
+    finally:
+        await cache_db.close()
+        os.unlink(db_path)
+
+
+def _write_during_next_read(db, write):
+    original_reader = db._reader
+    pending = [write]
+    
+    @asynccontextmanager
+    async def racing_reader():
+        async with original_reader() as conn:
+            yield conn
+        if pending:
+            await pending.pop()()
+    
+    db._reader = racing_reader
+
+
+@pytest.mark.asyncio
+async def test_hot_getters_do_not_cache_reads_raced_by_writes(db):
+    await db.mark_epoch_finished(7, 700)
+    await db.save_epoch_total_rewards(7, 1000)
+    await db.save_jail_status_batch(7, [{"participant_index": "gonka1a", "is_jailed": False}])
+    db._epoch_status.clear()
+    db._epoch_total_rewards.clear()
+    db._jail_status.clear()
+    
+    _write_during_next_read(db, lambda: db.clear_epoch_stats(7))
+    assert await db.is_epoch_finished(7) is True
+    assert await db.is_epoch_finished(7) is False
+    
+    _write_during_next_read(db, lambda: db.delete_epoch_total_rewards(7))
+    assert await db.get_epoch_total_rewards(7) == 1000
+    assert await db.get_epoch_total_rewards(7) is None
+    
+    _write_during_next_read(db, lambda: db.save_jail_status_batch(7, [{"participant_index": "gonka1a", "is_jailed": True}]))
+    assert (await db.get_jail_status(7))[0]["is_jailed"] is False
+    assert (await db.get_jail_status(7))[0]["is_jailed"] is True
+
+
+@pytest.mark.asyncio
+async def test_models_api_cache_does_not_cache_read_raced_by_write(db):
+    await db.save_models_api_cache(4, 400, {"model": ["old"]}, {"stats_models": []})
+    
+    _write_during_next_read(db, lambda: db.save_models_api_cache(4, 400, {"model": ["new"]}, {"stats_models": []}))
+    assert (await db.get_models_api_cache(4, 400))["models_all"] == {"model": ["old"]}
+    assert (await db.get_models_api_cache(4, 400))["models_all"] == {"model": ["new"]}
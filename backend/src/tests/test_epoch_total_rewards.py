@@ -16,6 +16,7 @@ async def db():
     
     yield cache_db
     
+    await cache_db.close()
     os.unlink(temp_db.name)
 
 
@@ -17,6 +17,7 @@ async def db():
     
     yield cache_db
     
+    await cache_db.close()
     if os.path.exists(db_path):
         os.unlink(db_path)
 
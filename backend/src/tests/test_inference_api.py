@@ -25,6 +25,7 @@ async def setup_service():
     
     yield service
     
+    await cache_db.close()
     if os.path.exists(db_path):
         os.unlink(db_path)
 
@@ -208,6 +208,8 @@ async def test_database_save_and_get_hardware_nodes_with_poc_weight(tmp_path):
     assert result[0]["poc_weight"] == 1500
     assert result[1]["local_id"] == "node2"
     assert result[1]["poc_weight"] == 2000
+    
+    await cache_db.close()
 
 
 @pytest.mark.asyncio
@@ -235,6 +237,8 @@ async def test_database_save_and_get_hardware_nodes_without_poc_weight(tmp_path)
     assert len(result) == 1
     assert result[0]["local_id"] == "node1"
     assert result[0]["poc_weight"] is None
+    
+    await cache_db.close()
 
 
 @pytest.mark.asyncio
@@ -263,4 +267,6 @@ async def test_database_save_and_get_hardware_nodes_with_none_poc_weight(tmp_pat
     assert len(result) == 1
     assert result[0]["local_id"] == "node1"
     assert result[0]["poc_weight"] is None
+    
+    await cache_db.close()
 
@@ -67,6 +67,29 @@ def test_participant_stats_zero_total():
     assert stats.missed_rate == 0.0
 
 
+def test_participant_stats_rates_computed_once():
+    stats = ParticipantStats(
+        index="participant_3",
+        address="gonka1ghi...",
+        weight=10,
+        current_epoch_stats=CurrentEpochStats(
+            inference_count="6",
+            missed_requests="2",
+            earned_coins="0",
+            rewarded_coins="0",
+            burned_coins="0",
+            validated_inferences="5",
+            invalidated_inferences="3"
+        )
+    )
+    
+    assert stats.model_dump()["missed_rate"] == 0.25
+    assert stats.invalidation_rate == 0.5
+    assert stats.__dict__["missed_rate"] == 0.25
+    assert stats.__dict__["invalidation_rate"] == 0.5
+    assert stats.model_dump()["invalidation_rate"] == 0.5
+
+
 def test_participant_stats_high_missed_rate():
     stats = ParticipantStats(
         index="participant_3",
@@ -193,6 +216,9 @@ def test_inference_response():
     assert response.height == 1000
     assert len(response.participants) == 1
     assert response.is_current is True
+    assert response.by_index["participant_1"] is response.participants[0]
+    assert response.by_index.get("missing") is None
+    assert "by_index" not in response.model_dump()
 
 
 def test_inference_response_serialization():
@@ -1,10 +1,11 @@
 import pytest
+import asyncio
 import pytest_asyncio
 import tempfile
 import os
 from backend.client import GonkaClient
 from backend.database import CacheDB
-from backend.service import InferenceService
+from backend.service import InferenceService, PARTICIPANTS_ADAPTER, _aggregate_models, _build_participant_row, _ugnk_to_gnk, build_validator_index, filter_active_validators, parse_validator
 
 
 @pytest_asyncio.fixture
@@ -17,13 +18,15 @@ async def cache_db():
     
     yield db
     
+    await db.close()
     if os.path.exists(db_path):
         os.unlink(db_path)
 
 
 @pytest_asyncio.fixture
 async def client():
-    return GonkaClient(base_urls=["http://node2.gonka.ai:8000"])
+    async with GonkaClient(base_urls=["http://node2.gonka.ai:8000"]) as client:
+        yield client
 
 
 @pytest_asyncio.fixture
@@ -149,3 +152,491 @@ async def test_height_wise_caching_different_results(service):
             assert has_early
             assert has_late
 
+
+def test_build_validator_index_skips_zero_tokens():
+    validators = [
+        {"operator_address": "gonkavaloper1a", "tokens": "100"},
+        {"operator_address": "gonkavaloper1b", "tokens": "0"},
+        {"operator_address": "", "tokens": "50"},
+        {"operator_address": "gonkavaloper1c"}
+    ]
+    
+    active = filter_active_validators(validators)
+    index = build_validator_index(active)
+    
+    assert len(active) == 2
+    assert list(index.keys()) == ["gonkavaloper1a"]
+
+
+def test_parse_validator_fields():
+    validator = parse_validator({
+        "operator_address": "gonkavaloper1a",
+        "consensus_pubkey": {"value": "pubkey=="},
+        "description": {"moniker": " node ", "identity": "ABC ", "website": ""}
+    })
+    
+    assert validator.operator == "gonkavaloper1a"
+    assert validator.tokens == 0
+    assert validator.consensus_pub == "pubkey=="
+    assert validator.moniker == "node"
+    assert validator.display_moniker == "node"
+    assert validator.identity == "ABC"
+    assert validator.website == ""
+    assert validator.jailed is False
+    
+    valoper = parse_validator({"description": {"moniker": "gonkavaloper1abc"}})
+    assert valoper.moniker == "gonkavaloper1abc"
+    assert valoper.display_moniker == ""
+    
+    empty = parse_validator({"consensus_pubkey": None, "description": None})
+    assert empty.operator == ""
+    assert empty.consensus_pub == ""
+    assert empty.moniker == ""
+
+
+@pytest.mark.asyncio
+async def test_validator_index_memoized_per_epoch(service, monkeypatch):
+    calls = []
+    
+    async def fake_get_all_validators(height=None):
+        calls.append(height)
+        return [{"operator_address": "gonkavaloper1a", "tokens": "100"}]
+    
+    monkeypatch.setattr(service.client, "get_all_validators", fake_get_all_validators)
+    
+    first = await service.get_validator_index(10, height=1000)
+    second = await service.get_validator_index(10, height=1001)
+    
+    assert first is second
+    assert len(calls) == 1
+    
+    active, index = await service.get_active_validators(10)
+    assert index is first
+    assert [v.operator for v in active] == ["gonkavaloper1a"]
+    assert len(calls) == 1
+    
+    await service.get_validator_index(11, height=2000)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_node_health_checked_concurrently(service, monkeypatch):
+    in_flight = 0
+    peak = 0
+    
+    async def fake_check_node_health(inference_url):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if inference_url == "http://broken":
+            raise RuntimeError("boom")
+        return {"is_healthy": True, "error_message": None, "response_time_ms": 1}
+    
+    monkeypatch.setattr(service.client, "check_node_health", fake_check_node_health)
+    
+    participants = [{"index": f"gonka1p{i}", "inference_url": f"http://node{i}"} for i in range(5)]
+    participants.append({"index": "gonka1broken", "inference_url": "http://broken"})
+    participants.append({"inference_url": "http://no-index"})
+    
+    await service.fetch_and_cache_node_health(participants)
+    
+    assert peak == 6
+    health = await service.cache_db.get_node_health()
+    assert sorted(h["participant_index"] for h in health) == [f"gonka1p{i}" for i in range(5)]
+
+
+def test_participants_adapter_ignores_cache_metadata():
+    stats = {
+        "inference_count": "4",
+        "missed_requests": "1",
+        "earned_coins": "0",
+        "rewarded_coins": "0",
+        "burned_coins": "0",
+        "validated_inferences": "4",
+        "invalidated_inferences": "0"
+    }
+    cached = [
+        {"index": f"gonka1p{i}", "address": f"gonka1p{i}", "weight": i, "current_epoch_stats": stats, "_cached_at": "2024-01-01T00:00:00", "_height": 100}
+        for i in range(3)
+    ]
+    
+    participants = PARTICIPANTS_ADAPTER.validate_python(cached)
+    
+    assert [p.index for p in participants] == ["gonka1p0", "gonka1p1", "gonka1p2"]
+    assert participants[2].weight == 2
+    assert participants[0].missed_rate == 0.2
+
+
+def test_build_participant_row_keeps_cached_fields():
+    p = {
+        "index": "gonka1p0",
+        "address": "gonka1p0",
+        "inference_url": "http://node0",
+        "status": "ACTIVE",
+        "coin_balance": "123",
+        "current_epoch_stats": {
+            "inference_count": "3",
+            "missed_requests": "1",
+            "earned_coins": "0",
+            "rewarded_coins": "0",
+            "burned_coins": "0",
+            "validated_inferences": "3",
+            "invalidated_inferences": "0"
+        }
+    }
+    epoch_participant = {
+        "weight": 7,
+        "models": ["m1"],
+        "validator_key": "key",
+        "seed_signature": "sig",
+        "ml_nodes_map": {"node1": 5}
+    }
+    
+    participant, stats_dict = _build_participant_row(p, epoch_participant)
+    
+    assert participant.weight == 7
+    assert participant.ml_nodes_map == {"node1": 5}
+    assert stats_dict["seed_signature"] == "sig"
+    assert stats_dict["_ml_nodes_map"] == {"node1": 5}
+    assert "coin_balance" not in stats_dict
+    assert PARTICIPANTS_ADAPTER.validate_python([stats_dict])[0].models == ["m1"]
+
+
+@pytest.mark.asyncio
+async def test_epoch_participants_coalesced_and_cached(service, monkeypatch):
+    calls = []
+    
+    async def fake_get_epoch_participants(epoch_id):
+        calls.append(epoch_id)
+        await asyncio.sleep(0.01)
+        return {"active_participants": {"epoch_group_id": epoch_id, "participants": []}}
+    
+    monkeypatch.setattr(service.client, "get_epoch_participants", fake_get_epoch_participants)
+    service.current_epoch_id = 10
+    
+    first, second = await asyncio.gather(
+        service.get_epoch_participants(9),
+        service.get_epoch_participants(9)
+    )
+    assert first is second
+    assert calls == [9]
+    
+    assert await service.get_epoch_participants(9) is first
+    assert calls == [9]
+    
+    await service.get_epoch_participants(10)
+    await service.get_epoch_participants(10)
+    assert calls == [9, 10, 10]
+
+
+@pytest.mark.asyncio
+async def test_canonical_height_fetches_epoch_pair(service, monkeypatch):
+    async def fake_get_epoch_participants(epoch_id):
+        if epoch_id == 6:
+            raise RuntimeError("not started")
+        return {"active_participants": {"effective_block_height": epoch_id * 1000}}
+    
+    async def fake_get_latest_epoch():
+        return {"latest_epoch": {"index": 6}, "epoch_stages": {"next_poc_start": 5900}}
+    
+    monkeypatch.setattr(service.client, "get_epoch_participants", fake_get_epoch_participants)
+    monkeypatch.setattr(service.client, "get_latest_epoch", fake_get_latest_epoch)
+    service.current_epoch_id = 7
+    
+    assert await service.get_canonical_height(4) == 4990
+    assert await service.get_canonical_height(5) == 5890
+    
+    with pytest.raises(ValueError):
+        await service.get_canonical_height(4, requested_height=3000)
+
+
+def test_ugnk_to_gnk():
+    assert _ugnk_to_gnk("0") == 0
+    assert _ugnk_to_gnk("999999999") == 0
+    assert _ugnk_to_gnk("1000000000") == 1
+    assert _ugnk_to_gnk("123456789012") == 123
+
+
+@pytest.mark.asyncio
+async def test_background_work_deduplicated_per_key(service):
+    runs = []
+    release = asyncio.Event()
+    
+    async def job(name):
+        runs.append(name)
+        await release.wait()
+    
+    service._spawn_background(("total rewards", 5), job("first"))
+    service._spawn_background(("total rewards", 5), job("second"))
+    service._spawn_background(("total rewards", 6), job("other"))
+    await asyncio.sleep(0)
+    
+    assert runs == ["first", "other"]
+    
+    release.set()
+    await asyncio.gather(*service._background_tasks.values())
+    await asyncio.sleep(0)
+    assert service._background_tasks == {}
+    
+    service._spawn_background(("total rewards", 5), job("again"))
+    await asyncio.gather(*service._background_tasks.values())
+    assert runs == ["first", "other", "again"]
+
+
+@pytest.mark.asyncio
+async def test_poll_participant_rewards_fetches_unclaimed_concurrently(service, monkeypatch):
+    calls = []
+    
+    async def fake_get_latest_height():
+        return 5000
+    
+    async def fake_get_current_epoch_participants():
+        return {"active_participants": {"epoch_group_id": 4, "participants": [{"index": "gonka1a"}, {"index": "gonka1b"}]}}
+    
+    async def fake_get_epoch_performance_summary(epoch_id, participant_id, height=None):
+        calls.append((epoch_id, participant_id))
+        await asyncio.sleep(0)
+        if participant_id == "gonka1b" and epoch_id == 1:
+            raise RuntimeError("unavailable")
+        return {"epochPerformanceSummary": {"rewarded_coins": f"{epoch_id}000000000", "claimed": True}}
+    
+    monkeypatch.setattr(service.client, "get_latest_height", fake_get_latest_height)
+    monkeypatch.setattr(service.client, "get_current_epoch_participants", fake_get_current_epoch_participants)
+    monkeypatch.setattr(service.client, "get_epoch_performance_summary", fake_get_epoch_performance_summary)
+    
+    await service.cache_db.save_reward_batch([
+        {"epoch_id": 3, "participant_id": "gonka1a", "rewarded_coins": "3000000000", "claimed": True}
+    ])
+    
+    await service.poll_participant_rewards()
+    
+    assert sorted(calls) == [(1, "gonka1a"), (1, "gonka1b"), (2, "gonka1a"), (2, "gonka1b"), (3, "gonka1b")]
+    rewards = await service.cache_db.get_rewards_bulk([1, 2, 3], ["gonka1a", "gonka1b"])
+    assert sorted(rewards) == [(1, "gonka1a"), (2, "gonka1a"), (2, "gonka1b"), (3, "gonka1a"), (3, "gonka1b")]
+
+
+@pytest.mark.asyncio
+async def test_warm_participant_cache_writes_in_bulk(service, monkeypatch):
+    saves = []
+    
+    async def fake_get_authz_grants(participant_id):
+        if participant_id == "gonka1c":
+            raise RuntimeError("unavailable")
+        return [{"grantee_address": f"{participant_id}-warm", "granted_at": "2025-01-01T00:00:00Z"}]
+    
+    async def fake_get_hardware_nodes(participant_id):
+        return [{"local_id": f"{participant_id}-node"}]
+    
+    original_save_warm_keys_many = service.cache_db.save_warm_keys_many
+    
+    async def tracking_save_warm_keys_many(epoch_id, warm_keys_by_participant):
+        saves.append(sorted(warm_keys_by_participant))
+        await original_save_warm_keys_many(epoch_id, warm_keys_by_participant)
+    
+    monkeypatch.setattr(service.client, "get_authz_grants", fake_get_authz_grants)
+    monkeypatch.setattr(service.client, "get_hardware_nodes", fake_get_hardware_nodes)
+    monkeypatch.setattr(service.cache_db, "save_warm_keys_many", tracking_save_warm_keys_many)
+    
+    await service.cache_db.save_hardware_nodes_batch(9, "gonka1a", [{"local_id": "cached-node"}])
+    
+    participants = [{"index": pid} for pid in ("gonka1a", "gonka1b", "gonka1c")]
+    await service.warm_participant_cache(participants, 9, batch_size=2)
+    
+    assert saves == [["gonka1a", "gonka1b"]]
+    hardware = await service.cache_db.get_hardware_nodes_bulk(9, ["gonka1a", "gonka1b", "gonka1c"])
+    assert {pid: [n["local_id"] for n in nodes] for pid, nodes in hardware.items()} == {
+        "gonka1a": ["cached-node"],
+        "gonka1b": ["gonka1b-node"],
+        "gonka1c": ["gonka1c-node"]
+    }
+
+
+def test_aggregate_models():
+    participants = [
+        {
+            "index": "gonka1a",
+            "models": ["m1", "m2"],
+            "ml_nodes": [{"ml_nodes": [{"poc_weight": 10}, {"poc_weight": 5}]}, {"ml_nodes": []}]
+        },
+        {
+            "index": "gonka1b",
+            "models": ["m1"],
+            "ml_nodes": [{"ml_nodes": [{"poc_weight": 7}, {}]}]
+        },
+        {"index": "gonka1c"}
+    ]
+    
+    assert _aggregate_models(participants) == [
+        {"model_id": "m1", "total_weight": 22, "participant_count": 2},
+        {"model_id": "m2", "total_weight": 0, "participant_count": 1}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_calculate_total_rewards_fetches_concurrently(service, monkeypatch):
+    in_flight = 0
+    peak = 0
+    
+    async def fake_get_epoch_participants(epoch_id):
+        return {"active_participants": {"participants": [{"index": f"gonka1p{i}"} for i in range(6)]}}
+    
+    async def fake_get_epoch_performance_summary(epoch_id, participant_id, height=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if participant_id == "gonka1p5":
+            raise RuntimeError("unavailable")
+        return {"epochPerformanceSummary": {"rewarded_coins": "2000000000", "claimed": False}}
+    
+    monkeypatch.setattr(service, "get_epoch_participants", fake_get_epoch_participants)
+    monkeypatch.setattr(service.client, "get_epoch_performance_summary", fake_get_epoch_performance_summary)
+    
+    await service._calculate_and_cache_total_rewards(8)
+    
+    assert peak > 1
+    assert await service.cache_db.get_epoch_total_rewards(8) == 10
+    rewards = await service.cache_db.get_rewards_bulk([8], [f"gonka1p{i}" for i in range(6)])
+    assert len(rewards) == 5
+
+
+@pytest.mark.asyncio
+async def test_poll_epoch_total_rewards_skips_until_rollover(service, monkeypatch):
+    latest_epoch = 4
+    calculated = []
+    
+    async def fake_get_latest_epoch():
+        return {"latest_epoch": {"index": latest_epoch}}
+    
+    async def fake_calculate(epoch_id):
+        calculated.append(epoch_id)
+        if epoch_id != 1:
+            await service.cache_db.save_epoch_total_rewards(epoch_id, 100)
+    
+    monkeypatch.setattr(service.client, "get_latest_epoch", fake_get_latest_epoch)
+    monkeypatch.setattr(service, "_calculate_and_cache_total_rewards", fake_calculate)
+    
+    await service.poll_epoch_total_rewards()
+    assert calculated == [3, 2, 1]
+    
+    await service.poll_epoch_total_rewards()
+    assert calculated == [3, 2, 1, 1]
+    
+    await service.cache_db.save_epoch_total_rewards(1, 100)
+    await service.poll_epoch_total_rewards()
+    await service.poll_epoch_total_rewards()
+    assert calculated == [3, 2, 1, 1]
+    
+    latest_epoch = 5
+    await service.poll_epoch_total_rewards()
+    assert calculated == [3, 2, 1, 1, 4]
+
+
+@pytest.mark.asyncio
+async def test_get_timeline_fetches_fresh_data(service, monkeypatch):
+    block_times = {
+        20000: "2025-01-02T00:00:00Z",
+        10000: "2025-01-01T00:00:00Z"
+    }
+    
+    async def fake_get_latest_height():
+        return 20000
+    
+    async def fake_get_block(height):
+        return {"result": {"block": {"header": {"time": block_times[height]}}}}
+    
+    async def fake_get_restrictions_params():
+        return {"params": {"restriction_end_block": "15000"}}
+    
+    async def fake_get_latest_epoch():
+        return {
+            "latest_epoch": {"index": 12, "poc_start_block_height": 19000},
+            "epoch_params": {"epoch_length": 1500}
+        }
+    
+    monkeypatch.setattr(service.client, "get_latest_height", fake_get_latest_height)
+    monkeypatch.setattr(service.client, "get_block", fake_get_block)
+    monkeypatch.setattr(service.client, "get_restrictions_params", fake_get_restrictions_params)
+    monkeypatch.setattr(service.client, "get_latest_epoch", fake_get_latest_epoch)
+    
+    timeline = await service.get_timeline()
+    
+    assert timeline.current_block.height == 20000
+    assert timeline.reference_block.timestamp == "2025-01-01T00:00:00Z"
+    assert timeline.avg_block_time == 8.64
+    assert timeline.events[0].occurred is True
+    assert timeline.current_epoch_index == 12
+    assert await service.get_timeline() is timeline
+
+
+@pytest.mark.asyncio
+async def test_poll_hardware_nodes_fetches_only_uncached(service, monkeypatch):
+    fetched = []
+    
+    async def fake_get_current_epoch_participants():
+        return {"active_participants": {"epoch_group_id": 3, "participants": [{"index": "gonka1a"}, {"index": "gonka1b"}, {"index": "gonka1c"}]}}
+    
+    async def fake_get_hardware_nodes(participant_id):
+        fetched.append(participant_id)
+        return [{"local_id": f"{participant_id}-node"}]
+    
+    monkeypatch.setattr(service.client, "get_current_epoch_participants", fake_get_current_epoch_participants)
+    monkeypatch.setattr(service.client, "get_hardware_nodes", fake_get_hardware_nodes)
+    
+    await service.cache_db.save_hardware_nodes_batch(3, "gonka1b", [{"local_id": "cached-node"}])
+    
+    await service.poll_hardware_nodes(batch_size=1)
+    
+    assert fetched == ["gonka1a", "gonka1c"]
+    assert await service.cache_db.get_uncached_hardware_nodes_participants(3, ["gonka1a", "gonka1b", "gonka1c"]) == []
+
+
+@pytest.mark.asyncio
+async def test_epoch_models_aggregation_coalesced(service, monkeypatch):
+    saves = []
+    original_save_models_batch = service.cache_db.save_models_batch
+    
+    async def tracking_save_models_batch(epoch_id, models):
+        saves.append(epoch_id)
+        await original_save_models_batch(epoch_id, models)
+    
+    monkeypatch.setattr(service.cache_db, "save_models_batch", tracking_save_models_batch)
+    
+    participants = [{"index": "gonka1a", "models": ["m1"], "ml_nodes": [{"ml_nodes": [{"poc_weight": 4}]}]}]
+    results = await asyncio.gather(*[service._get_epoch_models(6, participants) for _ in range(4)])
+    
+    assert saves == [6]
+    assert all(r == [{"model_id": "m1", "total_weight": 4, "participant_count": 1}] for r in results)
+    assert not service._epoch_models_inflight
+    
+    cached = await service._get_epoch_models(6, [])
+    assert [m["model_id"] for m in cached] == ["m1"]
+    assert saves == [6]
+
+
+@pytest.mark.asyncio
+async def test_calculate_total_rewards_reuses_claimed_rewards(service, monkeypatch):
+    fetched = []
+    
+    async def fake_get_epoch_participants(epoch_id):
+        return {"active_participants": {"participants": [{"index": "gonka1a"}, {"index": "gonka1b"}, {"index": "gonka1c"}]}}
+    
+    async def fake_get_epoch_performance_summary(epoch_id, participant_id, height=None):
+        fetched.append(participant_id)
+        return {"epochPerformanceSummary": {"rewarded_coins": "1000000000", "claimed": False}}
+    
+    monkeypatch.setattr(service, "get_epoch_participants", fake_get_epoch_participants)
+    monkeypatch.setattr(service.client, "get_epoch_performance_summary", fake_get_epoch_performance_summary)
+    
+    await service.cache_db.save_reward_batch([
+        {"epoch_id": 9, "participant_id": "gonka1a", "rewarded_coins": "3000000000", "claimed": True},
+        {"epoch_id": 9, "participant_id": "gonka1b", "rewarded_coins": "0", "claimed": False}
+    ])
+    
+    await service._calculate_and_cache_total_rewards(9)
+    
+    assert sorted(fetched) == ["gonka1b", "gonka1c"]
+    assert await service.cache_db.get_epoch_total_rewards(9) == 5
@@ -40,6 +40,7 @@ async def test_database_warm_keys_operations():
         non_existent = await db.get_warm_keys(999, "gonka1nonexist")
         assert non_existent is None
     finally:
+        await db.close()
         os.unlink(db_path)
 
 
@@ -83,6 +84,7 @@ async def test_database_warm_keys_replacement():
         assert retrieved[0]["grantee_address"] == "gonka1warm3"
         assert retrieved[1]["grantee_address"] == "gonka1warm2"
     finally:
+        await db.close()
         os.unlink(db_path)
 
 
@@ -122,6 +124,7 @@ async def test_database_warm_keys_sorting():
         assert retrieved[1]["grantee_address"] == "gonka1mid"
         assert retrieved[2]["grantee_address"] == "gonka1old"
     finally:
+        await db.close()
         os.unlink(db_path)
 
 
@@ -182,6 +185,7 @@ async def test_database_empty_warm_keys():
         retrieved = await db.get_warm_keys(epoch_id, participant_id)
         assert retrieved is None or len(retrieved) == 0
     finally:
+        await db.close()
         os.unlink(db_path)
 
 
@@ -227,5 +231,6 @@ async def test_database_warm_keys_multiple_participants():
         assert retrieved1[0]["grantee_address"] == "gonka1warm1"
         assert retrieved2[0]["grantee_address"] == "gonka1warm2"
     finally:
+        await db.close()
         os.unlink(db_path)
 